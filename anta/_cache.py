@@ -0,0 +1,89 @@
+# Copyright (c) 2023-2026 Arista Networks, Inc.
+# Use of this source code is governed by the Apache License 2.0
+# that can be found in the LICENSE file.
+"""ANTA persistent command output cache."""
+
+from __future__ import annotations
+
+import json
+import logging
+import sqlite3
+import threading
+from functools import cache
+from time import time
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+logger = logging.getLogger(__name__)
+
+# Maximum time in seconds to wait for a lock held by another ANTA process on the database
+SQLITE_BUSY_TIMEOUT = 10.0
+
+
+class SQLiteCacheStore:
+    """Persistent command output store backed by a SQLite database.
+
+    Entries are keyed by device name and command UID, and expire after their own time-to-live.
+    The database uses the write-ahead logging journal mode so that several ANTA processes can
+    read and write the same database concurrently.
+
+    The methods of this class are blocking and thread-safe. `AntaCache` calls them in a worker thread.
+
+    Attributes
+    ----------
+    path : Path
+        Path of the SQLite database.
+    """
+
+    def __init__(self, path: Path) -> None:
+        """Initialize a SQLiteCacheStore, creating the database if needed.
+
+        Parameters
+        ----------
+        path
+            Path of the SQLite database.
+        """
+        self.path = path
+        self._lock = threading.Lock()
+        path.parent.mkdir(parents=True, exist_ok=True)
+        self._connection = sqlite3.connect(path, timeout=SQLITE_BUSY_TIMEOUT, check_same_thread=False, isolation_level=None)
+        with self._lock:
+            self._connection.execute("PRAGMA journal_mode=WAL")
+            self._connection.execute(
+                "CREATE TABLE IF NOT EXISTS cache (device TEXT NOT NULL, uid TEXT NOT NULL, expires REAL NOT NULL, value TEXT NOT NULL, PRIMARY KEY (device, uid))"
+            )
+            # Purge the entries expired since the last run
+            self._connection.execute("DELETE FROM cache WHERE expires <= ?", (time(),))
+
+    def get(self, device: str, uid: str) -> Any:  # noqa: ANN401
+        """Return the stored value for a device command UID, or None if missing or expired."""
+        with self._lock:
+            row = self._connection.execute("SELECT value FROM cache WHERE device = ? AND uid = ? AND expires > ?", (device, uid, time())).fetchone()
+        return json.loads(row[0]) if row is not None else None
+
+    def set(self, device: str, uid: str, value: Any, ttl: int) -> None:  # noqa: ANN401
+        """Store the value for a device command UID for ttl seconds."""
+        with self._lock:
+            self._connection.execute(
+                "INSERT OR REPLACE INTO cache (device, uid, expires, value) VALUES (?, ?, ?, ?)", (device, uid, time() + ttl, json.dumps(value))
+            )
+
+
+@cache
+def get_cache_store(path: Path) -> SQLiteCacheStore:
+    """Return the persistent command output store of a database, shared by all the devices of the process.
+
+    Parameters
+    ----------
+    path
+        Path of the SQLite database.
+
+    Returns
+    -------
+    SQLiteCacheStore
+        The store of the database.
+    """
+    logger.debug("Opening persistent cache database %s", path)
+    return SQLiteCacheStore(path)
@@ -0,0 +1,115 @@
+# Copyright (c) 2023-2026 Arista Networks, Inc.
+# Use of this source code is governed by the Apache License 2.0
+# that can be found in the LICENSE file.
+"""ANTA device circuit breaker."""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+from time import monotonic
+from typing import TYPE_CHECKING, Literal
+
+if TYPE_CHECKING:
+    from collections.abc import Awaitable, Callable
+
+logger = logging.getLogger(__name__)
+
+
+class CircuitBreaker:
+    """Short-circuit the collection of commands on a device after repeated transport failures.
+
+    The circuit breaker has three states:
+
+    - `closed`: Commands are collected normally. The breaker opens after `threshold` consecutive transport failures.
+    - `open`: Commands fail immediately without being sent to the device. After `cooldown` seconds, the next collection
+      switches the breaker to `half-open`.
+    - `half-open`: A single probe checks whether the device is reachable again. The breaker closes if the probe succeeds,
+      otherwise it opens again for `cooldown` seconds. Collections waiting for the probe follow its outcome.
+
+    Attributes
+    ----------
+    name : str
+        Name of the device, for logging purposes.
+    threshold : int
+        Number of consecutive transport failures opening the breaker.
+    cooldown : float
+        Time in seconds before probing the device once the breaker is open.
+    failures : int
+        Current number of consecutive transport failures.
+    """
+
+    def __init__(self, name: str, threshold: int, cooldown: float) -> None:
+        """Initialize a CircuitBreaker."""
+        self.name = name
+        self.threshold = threshold
+        self.cooldown = cooldown
+        self.failures = 0
+        self._state: Literal["closed", "open", "half-open"] = "closed"
+        self._opened_at = 0.0
+        self._probe_lock = asyncio.Lock()
+
+    def __repr__(self) -> str:
+        """Return a printable representation of a CircuitBreaker."""
+        return f"CircuitBreaker({self.name!r}, state={self.state!r}, failures={self.failures})"
+
+    @property
+    def state(self) -> Literal["closed", "open", "half-open"]:
+        """Current state of the circuit breaker."""
+        return self._state
+
+    @property
+    def error_message(self) -> str:
+        """Error message of the collections short-circuited by the breaker."""
+        return f"Circuit breaker open for device {self.name} after {self.failures} consecutive transport failures"
+
+    def record_success(self) -> None:
+        """Record a successful exchange with the device, closing the breaker."""
+        if self._state != "closed":
+            logger.info("Circuit breaker closed for device %s, resuming collections", self.name)
+        self._state = "closed"
+        self.failures = 0
+
+    def record_failure(self) -> None:
+        """Record a transport failure, opening the breaker once the threshold is reached."""
+        self.failures += 1
+        if self._state == "closed" and self.failures >= self.threshold:
+            logger.warning(
+                "Circuit breaker open for device %s after %d consecutive transport failures. Remaining collections will fail for %ss",
+                self.name,
+                self.failures,
+                self.cooldown,
+            )
+            self._open()
+
+    async def allow(self, probe: Callable[[], Awaitable[bool]]) -> bool:
+        """Return True if a collection is allowed on the device.
+
+        When the breaker is open and the cooldown has elapsed, the provided probe is awaited once to decide whether the
+        breaker closes. Concurrent callers wait for the outcome of this probe.
+
+        Parameters
+        ----------
+        probe
+            Coroutine function returning True if the device is reachable.
+        """
+        if self._state == "closed":
+            return True
+        async with self._probe_lock:
+            if self._state == "closed":
+                return True
+            if monotonic() - self._opened_at < self.cooldown:
+                return False
+            self._state = "half-open"
+            logger.debug("Circuit breaker half-open for device %s, probing the device", self.name)
+            if await probe():
+                self.record_success()
+                return True
+            logger.debug("Probe failed for device %s, circuit breaker open for %ss", self.name, self.cooldown)
+            self._open()
+            return False
+
+    def _open(self) -> None:
+        """Open the breaker."""
+        self._state = "open"
+        self._opened_at = monotonic()
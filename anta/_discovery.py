@@ -0,0 +1,118 @@
+# Copyright (c) 2023-2026 Arista Networks, Inc.
+# Use of this source code is governed by the Apache License 2.0
+# that can be found in the LICENSE file.
+"""ANTA discovery sweep of the hosts with an open eAPI port."""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+from time import time
+from typing import TYPE_CHECKING, Any, ClassVar
+
+from anta._json_store import JSONFileStore
+from asynceapi.aio_portcheck import port_check_url
+
+if TYPE_CHECKING:
+    from collections.abc import Mapping
+    from pathlib import Path
+
+    from httpx import URL
+
+logger = logging.getLogger(__name__)
+
+
+class DiscoveryCache(JSONFileStore[tuple[bool, float]]):
+    """Port check results persisted in a JSON file across ANTA runs.
+
+    The file maps each eAPI URL to its port check result and expiration timestamp.
+
+    Attributes
+    ----------
+    path : Path
+        Path of the JSON file.
+    ttl : int
+        Time-to-live in seconds of the new entries with an open port.
+    negative_ttl : int
+        Time-to-live in seconds of the new entries with a closed port.
+    """
+
+    description: ClassVar[str] = "discovery cache"
+
+    def __init__(self, path: Path, ttl: int, negative_ttl: int) -> None:
+        """Initialize the cache and load the valid entries of the file."""
+        self.ttl = ttl
+        self.negative_ttl = negative_ttl
+        super().__init__(path)
+
+    def _decode(self, value: Any) -> tuple[bool, float]:  # noqa: ANN401
+        """Return the port check result and expiration timestamp of a value of the file."""
+        is_open, expires = value
+        return bool(is_open), float(expires)
+
+    def _encode(self, entry: tuple[bool, float]) -> list[bool | float]:
+        """Return the value of a port check result and its expiration timestamp in the file."""
+        return list(entry)
+
+    def _expires(self, entry: tuple[bool, float]) -> float:
+        """Return the expiration timestamp of a port check result."""
+        return entry[1]
+
+    def get(self, url: URL) -> bool | None:
+        """Return the cached port check result of an URL, or None if missing or expired."""
+        return entry[0] if (entry := self._get(str(url))) is not None else None
+
+    def set(self, url: URL, *, is_open: bool) -> None:
+        """Cache the port check result of an URL."""
+        self._set(str(url), (is_open, time() + (self.ttl if is_open else self.negative_ttl)))
+
+
+async def discover(urls: Mapping[str, URL], *, timeout: float, max_concurrency: int, cache: DiscoveryCache | None = None) -> set[str]:
+    """Check the eAPI port of hosts and return the hosts with an open port.
+
+    At most `max_concurrency` port checks run concurrently. A closed port, a refused connection or an unreachable host
+    costs at most `timeout` seconds instead of the eAPI timeout of a full device refresh.
+
+    Parameters
+    ----------
+    urls
+        eAPI URLs to check, keyed by host name.
+    timeout
+        Connect timeout in seconds of each port check.
+    max_concurrency
+        Maximum number of concurrent port checks.
+    cache
+        Discovery cache used to skip the port checks of the hosts checked by a previous run. Updated with the new results.
+
+    Returns
+    -------
+    set[str]
+        The names of the hosts with an open eAPI port.
+    """
+    discovered: set[str] = set()
+    pending: list[tuple[str, URL]] = []
+    for name, url in urls.items():
+        if cache is not None and (is_open := cache.get(url)) is not None:
+            if is_open:
+                discovered.add(name)
+        else:
+            pending.append((name, url))
+
+    if pending:
+        logger.debug("Checking the eAPI port of %d hosts", len(pending))
+        queue = iter(pending)
+
+        async def worker() -> None:
+            for name, url in queue:
+                is_open = await port_check_url(url, timeout=timeout)
+                if is_open:
+                    discovered.add(name)
+                if cache is not None:
+                    cache.set(url, is_open=is_open)
+
+        await asyncio.gather(*(worker() for _ in range(min(max_concurrency, len(pending)))))
+        if cache is not None:
+            cache.save()
+
+    logger.info("Discovered %d hosts with an open eAPI port out of %d", len(discovered), len(urls))
+    return discovered
@@ -0,0 +1,99 @@
+# Copyright (c) 2023-2026 Arista Networks, Inc.
+# Use of this source code is governed by the Apache License 2.0
+# that can be found in the LICENSE file.
+"""ANTA device facts persisted across runs to skip the device refresh."""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from time import time
+from typing import TYPE_CHECKING, Any, ClassVar
+
+from anta._json_store import JSONFileStore
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+
+@dataclass(frozen=True)
+class DeviceFacts:
+    """Facts of a device learned by a successful refresh.
+
+    Attributes
+    ----------
+    hw_model : str
+        Hardware model of the device.
+    eos_version : str | None
+        EOS version of the device, None if unknown.
+    is_online : bool
+        Whether the device was reachable when refreshed.
+    established : bool
+        Whether the device was established when refreshed.
+    last_seen : float
+        Timestamp of the refresh.
+    """
+
+    hw_model: str
+    eos_version: str | None
+    is_online: bool
+    established: bool
+    last_seen: float
+
+
+class DeviceFactsStore(JSONFileStore[DeviceFacts]):
+    """Device facts persisted in a JSON file across ANTA runs.
+
+    The file maps the facts key of each device, e.g. its host and eAPI port, to the facts learned by its last successful refresh.
+    Facts older than `ttl` seconds are stale: they are ignored when loading the file and dropped when saving it.
+
+    Attributes
+    ----------
+    path : Path
+        Path of the JSON file.
+    ttl : int
+        Time in seconds after which the facts of a device are stale.
+    """
+
+    description: ClassVar[str] = "device facts"
+
+    def __init__(self, path: Path, ttl: int) -> None:
+        """Initialize the store and load the fresh facts of the file."""
+        self.ttl = ttl
+        super().__init__(path)
+
+    def _decode(self, value: Any) -> DeviceFacts:  # noqa: ANN401
+        """Return the facts of a device from a value of the file."""
+        eos_version = value["eos_version"]
+        return DeviceFacts(
+            hw_model=str(value["hw_model"]),
+            eos_version=str(eos_version) if eos_version is not None else None,
+            is_online=bool(value["is_online"]),
+            established=bool(value["established"]),
+            last_seen=float(value["last_seen"]),
+        )
+
+    def _encode(self, entry: DeviceFacts) -> dict[str, Any]:
+        """Return the value of the facts of a device in the file."""
+        return {
+            "hw_model": entry.hw_model,
+            "eos_version": entry.eos_version,
+            "is_online": entry.is_online,
+            "established": entry.established,
+            "last_seen": entry.last_seen,
+        }
+
+    def _expires(self, entry: DeviceFacts) -> float:
+        """Return the timestamp after which the facts of a device are stale."""
+        return entry.last_seen + self.ttl
+
+    def get(self, key: str) -> DeviceFacts | None:
+        """Return the facts of a device, or None if missing or stale."""
+        return self._get(key)
+
+    def set(self, key: str, *, hw_model: str, eos_version: str | None, is_online: bool = True, established: bool = True) -> None:
+        """Store the facts of a device which has just been refreshed."""
+        self._set(key, DeviceFacts(hw_model=hw_model, eos_version=eos_version, is_online=is_online, established=established, last_seen=time()))
+
+    def invalidate(self, key: str) -> None:
+        """Mark the facts of a device as stale, the device will be refreshed by the next run."""
+        self._delete(key)
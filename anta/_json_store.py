@@ -0,0 +1,104 @@
+# Copyright (c) 2023-2026 Arista Networks, Inc.
+# Use of this source code is governed by the Apache License 2.0
+# that can be found in the LICENSE file.
+"""ANTA data persisted in JSON files across runs."""
+
+from __future__ import annotations
+
+import json
+import logging
+import os
+from abc import ABC, abstractmethod
+from time import time
+from typing import TYPE_CHECKING, Any, ClassVar, Generic, TypeVar
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+
+class JSONFileStore(ABC, Generic[T]):
+    """Expiring entries persisted in a JSON file across ANTA runs.
+
+    The file maps a key to each entry. Expired entries are ignored when loading the file and dropped when saving it.
+    The file is replaced atomically so that concurrent ANTA runs never read a partial file. When saving the file, the entries
+    set or deleted by this store are merged with the entries saved by concurrent ANTA runs, e.g. the worker processes of a sharded run.
+
+    Subclasses define how an entry is encoded in the file and when it expires.
+
+    Attributes
+    ----------
+    path : Path
+        Path of the JSON file.
+    """
+
+    description: ClassVar[str]
+    """Description of the file in the log messages."""
+
+    def __init__(self, path: Path) -> None:
+        """Initialize the store and load the valid entries of the file."""
+        self.path = path
+        self._entries: dict[str, T] = {}
+        # Entries set or deleted (None) by this store, merged with the file when saving it
+        self._changes: dict[str, T | None] = {}
+        self._load()
+
+    @abstractmethod
+    def _decode(self, value: Any) -> T:  # noqa: ANN401
+        """Return the entry of a value of the file. Raise a ValueError, TypeError, KeyError or AttributeError if the value is invalid."""
+
+    @abstractmethod
+    def _encode(self, entry: T) -> Any:  # noqa: ANN401
+        """Return the value of an entry in the file."""
+
+    @abstractmethod
+    def _expires(self, entry: T) -> float:
+        """Return the expiration timestamp of an entry."""
+
+    def _load(self) -> None:
+        """Load the valid entries of the file, ignoring a missing or invalid file."""
+        try:
+            data = json.loads(self.path.read_text(encoding="UTF-8"))
+            now = time()
+            self._entries = {key: entry for key, value in data.items() if self._expires(entry := self._decode(value)) > now}
+        except FileNotFoundError:
+            return
+        except (OSError, ValueError, TypeError, KeyError, AttributeError) as e:
+            logger.warning("Ignoring the invalid %s file %s: %s", self.description, self.path, e)
+
+    def _get(self, key: str) -> T | None:
+        """Return the entry of a key, or None if missing or expired."""
+        if (entry := self._entries.get(key)) is None or self._expires(entry) <= time():
+            return None
+        return entry
+
+    def _set(self, key: str, entry: T) -> None:
+        """Set the entry of a key."""
+        self._entries[key] = entry
+        self._changes[key] = entry
+
+    def _delete(self, key: str) -> None:
+        """Delete the entry of a key."""
+        self._entries.pop(key, None)
+        self._changes[key] = None
+
+    def save(self) -> None:
+        """Write the valid entries to the file, merging the entries set or deleted by this store with the current entries of the file."""
+        self._load()
+        for key, change in self._changes.items():
+            if change is None:
+                self._entries.pop(key, None)
+            else:
+                self._entries[key] = change
+        now = time()
+        data = {key: self._encode(entry) for key, entry in self._entries.items() if self._expires(entry) > now}
+        tmp_path = self.path.with_name(f".{self.path.name}.{os.getpid()}")
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path.write_text(json.dumps(data), encoding="UTF-8")
+            tmp_path.replace(self.path)
+        except OSError as e:
+            logger.warning("Failed to write the %s file %s: %s", self.description, self.path, e)
@@ -0,0 +1,134 @@
+# Copyright (c) 2023-2026 Arista Networks, Inc.
+# Use of this source code is governed by the Apache License 2.0
+# that can be found in the LICENSE file.
+"""ANTA adaptive concurrency limiter."""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+from collections import deque
+from time import monotonic
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from types import TracebackType
+
+logger = logging.getLogger(__name__)
+
+
+class AIMDLimiter:
+    """Limit the number of concurrent requests sent to a device with an adaptive concurrency window.
+
+    The window follows an additive-increase/multiplicative-decrease (AIMD) policy:
+
+    - Each successful request increases the window by `1 / window`, i.e. by one request per window of successful requests.
+    - Each congestion signal (timeout, HTTP 5xx error or latency above `latency_threshold`) multiplies the window by
+      `decrease_factor`. Signals from requests started before the last decrease are ignored, so that a burst of
+      failures of in-flight requests only decreases the window once.
+
+    The window is bounded by `minimum` and `maximum` and starts at `maximum`.
+
+    Example
+    -------
+    ```python
+    limiter = AIMDLimiter("device1", maximum=100)
+    async with limiter as started:
+        try:
+            await send_request()
+        except TimeoutError:
+            limiter.on_congestion(started)
+        else:
+            limiter.on_success(started)
+    ```
+
+    Attributes
+    ----------
+    name : str
+        Name of the device, for logging purposes.
+    minimum : int
+        Minimum concurrency window.
+    maximum : int
+        Maximum concurrency window.
+    decrease_factor : float
+        Factor applied to the window on congestion.
+    latency_threshold : float | None
+        Latency in seconds above which a successful request is considered as a congestion signal. None to disable.
+    """
+
+    def __init__(self, name: str, maximum: int, minimum: int = 1, decrease_factor: float = 0.5, latency_threshold: float | None = None) -> None:
+        """Initialize an AIMDLimiter."""
+        self.name = name
+        self.minimum = min(minimum, maximum)
+        self.maximum = maximum
+        self.decrease_factor = decrease_factor
+        self.latency_threshold = latency_threshold
+        self._window: float = maximum
+        self._in_flight = 0
+        self._waiters: deque[asyncio.Future[None]] = deque()
+        self._last_decrease = float("-inf")
+
+    def __repr__(self) -> str:
+        """Return a printable representation of an AIMDLimiter."""
+        return f"AIMDLimiter({self.name!r}, window={self.window}, in_flight={self.in_flight})"
+
+    @property
+    def window(self) -> int:
+        """Current concurrency window."""
+        return int(self._window)
+
+    @property
+    def in_flight(self) -> int:
+        """Number of requests currently holding a slot of the window."""
+        return self._in_flight
+
+    async def __aenter__(self) -> float:
+        """Wait for a slot in the concurrency window and return the monotonic time at which it was acquired."""
+        while self._in_flight >= self.window:
+            waiter = asyncio.get_running_loop().create_future()
+            self._waiters.append(waiter)
+            try:
+                await waiter
+            except asyncio.CancelledError:
+                if waiter in self._waiters:
+                    self._waiters.remove(waiter)
+                # Hand over the slot this waiter may have been woken up for
+                self._wake_up()
+                raise
+        self._in_flight += 1
+        return monotonic()
+
+    async def __aexit__(self, exc_type: type[BaseException] | None, exc_val: BaseException | None, exc_tb: TracebackType | None) -> None:
+        """Release the slot of the concurrency window."""
+        self._in_flight -= 1
+        self._wake_up()
+
+    def on_success(self, started: float) -> None:
+        """Record a successful request started at the provided monotonic time."""
+        latency = monotonic() - started
+        if self.latency_threshold is not None and latency > self.latency_threshold:
+            self.on_congestion(started, reason=f"latency of {latency:.2f}s")
+            return
+        if self._window < self.maximum:
+            self._window = min(self.maximum, self._window + 1 / self._window)
+            self._wake_up()
+
+    def on_congestion(self, started: float, reason: str = "congestion") -> None:
+        """Record a congestion signal for a request started at the provided monotonic time."""
+        if started <= self._last_decrease:
+            # The window has already been decreased after this request was sent
+            return
+        self._last_decrease = monotonic()
+        previous_window = self.window
+        self._window = max(self.minimum, self._window * self.decrease_factor)
+        if self.window < previous_window:
+            logger.debug("Concurrency window of %s decreased from %d to %d after %s", self.name, previous_window, self.window, reason)
+
+    def _wake_up(self) -> None:
+        """Wake up as many waiters as there are free slots in the concurrency window."""
+        free_slots = self.window - self._in_flight
+        while free_slots > 0 and self._waiters:
+            waiter = self._waiters.popleft()
+            if not waiter.done():
+                waiter.set_result(None)
+                free_slots -= 1
@@ -0,0 +1,164 @@
+# Copyright (c) 2023-2026 Arista Networks, Inc.
+# Use of this source code is governed by the Apache License 2.0
+# that can be found in the LICENSE file.
+"""ANTA command collection planner."""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from collections.abc import Sequence
+
+    from anta.device import AntaDevice
+    from anta.models import AntaCommand, AntaTest, RuntimeCommand
+
+logger = logging.getLogger(__name__)
+
+
+class DeviceCommandPlan:
+    """Plan the collection of the commands required by the tests scheduled on a device.
+
+    The plan is built before any test runs by registering the tests with `add_test()`. During the run,
+    each unique command (identified by its `uid`) is collected exactly once from the device, and its output
+    is shared with all the tests requiring it. Once all the tests requiring a command have received its output,
+    the plan releases its reference to this output.
+
+    When caching is enabled on the device, the planned commands are retained in the device cache, which drops
+    each entry as soon as the last test requiring it has received its output.
+
+    Commands with `use_cache` set to `False` are not planned and are always collected by the tests requiring them.
+
+    Attributes
+    ----------
+    device : AntaDevice
+        The device on which the commands are collected.
+    consumers : dict[str, int]
+        Mapping of the planned command UIDs to the number of test commands requiring them.
+    commands : dict[str, str]
+        Mapping of the planned command UIDs to the command string, for reporting purposes.
+    """
+
+    def __init__(self, device: AntaDevice) -> None:
+        """Initialize a DeviceCommandPlan.
+
+        Parameters
+        ----------
+        device
+            The device on which the commands are collected.
+        """
+        self.device = device
+        self.consumers: dict[str, int] = {}
+        self.commands: dict[str, str] = {}
+        self._remaining: dict[str, int] = {}
+        self._collections: dict[str, asyncio.Task[AntaCommand | RuntimeCommand]] = {}
+
+    def __repr__(self) -> str:
+        """Return a printable representation of a DeviceCommandPlan."""
+        return f"DeviceCommandPlan({self.device.name!r}, total_commands={self.total_commands}, unique_commands={self.unique_commands})"
+
+    @property
+    def total_commands(self) -> int:
+        """Total number of commands required by the planned tests."""
+        return sum(self.consumers.values())
+
+    @property
+    def unique_commands(self) -> int:
+        """Number of unique commands to collect from the device."""
+        return len(self.consumers)
+
+    @property
+    def shared_commands(self) -> dict[str, int]:
+        """Mapping of the commands required more than once to their number of consumers."""
+        return {self.commands[uid]: count for uid, count in self.consumers.items() if count > 1}
+
+    def add_test(self, test: AntaTest) -> None:
+        """Register the commands of a test in the plan and attach the plan to the test.
+
+        Tests with a result already set (e.g. input validation or rendering errors) are not planned.
+
+        Parameters
+        ----------
+        test
+            The test instance to plan.
+        """
+        if test.result.result != "unset":
+            return
+        self.add_commands(test.commands_to_collect)
+        test.command_plan = self
+
+    def add_commands(self, commands: Sequence[AntaCommand | RuntimeCommand]) -> None:
+        """Register the commands required by a test in the plan.
+
+        Parameters
+        ----------
+        commands
+            The rendered commands of the test.
+        """
+        for command in commands:
+            if not command.use_cache:
+                continue
+            uid = command.uid
+            self.consumers[uid] = self.consumers.get(uid, 0) + 1
+            self._remaining[uid] = self._remaining.get(uid, 0) + 1
+            self.commands.setdefault(uid, command.command)
+            if self.device.cache is not None:
+                self.device.cache.retain(uid)
+
+    async def collect_commands(self, commands: Sequence[AntaCommand | RuntimeCommand], *, collection_id: str | None = None) -> None:
+        """Collect multiple commands following the plan.
+
+        Planned commands are collected once and shared, other commands are collected directly from the device.
+
+        Parameters
+        ----------
+        commands
+            The commands to collect.
+        collection_id
+            An identifier used to build the eAPI request ID.
+        """
+        planned = [command for command in commands if command.use_cache and command.uid in self._remaining]
+        unplanned = [command for command in commands if not command.use_cache or command.uid not in self._remaining]
+        await asyncio.gather(
+            *(self._collect_planned(command, collection_id=collection_id) for command in planned),
+            self.device.collect_commands(unplanned, collection_id=collection_id),
+        )
+
+    async def _collect_planned(self, command: AntaCommand | RuntimeCommand, *, collection_id: str | None = None) -> None:
+        """Populate a planned command from the shared collection of its UID, starting the collection if needed."""
+        uid = command.uid
+        if (collection := self._collections.get(uid)) is None:
+            collection = asyncio.get_running_loop().create_task(self._collect_reference(command.model_copy(), collection_id=collection_id))
+            self._collections[uid] = collection
+        try:
+            # Shield the collection from the cancellation of one of its consumers
+            reference = await asyncio.shield(collection)
+        finally:
+            self._release(uid)
+        command.output = reference.output
+        command.errors = list(reference.errors)
+
+    async def _collect_reference(self, command: AntaCommand | RuntimeCommand, *, collection_id: str | None = None) -> AntaCommand | RuntimeCommand:
+        """Collect the reference command of a UID from the device."""
+        await self.device.collect(command=command, collection_id=collection_id)
+        return command
+
+    def _release(self, uid: str) -> None:
+        """Decrement the remaining consumers of a UID and drop the shared collection once all consumers are served."""
+        if self.device.cache is not None:
+            self.device.cache.release(uid)
+        if (remaining := self._remaining.get(uid, 0) - 1) > 0:
+            self._remaining[uid] = remaining
+            return
+        self._remaining.pop(uid, None)
+        self._collections.pop(uid, None)
+
+    def clear(self) -> None:
+        """Release all the collected outputs still referenced by the plan."""
+        if self.device.cache is not None:
+            for uid, remaining in self._remaining.items():
+                self.device.cache.release(uid, count=remaining)
+        self._remaining.clear()
+        self._collections.clear()
@@ -0,0 +1,94 @@
+# Copyright (c) 2023-2026 Arista Networks, Inc.
+# Use of this source code is governed by the Apache License 2.0
+# that can be found in the LICENSE file.
+"""Read-only containers for the command outputs shared between tests."""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Any, NoReturn
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+
+def _readonly_method(name: str) -> Callable[..., NoReturn]:
+    """Build a method raising a TypeError when a read-only container is mutated."""
+
+    def method(self: ReadOnlyDict | ReadOnlyList, *args: Any, **kwargs: Any) -> NoReturn:  # noqa: ARG001, ANN401
+        msg = f"Command outputs are read-only, '{type(self).__name__}.{name}' is not supported. Copy the output before modifying it."
+        raise TypeError(msg)
+
+    return method
+
+
+class ReadOnlyDict(dict[str, Any]):
+    """A dictionary raising a TypeError on any attempted mutation.
+
+    `copy()` returns a regular mutable dictionary.
+    """
+
+    __slots__ = ()
+
+    __setitem__ = _readonly_method("__setitem__")
+    __delitem__ = _readonly_method("__delitem__")
+    __ior__ = _readonly_method("__ior__")
+    clear = _readonly_method("clear")
+    pop = _readonly_method("pop")
+    popitem = _readonly_method("popitem")
+    setdefault = _readonly_method("setdefault")
+    update = _readonly_method("update")
+
+    def __reduce__(self) -> tuple[type[ReadOnlyDict], tuple[dict[str, Any]]]:
+        """Support pickling and deep copies, which would otherwise call `__setitem__`."""
+        return (self.__class__, (dict(self),))
+
+
+class ReadOnlyList(list[Any]):
+    """A list raising a TypeError on any attempted mutation.
+
+    `copy()` returns a regular mutable list.
+    """
+
+    __slots__ = ()
+
+    __setitem__ = _readonly_method("__setitem__")
+    __delitem__ = _readonly_method("__delitem__")
+    __iadd__ = _readonly_method("__iadd__")
+    __imul__ = _readonly_method("__imul__")
+    append = _readonly_method("append")
+    clear = _readonly_method("clear")
+    extend = _readonly_method("extend")
+    insert = _readonly_method("insert")
+    pop = _readonly_method("pop")
+    remove = _readonly_method("remove")
+    reverse = _readonly_method("reverse")
+    sort = _readonly_method("sort")
+
+    def __reduce__(self) -> tuple[type[ReadOnlyList], tuple[list[Any]]]:
+        """Support pickling and deep copies, which would otherwise call `extend`."""
+        return (self.__class__, (list(self),))
+
+
+def freeze(value: Any) -> Any:  # noqa: ANN401
+    """Return a read-only copy of a decoded command output.
+
+    Dictionaries and lists are recursively converted to `ReadOnlyDict` and `ReadOnlyList`.
+    Other values, e.g. text outputs, are returned as is, as well as outputs which are already read-only.
+
+    Parameters
+    ----------
+    value
+        The command output to freeze.
+
+    Returns
+    -------
+    Any
+        The read-only command output.
+    """
+    if isinstance(value, (ReadOnlyDict, ReadOnlyList)):
+        return value
+    if isinstance(value, dict):
+        return ReadOnlyDict({key: freeze(item) for key, item in value.items()})
+    if isinstance(value, list):
+        return ReadOnlyList([freeze(item) for item in value])
+    return value
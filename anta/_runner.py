@@ -5,31 +5,41 @@
 
 from __future__ import annotations
 
+import asyncio
 import logging
-from asyncio import Semaphore, gather
+import threading
+from asyncio import FIRST_COMPLETED, Task, ensure_future, wait
 from collections import defaultdict
+from contextlib import aclosing
 from dataclasses import dataclass, field
 from datetime import datetime, timedelta, timezone
 from functools import cached_property
 from inspect import getcoroutinelocals
-from typing import TYPE_CHECKING, Any
+from logging.handlers import QueueHandler
+from multiprocessing import connection, get_context, parent_process
+from typing import TYPE_CHECKING, Any, cast
 
 from pydantic import BaseModel, ConfigDict
 
 from anta import GITHUB_SUGGESTION
+from anta._planner import DeviceCommandPlan
+from anta.decorators import get_skipped_platforms
 from anta.inventory import AntaInventory
-from anta.logger import anta_log_exception
+from anta.logger import anta_log_exception, exc_to_str
 from anta.models import AntaTest
 from anta.result_manager import ResultManager
+from anta.result_manager.models import TestResult
 from anta.settings import AntaRunnerSettings
 from anta.tools import Catchtime
 
 if TYPE_CHECKING:
-    from collections.abc import Coroutine
+    from collections.abc import AsyncGenerator, Coroutine, Iterable, Iterator
+    from multiprocessing.connection import Connection
+    from multiprocessing.process import BaseProcess
 
     from anta.catalog import AntaCatalog, AntaTestDefinition
     from anta.device import AntaDevice
-    from anta.result_manager.models import TestResult
+    from anta.models import AntaCommand
 
 logger = logging.getLogger(__name__)
 
@@ -90,12 +100,20 @@ class AntaRunContext:
         The final inventory of devices selected for testing.
     selected_tests: defaultdict[AntaDevice, set[AntaTestDefinition]]
         A mapping containing the final tests to be run per device.
+    tests_skipped_at_setup: defaultdict[AntaDevice, dict[AntaTestDefinition, TestResult]]
+        A mapping of the scheduled tests skipped during the test setup phase per device, with their results.
+        These tests are not instantiated because they do not support the hardware model of their device.
     devices_filtered_at_setup: list[str]
         List of device names that were filtered during the inventory setup phase.
     devices_unreachable_at_setup: list[str]
         List of device names that were found unreachable during the inventory setup phase.
     warnings_at_setup: list[str]
         List of warnings caught during the setup phase.
+    command_plans: dict[str, DeviceCommandPlan]
+        A mapping of device names to the command collection plan built for the scheduled tests.
+    concurrency_windows: dict[str, int]
+        A mapping of device names to their concurrency window at the end of the test execution,
+        for devices supporting adaptive concurrency.
     start_time: datetime | None
         Start time of the run. None if not set yet.
     end_time: datetime | None
@@ -112,9 +130,12 @@ class AntaRunContext:
     # State populated during the run
     selected_inventory: AntaInventory = field(default_factory=AntaInventory)
     selected_tests: defaultdict[AntaDevice, set[AntaTestDefinition]] = field(default_factory=lambda: defaultdict(set))
+    tests_skipped_at_setup: defaultdict[AntaDevice, dict[AntaTestDefinition, TestResult]] = field(default_factory=lambda: defaultdict(dict))
     devices_filtered_at_setup: list[str] = field(default_factory=list)
     devices_unreachable_at_setup: list[str] = field(default_factory=list)
     warnings_at_setup: list[str] = field(default_factory=list)
+    command_plans: dict[str, DeviceCommandPlan] = field(default_factory=dict)
+    concurrency_windows: dict[str, int] = field(default_factory=dict)
     start_time: datetime | None = None
     end_time: datetime | None = None
 
@@ -125,6 +146,11 @@ class AntaRunContext:
             return self.inventory.get_inventory(tags=self.filters.tags, devices=self.filters.devices)
         return self.inventory
 
+    @property
+    def results_skipped_at_setup(self) -> list[TestResult]:
+        """Results of the scheduled tests skipped during the test setup phase."""
+        return [result for results in self.tests_skipped_at_setup.values() for result in results.values()]
+
     @property
     def total_devices_in_inventory(self) -> int:
         """Total devices in the initial inventory provided to the run."""
@@ -147,8 +173,18 @@ class AntaRunContext:
 
     @property
     def total_tests_scheduled(self) -> int:
-        """Total tests scheduled to run across all selected devices."""
-        return sum(len(tests) for tests in self.selected_tests.values())
+        """Total tests scheduled to run across all selected devices, including the tests skipped at setup."""
+        return sum(len(tests) for tests in self.selected_tests.values()) + sum(len(tests) for tests in self.tests_skipped_at_setup.values())
+
+    @property
+    def total_commands_planned(self) -> int:
+        """Total commands required by the scheduled tests across all selected devices."""
+        return sum(plan.total_commands for plan in self.command_plans.values())
+
+    @property
+    def total_unique_commands_planned(self) -> int:
+        """Total unique commands to collect across all selected devices."""
+        return sum(plan.unique_commands for plan in self.command_plans.values())
 
     @property
     def duration(self) -> timedelta | None:
@@ -158,6 +194,88 @@ class AntaRunContext:
         return None
 
 
+@dataclass
+class _TestPrototype:
+    """Prototype test instance of a test definition, created when planning the command collections.
+
+    Test definitions whose commands depend on the device (see `AntaTest.render_per_device`) get one prototype per device,
+    which only keeps the rendered commands: the test instance of the device is created lazily from these commands.
+
+    Attributes
+    ----------
+    device: AntaDevice
+        Device of the prototype instance, the first device scheduled to run the test definition.
+    test: AntaTest | None
+        Prototype instance. None if its creation failed or once it has been scheduled.
+    commands: list[AntaCommand] | None
+        Rendered commands of the test definition, wrapped by the test instances of the other devices.
+        None if the test definition could not be rendered.
+    commands_to_collect: list[AntaCommand]
+        Commands collected by the instances of the test definition, i.e. the rendered commands with the aggregated
+        commands replaced by their aggregate command. Added to the command collection plans.
+    """
+
+    device: AntaDevice
+    test: AntaTest | None
+    commands: list[AntaCommand] | None = None
+    commands_to_collect: list[AntaCommand] = field(default_factory=list)
+
+    @classmethod
+    def create(cls, device: AntaDevice, test: AntaTest | None) -> _TestPrototype:
+        """Create the prototype of a test definition from its prototype instance."""
+        if test is None or test.result.result != "unset":
+            return cls(device=device, test=test)
+        # The rendered commands wrapped by the prototype instance are never populated by the collection
+        return cls(
+            device=device,
+            test=test,
+            commands=[command.definition for command in test.instance_commands],
+            commands_to_collect=[command.definition for command in test.commands_to_collect],
+        )
+
+
+@dataclass
+class _WorkerSetup:
+    """Setup of the tests sent by a worker process of a sharded ANTA run once its tests are scheduled.
+
+    Test definitions are sent as their position in the catalog. Command plans are reduced to their `consumers` and `commands`
+    mappings, as the plans reference the devices of the worker process.
+    """
+
+    devices_selected: list[str]
+    devices_unreachable: list[str]
+    warnings: list[str]
+    selected_tests: dict[str, list[int]]
+    tests_skipped: dict[str, list[tuple[int, TestResult]]]
+    command_plans: dict[str, tuple[dict[str, int], dict[str, str]]]
+
+
+@dataclass
+class _WorkerReport:
+    """Report sent by a worker process of a sharded ANTA run once its tests are complete, with the error which stopped it if any."""
+
+    concurrency_windows: dict[str, int]
+    error: str | None = None
+
+
+class _WorkerQueue:
+    """Queue-like sending end of the pipe from a worker process of a sharded ANTA run to the main process.
+
+    The worker process sends the setup of its tests, the result of each test with the catalog position of its test definition,
+    its log records and finally its report. Messages can be sent from any thread, e.g. by a `logging.handlers.QueueHandler`.
+    """
+
+    def __init__(self, sender: Connection) -> None:
+        """Initialize the queue from the sending end of the pipe."""
+        self._sender = sender
+        self._lock = threading.Lock()
+
+    def put_nowait(self, message: object) -> None:
+        """Send a message to the main process."""
+        with self._lock:
+            self._sender.send(message)
+
+
 # pylint: disable=too-few-public-methods
 class AntaRunner:
     """Run and manage ANTA test execution.
@@ -226,10 +344,12 @@ class AntaRunner:
 
         Run workflow:
 
-        1. Build the context object for the run.
+        1. Build the context object for the run and consume the results streamed as in `run_iter()`, adding them to the manager
+           in scheduling order, i.e. in inventory order of the devices then in catalog order of the tests.
         2. Set up the selected inventory, removing filtered/unreachable devices.
         3. Set up the selected tests, removing filtered tests.
-        4. Prepare the `AntaTest` coroutines from the selected inventory and tests.
+        4. Prepare the `AntaTest` coroutines from the selected inventory and tests,
+           planning the collection of the commands required by the tests on each device.
         5. Run the test coroutines if it is not a dry run.
 
         Parameters
@@ -257,104 +377,391 @@ class AntaRunner:
         AntaRunContext
             The complete context and results of this ANTA run.
         """
-        start_time = datetime.now(tz=timezone.utc)
-        logger.info("ANTA run starting ...")
-
         ctx = AntaRunContext(
             inventory=inventory,
             catalog=catalog,
             manager=result_manager if result_manager is not None else ResultManager(),
             filters=filters if filters is not None else AntaRunFilters(),
             dry_run=dry_run,
-            start_time=start_time,
+            start_time=datetime.now(tz=timezone.utc),
             disconnect=disconnect,
         )
-        try:
-            if len(ctx.manager) > 0:
-                msg = (
-                    f"Appending new results to the provided ResultManager which already holds {len(ctx.manager)} results. "
-                    "Statistics in this run context are for the current execution only."
-                )
-                self._log_warning_msg(msg=msg, ctx=ctx)
+        if len(ctx.manager) > 0:
+            msg = (
+                f"Appending new results to the provided ResultManager which already holds {len(ctx.manager)} results. "
+                "Statistics in this run context are for the current execution only."
+            )
+            self._log_warning_msg(msg=msg, ctx=ctx)
 
-            if not ctx.catalog.tests:
-                self._log_warning_msg(msg="The list of tests is empty. Exiting ...", ctx=ctx)
-                ctx.end_time = datetime.now(tz=timezone.utc)
-                return ctx
-
-            with Catchtime(logger=logger, message="Preparing ANTA NRFU Run"):
-                # Set up inventory
-                setup_inventory_ok = await self._setup_inventory(ctx)
-                if not setup_inventory_ok:
-                    ctx.end_time = datetime.now(tz=timezone.utc)
-                    return ctx
-
-                # Set up tests
-                with Catchtime(logger=logger, message="Preparing Tests"):
-                    setup_tests_ok = self._setup_tests(ctx)
-                    if not setup_tests_ok:
-                        ctx.end_time = datetime.now(tz=timezone.utc)
-                        return ctx
-
-                # Get test coroutines
-                test_coroutines = self._get_test_coroutines(ctx)
+        # The results are streamed in completion order, they are added to the manager in a deterministic order
+        scheduled_results = [item async for item in self._run_iter(ctx)]
+        device_positions = {name: position for position, name in enumerate(ctx.inventory)}
+        scheduled_results.sort(key=lambda item: (device_positions[item[1].name], item[0]))
+        for _, result in scheduled_results:
+            ctx.manager.add(result)
 
-            self._log_run_information(ctx)
+        return ctx
 
-            if ctx.dry_run:
-                logger.info("Dry-run mode, exiting before running the tests.")
-                self._close_test_coroutines(test_coroutines, ctx)
-                ctx.end_time = datetime.now(tz=timezone.utc)
-                return ctx
+    async def run_iter(self, ctx: AntaRunContext) -> AsyncGenerator[TestResult, None]:
+        """Run ANTA and yield each test result as soon as it is final.
 
-            if AntaTest.progress is not None:
-                AntaTest.nrfu_task = AntaTest.progress.add_task("Running NRFU Tests ...", total=ctx.total_tests_scheduled)
+        This is the streaming counterpart of `run()`, which consumes the same results and adds them to the context manager
+        in scheduling order. Results are NOT added to `ctx.manager`: the caller is responsible for
+        processing them, allowing reporters or external sinks to handle results while the run continues.
+        The other attributes of the context are populated as in `run()`.
 
-            with Catchtime(logger=logger, message="Running Tests"):
-                sem = Semaphore(self._settings.max_concurrency)
+        In dry-run mode, the results of the tests that would have been executed are yielded in the `unset` state.
 
-                async def run_with_sem(test_coro: Coroutine[Any, Any, TestResult]) -> TestResult:
-                    """Wrap the test coroutine with semaphore control."""
-                    async with sem:
-                        return await test_coro
+        Closing the generator before exhaustion cancels the tests that are still running.
 
-                results = await gather(*[run_with_sem(coro) for coro in test_coroutines])
-                for res in results:
-                    ctx.manager.add(res)
+        Parameters
+        ----------
+        ctx
+            Context of the ANTA run. Its `start_time` is set when not provided and its `end_time` is set
+            once the generator is exhausted or closed.
+
+        Yields
+        ------
+        TestResult
+            The result of each test, in completion order.
+
+        Examples
+        --------
+        ```python
+        ctx = AntaRunContext(inventory=inventory, catalog=catalog, manager=ResultManager(), filters=AntaRunFilters())
+        async for result in AntaRunner().run_iter(ctx):
+            print(result.name, result.test, result.result)
+        ```
+        """
+        async with aclosing(self._run_iter(ctx)) as scheduled_results:
+            async for _, result in scheduled_results:
+                yield result
+
+    async def _run_iter(self, ctx: AntaRunContext) -> AsyncGenerator[tuple[int, TestResult], None]:
+        """Run ANTA and yield each test result as soon as it is final, with the position of its test definition in the catalog."""
+        if ctx.start_time is None:
+            ctx.start_time = datetime.now(tz=timezone.utc)
+        logger.info("ANTA run starting ...")
 
-            self._log_cache_statistics(ctx)
+        try:
+            if not ctx.catalog.tests:
+                self._log_warning_msg(msg="The list of tests is empty. Exiting ...", ctx=ctx)
+                return
+
+            run_tests = self._run_sharded if self._settings.workers > 1 and not ctx.dry_run else self._run
+            async with aclosing(run_tests(ctx)) as scheduled_results:
+                async for item in scheduled_results:
+                    yield item
 
         finally:
+            self._clear_command_plans(ctx)
             if ctx.disconnect:
                 # Disconnect from devices after tests complete
                 with Catchtime(logger=logger, message="Disconnecting from devices"):
                     await ctx.filtered_inventory.disconnect_inventory()
+            ctx.end_time = datetime.now(tz=timezone.utc)
 
-        ctx.end_time = datetime.now(tz=timezone.utc)
-        return ctx
+    async def _run_test_coroutines(self, test_coroutines: Iterable[tuple[int, Coroutine[Any, Any, TestResult]]]) -> AsyncGenerator[tuple[int, TestResult], None]:
+        """Run the test coroutines concurrently and yield their results in completion order, with the catalog position of their test definition.
 
-    async def _setup_inventory(self, ctx: AntaRunContext) -> bool:
-        """Set up the inventory for the ANTA run.
+        The test coroutines are consumed lazily: at most `max_concurrency` tests are running at any time and
+        the next ones are only created when a running test completes.
 
-        Returns True if the inventory setup was successful, otherwise False.
+        Pending tests are cancelled if the generator is closed before exhaustion.
         """
-        initial_device_names = set(ctx.inventory.keys())
+        pending: set[Task[TestResult]] = set()
+        positions: dict[Task[TestResult], int] = {}
+        try:
+            for position, coro in test_coroutines:
+                task = ensure_future(coro)
+                pending.add(task)
+                positions[task] = position
+                if len(pending) < self._settings.max_concurrency:
+                    continue
+                done, pending = await wait(pending, return_when=FIRST_COMPLETED)
+                for task in done:
+                    yield positions.pop(task), task.result()
+            while pending:
+                done, pending = await wait(pending, return_when=FIRST_COMPLETED)
+                for task in done:
+                    yield positions.pop(task), task.result()
+        finally:
+            for task in pending:
+                task.cancel()
 
-        if not initial_device_names:
-            self._log_warning_msg(msg="The initial inventory is empty. Exiting ...", ctx=ctx)
-            return False
+    async def _run(self, ctx: AntaRunContext) -> AsyncGenerator[tuple[int, TestResult], None]:
+        """Run the tests in the event loop of this process and yield their results in completion order, with the catalog position of their test definition."""
+        test_coroutines = await self._prepare_tests(ctx)
+        if test_coroutines is None:
+            return
 
-        filtered_device_names = set(ctx.filtered_inventory.keys())
-        ctx.devices_filtered_at_setup = sorted(initial_device_names - filtered_device_names)
+        self._log_run_information(ctx)
+        self._log_resource_limits(ctx)
 
-        if not filtered_device_names:
-            msg_parts = ["The inventory is empty after filtering by tags/devices."]
-            if ctx.filters.devices:
-                msg_parts.append(f"Devices filter: {', '.join(sorted(ctx.filters.devices))}.")
-            if ctx.filters.tags:
-                msg_parts.append(f"Tags filter: {', '.join(sorted(ctx.filters.tags))}.")
-            msg_parts.append("Exiting ...")
-            self._log_warning_msg(msg=" ".join(msg_parts), ctx=ctx)
+        if ctx.dry_run:
+            logger.info("Dry-run mode, exiting before running the tests.")
+            for item in self._close_test_coroutines(test_coroutines):
+                yield item
+            for item in self._get_skipped_results(ctx):
+                yield item
+            return
+
+        if AntaTest.progress is not None:
+            AntaTest.nrfu_task = AntaTest.progress.add_task("Running NRFU Tests ...", total=ctx.total_tests_scheduled)
+            if skipped_results := ctx.results_skipped_at_setup:
+                AntaTest.progress.update(AntaTest.nrfu_task, advance=len(skipped_results))
+
+        with Catchtime(logger=logger, message="Running Tests"):
+            for item in self._get_skipped_results(ctx):
+                yield item
+            async with aclosing(self._run_test_coroutines(test_coroutines)) as results:
+                async for item in results:
+                    yield item
+
+        self._log_cache_statistics(ctx)
+        self._log_concurrency_windows(ctx)
+
+    async def _prepare_tests(self, ctx: AntaRunContext) -> Iterator[tuple[int, Coroutine[Any, Any, TestResult]]] | None:
+        """Set up the inventory and the tests of the ANTA run and plan the command collections.
+
+        Returns the test coroutines, created lazily, or None if there is no test to run.
+        """
+        with Catchtime(logger=logger, message="Preparing ANTA NRFU Run"):
+            # Set up inventory
+            setup_inventory_ok = await self._setup_inventory(ctx)
+            if not setup_inventory_ok:
+                return None
+
+            # Set up tests
+            with Catchtime(logger=logger, message="Preparing Tests"):
+                setup_tests_ok = self._setup_tests(ctx)
+                if not setup_tests_ok:
+                    return None
+
+            # Plan the command collections, the test coroutines are created lazily
+            prototypes = self._plan_commands(ctx)
+            return self._get_test_coroutines(ctx, prototypes)
+
+    async def _run_sharded(self, ctx: AntaRunContext) -> AsyncGenerator[tuple[int, TestResult], None]:
+        """Run the tests in worker processes and yield their results in completion order, with the catalog position of their test definition.
+
+        The device names of the filtered inventory are sharded across the worker processes, without creating the devices of the
+        network and range sections in this process. Each worker process is spawned with its shard of the inventory and runs its
+        tests with its own event loop and `AntaRunner`: it discovers and connects to its devices, using the persisted device facts,
+        and sends back the setup of its tests, the result of each test as soon as it is final, its log records and its report.
+        """
+        with Catchtime(logger=logger, message="Preparing ANTA NRFU Run"):
+            if not self._filter_inventory(ctx):
+                return
+            shards = self._shard_inventory(ctx)
+
+        logger.info("Running the tests of %d devices in %d worker processes", len(ctx.filtered_inventory), len(shards))
+        # Worker processes are spawned as forking a process running an event loop is unsafe
+        mp_context = get_context("spawn")
+        settings = {**self._settings.model_dump(), "workers": 1}
+        log_levels = self._get_log_levels()
+        workers: dict[Connection, AntaInventory] = {}
+        processes: list[BaseProcess] = []
+        completed = False
+        try:
+            for shard in shards:
+                receiver, sender = mp_context.Pipe(duplex=False)
+                workers[receiver] = shard
+                process = mp_context.Process(target=self._run_worker, args=(shard, ctx.catalog, ctx.filters, settings, sender, log_levels), daemon=True)
+                try:
+                    process.start()
+                finally:
+                    # The worker process owns the sending end of its pipe, the pipe is closed once the worker process exits
+                    sender.close()
+                processes.append(process)
+            with Catchtime(logger=logger, message="Running Tests"):
+                async with aclosing(self._receive_worker_messages(ctx, workers)) as results:
+                    async for item in results:
+                        yield item
+            completed = True
+        finally:
+            for worker_process in processes:
+                if not completed:
+                    # The generator has been closed before exhaustion or the run failed
+                    worker_process.terminate()
+                worker_process.join()
+            for receiver in workers:
+                receiver.close()
+            ctx.devices_unreachable_at_setup.sort()
+
+    def _shard_inventory(self, ctx: AntaRunContext) -> list[AntaInventory]:
+        """Distribute the device names of the filtered inventory across the worker processes, without creating the devices."""
+        names = list(ctx.filtered_inventory)
+        count = min(self._settings.workers, len(names))
+        return [ctx.filtered_inventory.get_inventory(devices=set(names[index::count])) for index in range(count)]
+
+    @staticmethod
+    def _get_log_levels() -> dict[str, int]:
+        """Return the levels set on the loggers of this process, applied to the loggers of the worker processes."""
+        levels = {name: log.level for name, log in logging.root.manager.loggerDict.items() if isinstance(log, logging.Logger) and log.level != logging.NOTSET}
+        levels[""] = logging.getLogger().level
+        return levels
+
+    async def _receive_worker_messages(self, ctx: AntaRunContext, workers: dict[Connection, AntaInventory]) -> AsyncGenerator[tuple[int, TestResult], None]:
+        """Receive the messages of the worker processes until they exit and yield the test results.
+
+        The setup and report of each worker process are merged into the run context and its log records are handled by the loggers
+        of this process. The run information is logged once the tests of all the worker processes are scheduled.
+        """
+        loop = asyncio.get_running_loop()
+        pending = set(workers)
+        scheduling = set(workers)
+        received = 0
+        while pending:
+            ready = cast("list[Connection]", await loop.run_in_executor(None, connection.wait, list(pending)))
+            for receiver in ready:
+                try:
+                    message = receiver.recv()
+                except EOFError:
+                    # The worker process exited without sending its report
+                    message = _WorkerReport(concurrency_windows={}, error="The worker process exited unexpectedly")
+                if isinstance(message, tuple):
+                    results = [message]
+                else:
+                    if isinstance(message, _WorkerReport):
+                        # The report is the last message of the worker process
+                        pending.discard(receiver)
+                    results = self._merge_worker_message(ctx, workers[receiver], message)
+                    if receiver in scheduling and isinstance(message, (_WorkerSetup, _WorkerReport)):
+                        scheduling.discard(receiver)
+                        if not scheduling:
+                            # The tests of all the worker processes are scheduled
+                            self._log_sharded_run_information(ctx, completed=received)
+                for item in results:
+                    received += 1
+                    if AntaTest.progress is not None and AntaTest.nrfu_task is not None:
+                        AntaTest.progress.update(AntaTest.nrfu_task, advance=1)
+                    yield item
+
+    def _merge_worker_message(
+        self, ctx: AntaRunContext, shard: AntaInventory, message: _WorkerSetup | _WorkerReport | logging.LogRecord
+    ) -> list[tuple[int, TestResult]]:
+        """Merge a message of a worker process other than a test result into the run context and return the results it contains."""
+        if isinstance(message, logging.LogRecord):
+            logging.getLogger(message.name).handle(message)
+        elif isinstance(message, _WorkerSetup):
+            self._merge_worker_setup(ctx, message)
+            return [item for tests in message.tests_skipped.values() for item in tests]
+        else:
+            ctx.concurrency_windows.update(message.concurrency_windows)
+            if message.error is not None:
+                self._log_worker_failure(shard, message.error)
+        return []
+
+    def _log_sharded_run_information(self, ctx: AntaRunContext, completed: int) -> None:
+        """Log the ANTA run information once the tests of all the worker processes are scheduled and start the progress of the tests."""
+        if ctx.total_tests_scheduled > 0:
+            self._log_run_information(ctx)
+        if AntaTest.progress is not None:
+            AntaTest.nrfu_task = AntaTest.progress.add_task("Running NRFU Tests ...", total=ctx.total_tests_scheduled, completed=completed)
+
+    def _log_worker_failure(self, shard: AntaInventory, error: str) -> None:
+        """Log the failure of the worker process running the tests of a shard of the inventory."""
+        logger.error("Worker process failed to run the tests on devices: %s\n%s", ", ".join(sorted(shard)), error)
+
+    def _merge_worker_setup(self, ctx: AntaRunContext, setup: _WorkerSetup) -> None:
+        """Merge the setup of the tests of a worker process into the run context.
+
+        Only the devices selected for testing are created in this process, as the selected tests and command plans of the run context reference them.
+        """
+        ctx.devices_unreachable_at_setup.extend(setup.devices_unreachable)
+        ctx.warnings_at_setup.extend(msg for msg in setup.warnings if msg not in ctx.warnings_at_setup)
+        for name in setup.devices_selected:
+            ctx.selected_inventory.add_device(ctx.filtered_inventory[name])
+        for name, positions in setup.selected_tests.items():
+            ctx.selected_tests[ctx.selected_inventory[name]].update(ctx.catalog.tests[position] for position in positions)
+        for name, skipped in setup.tests_skipped.items():
+            ctx.tests_skipped_at_setup[ctx.selected_inventory[name]].update((ctx.catalog.tests[position], result) for position, result in skipped)
+        for name, (consumers, commands) in setup.command_plans.items():
+            plan = DeviceCommandPlan(ctx.selected_inventory[name])
+            plan.consumers = consumers
+            plan.commands = commands
+            ctx.command_plans[name] = plan
+
+    @staticmethod
+    def _run_worker(
+        shard: AntaInventory, catalog: AntaCatalog, filters: AntaRunFilters, settings: dict[str, Any], sender: Connection, log_levels: dict[str, int]
+    ) -> None:
+        """Run the tests of a shard of the inventory in a worker process of a sharded ANTA run.
+
+        Parameters
+        ----------
+        shard
+            Shard of the filtered inventory assigned to the worker process.
+        catalog
+            Catalog of tests to run.
+        filters
+            Filters of the ANTA run.
+        settings
+            Settings of the runner of the worker process.
+        sender
+            Sending end of the pipe to the main process.
+        log_levels
+            Levels of the loggers of the main process.
+        """
+        queue = _WorkerQueue(sender)
+        if parent_process() is not None:
+            # The log records of the worker process are handled by the main process
+            root = logging.getLogger()
+            # The handler only sends the records with `put_nowait()`
+            root.handlers = [QueueHandler(queue)]  # type: ignore[arg-type]
+            for name, level in log_levels.items():
+                logging.getLogger(name).setLevel(level)
+
+        runner = AntaRunner(settings=AntaRunnerSettings(**settings))
+        ctx = AntaRunContext(inventory=shard, catalog=catalog, manager=ResultManager(), filters=filters, disconnect=True)
+        error = None
+        try:
+            asyncio.run(runner._run_shard(ctx, queue))
+        except Exception as exc:  # noqa: BLE001
+            # The error is logged by the main process
+            error = exc_to_str(exc)
+        queue.put_nowait(_WorkerReport(concurrency_windows=ctx.concurrency_windows, error=error))
+        sender.close()
+
+    async def _run_shard(self, ctx: AntaRunContext, queue: _WorkerQueue) -> None:
+        """Run the tests of a shard of the inventory in a worker process and send the setup of the tests and their results to the main process."""
+        try:
+            test_coroutines = await self._prepare_tests(ctx)
+            if test_coroutines is not None:
+                self._log_resource_limits(ctx)
+            queue.put_nowait(self._get_worker_setup(ctx))
+            if test_coroutines is None:
+                return
+            async with aclosing(self._run_test_coroutines(test_coroutines)) as results:
+                async for item in results:
+                    queue.put_nowait(item)
+            self._log_cache_statistics(ctx)
+            self._log_concurrency_windows(ctx)
+        finally:
+            self._clear_command_plans(ctx)
+            await ctx.filtered_inventory.disconnect_inventory()
+
+    def _get_worker_setup(self, ctx: AntaRunContext) -> _WorkerSetup:
+        """Return the setup of the tests of a worker process, sent to the main process."""
+        positions = self._get_catalog_positions(ctx)
+        return _WorkerSetup(
+            devices_selected=list(ctx.selected_inventory),
+            devices_unreachable=ctx.devices_unreachable_at_setup,
+            warnings=ctx.warnings_at_setup,
+            selected_tests={device.name: [positions[test_def] for test_def in tests] for device, tests in ctx.selected_tests.items()},
+            tests_skipped={
+                device.name: [(positions[test_def], result) for test_def, result in tests.items()] for device, tests in ctx.tests_skipped_at_setup.items()
+            },
+            command_plans={name: (plan.consumers, plan.commands) for name, plan in ctx.command_plans.items()},
+        )
+
+    async def _setup_inventory(self, ctx: AntaRunContext) -> bool:
+        """Set up the inventory for the ANTA run.
+
+        Returns True if the inventory setup was successful, otherwise False.
+        """
+        if not self._filter_inventory(ctx):
             return False
 
         # In dry-run mode, set the selected inventory to the filtered inventory
@@ -369,7 +776,7 @@ class AntaRunner:
         # Remove devices that are unreachable if required
         ctx.selected_inventory = ctx.filtered_inventory.get_inventory(established_only=True) if ctx.filters.established_only else ctx.filtered_inventory
         selected_device_names = set(ctx.selected_inventory.keys())
-        ctx.devices_unreachable_at_setup = sorted(filtered_device_names - selected_device_names)
+        ctx.devices_unreachable_at_setup = sorted(set(ctx.filtered_inventory.keys()) - selected_device_names)
 
         if not selected_device_names:
             msg = "No reachable devices found for testing after connectivity checks. Exiting ..."
@@ -378,6 +785,32 @@ class AntaRunner:
 
         return True
 
+    def _filter_inventory(self, ctx: AntaRunContext) -> bool:
+        """Filter the inventory of the ANTA run by devices/tags.
+
+        Returns True if devices remain after filtering, otherwise False.
+        """
+        initial_device_names = set(ctx.inventory.keys())
+
+        if not initial_device_names:
+            self._log_warning_msg(msg="The initial inventory is empty. Exiting ...", ctx=ctx)
+            return False
+
+        filtered_device_names = set(ctx.filtered_inventory.keys())
+        ctx.devices_filtered_at_setup = sorted(initial_device_names - filtered_device_names)
+
+        if not filtered_device_names:
+            msg_parts = ["The inventory is empty after filtering by tags/devices."]
+            if ctx.filters.devices:
+                msg_parts.append(f"Devices filter: {', '.join(sorted(ctx.filters.devices))}.")
+            if ctx.filters.tags:
+                msg_parts.append(f"Tags filter: {', '.join(sorted(ctx.filters.tags))}.")
+            msg_parts.append("Exiting ...")
+            self._log_warning_msg(msg=" ".join(msg_parts), ctx=ctx)
+            return False
+
+        return True
+
     def _setup_tests(self, ctx: AntaRunContext) -> bool:
         """Set up tests for the ANTA run.
 
@@ -402,6 +835,8 @@ class AntaRunner:
                 # Then add the tests with matching tags from device tags
                 ctx.selected_tests[device].update(ctx.catalog.get_tests_by_tags(device.tags))
 
+        self._skip_unsupported_platforms(ctx)
+
         if ctx.total_tests_scheduled == 0:
             msg_parts = ["No tests scheduled to run after filtering by tags/tests."]
             if ctx.filters.tests:
@@ -414,41 +849,172 @@ class AntaRunner:
 
         return True
 
-    def _get_test_coroutines(self, ctx: AntaRunContext) -> list[Coroutine[Any, Any, TestResult]]:
-        """Get the test coroutines for the ANTA run."""
-        coros = []
+    def _skip_unsupported_platforms(self, ctx: AntaRunContext) -> None:
+        """Skip the selected tests which do not support the hardware model of their device, without creating the test instances.
+
+        The hardware models are read from the `skip_on_platforms` decorator of the test classes. The skipped tests are moved
+        from `selected_tests` to `tests_skipped_at_setup` with their results.
+        """
+        skipped_platforms: dict[type[AntaTest], frozenset[str]] = {}
+        for device, test_definitions in ctx.selected_tests.items():
+            if device.hw_model is None:
+                continue
+            skipped_tests = {}
+            for test_def in test_definitions:
+                if (platforms := skipped_platforms.get(test_def.test)) is None:
+                    platforms = skipped_platforms[test_def.test] = get_skipped_platforms(test_def.test)
+                if device.hw_model in platforms:
+                    skipped_tests[test_def] = self._create_skipped_result(device, test_def)
+            if skipped_tests:
+                test_definitions.difference_update(skipped_tests)
+                ctx.tests_skipped_at_setup[device].update(skipped_tests)
+        if skipped_count := sum(len(tests) for tests in ctx.tests_skipped_at_setup.values()):
+            logger.debug("%d tests skipped at setup on unsupported hardware models", skipped_count)
+
+    def _get_skipped_results(self, ctx: AntaRunContext) -> Iterator[tuple[int, TestResult]]:
+        """Yield the results of the tests skipped at setup, with the catalog position of their test definition."""
+        positions = self._get_catalog_positions(ctx)
+        for tests in ctx.tests_skipped_at_setup.values():
+            for test_def, result in tests.items():
+                yield positions[test_def], result
+
+    @staticmethod
+    def _get_catalog_positions(ctx: AntaRunContext) -> dict[AntaTestDefinition, int]:
+        """Return the position of each test definition in the catalog, used to add the results of `run()` in catalog order."""
+        positions: dict[AntaTestDefinition, int] = {}
+        for position, test_def in enumerate(ctx.catalog.tests):
+            positions.setdefault(test_def, position)
+        return positions
+
+    @staticmethod
+    def _create_skipped_result(device: AntaDevice, test_def: AntaTestDefinition) -> TestResult:
+        """Create the result of a test skipped on the hardware model of a device, as the `skip_on_platforms` decorator would."""
+        result = TestResult(name=device.name, test=test_def.test.name, categories=test_def.test.categories, description=test_def.test.description)
+        if res_ow := test_def.inputs.result_overwrite:
+            if res_ow.categories:
+                result.categories = res_ow.categories
+            if res_ow.description:
+                result.description = res_ow.description
+            if res_ow.custom_field:
+                result.custom_field = res_ow.custom_field
+        result.is_skipped(f"{test_def.test.__name__} test is not supported on {device.hw_model}")
+        return result
+
+    @staticmethod
+    def _prototype_key(device: AntaDevice, test_def: AntaTestDefinition) -> tuple[AntaTestDefinition, str | None]:
+        """Return the key of the prototype of a test definition for a device, including the device if its commands depend on it."""
+        return (test_def, device.name if test_def.test.render_per_device else None)
+
+    def _plan_commands(self, ctx: AntaRunContext) -> dict[tuple[AntaTestDefinition, str | None], _TestPrototype]:
+        """Build the command collection plan of each selected device.
+
+        Each unique command is collected once during the run and its output is shared with all the tests requiring it.
+
+        The commands of a test definition are rendered once from a prototype instance created on the first device
+        scheduled to run it, as rendered commands only depend on the test inputs. The prototype instance is then used
+        as the test instance for this device, and the test instances of the other devices wrap the same rendered commands.
+        The commands of the tests with `render_per_device` set are rendered from a prototype instance per device, which is
+        released once rendered so that the test instances are still created lazily.
+
+        Returns
+        -------
+        dict[tuple[AntaTestDefinition, str | None], _TestPrototype]
+            The prototypes, keyed by test definition and device name, or None if the prototype is shared by all the devices.
+        """
+        prototypes: dict[tuple[AntaTestDefinition, str | None], _TestPrototype] = {}
         for device, test_definitions in ctx.selected_tests.items():
+            plan = ctx.command_plans.setdefault(device.name, DeviceCommandPlan(device))
             for test_def in test_definitions:
+                if (prototype := prototypes.get(key := self._prototype_key(device, test_def))) is None:
+                    prototype = prototypes[key] = _TestPrototype.create(device, self._create_test(device, test_def))
+                    if key[1] is not None and prototype.commands is not None:
+                        # The test instance of the device is created from the rendered commands when its coroutine is requested
+                        prototype.test = None
+                plan.add_commands(prototype.commands_to_collect)
+        return prototypes
+
+    def _get_test_coroutines(
+        self, ctx: AntaRunContext, prototypes: dict[tuple[AntaTestDefinition, str | None], _TestPrototype] | None = None
+    ) -> Iterator[tuple[int, Coroutine[Any, Any, TestResult]]]:
+        """Lazily create the test instances of the ANTA run and yield their coroutines, with the catalog position of their test definition.
+
+        Test instances are created when the next coroutine is requested, attached to the command collection plan of their device.
+
+        Parameters
+        ----------
+        ctx
+            Context of the ANTA run.
+        prototypes
+            Prototypes returned by `_plan_commands()`. If None, the command collection plans are built first.
+        """
+        if prototypes is None:
+            prototypes = self._plan_commands(ctx)
+        positions = self._get_catalog_positions(ctx)
+        for device, test_definitions in ctx.selected_tests.items():
+            plan = ctx.command_plans[device.name]
+            for test_def in test_definitions:
+                prototype = prototypes.get(self._prototype_key(device, test_def))
+                if prototype is not None and prototype.device is device and (prototype.test is not None or prototype.commands is None):
+                    # Release the prototype instance, its creation error has already been logged if any
+                    test, prototype.test = prototype.test, None
+                    if test is None:
+                        continue
+                elif (test := self._create_test(device, test_def, prototype.commands if prototype is not None else None)) is None:
+                    continue
+                if test.result.result == "unset":
+                    test.command_plan = plan
                 try:
-                    coros.append(test_def.test(device=device, inputs=test_def.inputs).test())
-                except Exception as exc:  # noqa: BLE001, PERF203
+                    coro = test.test()
+                except Exception as exc:  # noqa: BLE001
                     # An AntaTest instance is potentially user-defined code.
                     # We need to catch everything and exit gracefully with an error message.
-                    msg = "\n".join(
-                        [
-                            f"There is an error when creating test {test_def.test.__module__}.{test_def.test.__name__}.",
-                            f"If this is not a custom test implementation: {GITHUB_SUGGESTION}",
-                        ],
-                    )
-                    anta_log_exception(exc, msg, logger)
-        return coros
-
-    def _close_test_coroutines(self, coros: list[Coroutine[Any, Any, TestResult]], ctx: AntaRunContext) -> None:
-        """Close the test coroutines. Used in dry-run."""
-        for coro in coros:
+                    self._log_test_creation_error(exc, test_def)
+                    continue
+                yield positions[test_def], coro
+
+    def _create_test(self, device: AntaDevice, test_def: AntaTestDefinition, commands: list[AntaCommand] | None = None) -> AntaTest | None:
+        """Create the test instance of a test definition for a device, optionally from its rendered commands. Returns None if the creation failed."""
+        try:
+            return test_def.test(device=device, inputs=test_def.inputs, commands=commands)
+        except Exception as exc:  # noqa: BLE001
+            # An AntaTest instance is potentially user-defined code.
+            # We need to catch everything and exit gracefully with an error message.
+            self._log_test_creation_error(exc, test_def)
+            return None
+
+    def _log_test_creation_error(self, exc: Exception, test_def: AntaTestDefinition) -> None:
+        """Log an exception raised when creating a test."""
+        msg = "\n".join(
+            [
+                f"There is an error when creating test {test_def.test.__module__}.{test_def.test.__name__}.",
+                f"If this is not a custom test implementation: {GITHUB_SUGGESTION}",
+            ],
+        )
+        anta_log_exception(exc, msg, logger)
+
+    def _clear_command_plans(self, ctx: AntaRunContext) -> None:
+        """Release the command outputs still referenced by the command plans of the run."""
+        for plan in ctx.command_plans.values():
+            plan.clear()
+
+    def _close_test_coroutines(self, coros: Iterable[tuple[int, Coroutine[Any, Any, TestResult]]]) -> list[tuple[int, TestResult]]:
+        """Close the test coroutines and return the results of their AntaTest instances, with their catalog position. Used in dry-run."""
+        results = []
+        for position, coro in coros:
             # Get the AntaTest instance from the coroutine locals, can be in `args` when decorated
             coro_locals = getcoroutinelocals(coro)
             test = coro_locals.get("self") or coro_locals.get("args")
             if isinstance(test, AntaTest):
-                ctx.manager.add(test.result)
+                results.append((position, test.result))
             elif test and isinstance(test, tuple) and isinstance(test[0], AntaTest):
-                ctx.manager.add(test[0].result)
+                results.append((position, test[0].result))
             else:
                 logger.error("Coroutine %s does not have an AntaTest instance.", coro)
             coro.close()
+        return results
 
     def _log_run_information(self, ctx: AntaRunContext) -> None:
-        """Log ANTA run information and potential resource limit warnings."""
+        """Log ANTA run information."""
         logger.info("Initial inventory contains %s devices", ctx.total_devices_in_inventory)
 
         if ctx.total_devices_filtered_by_tags > 0:
@@ -461,8 +1027,30 @@ class AntaRunner:
 
         logger.info("%d devices selected for testing", ctx.total_devices_selected_for_testing)
         logger.info("%d total tests scheduled across all selected devices", ctx.total_tests_scheduled)
+        logger.info(
+            "%d unique commands to collect for %d commands required by the scheduled tests",
+            ctx.total_unique_commands_planned,
+            ctx.total_commands_planned,
+        )
 
-        # Log debugs for runner settings
+        # Command plan details are only logged at INFO level in dry-run mode
+        log_level = logging.INFO if ctx.dry_run else logging.DEBUG
+        for device_name, plan in sorted(ctx.command_plans.items()):
+            shared_commands = plan.shared_commands
+            logger.log(
+                log_level,
+                "Command plan for '%s': %d unique commands (%d shared, %d required by a single test) for %d commands",
+                device_name,
+                plan.unique_commands,
+                len(shared_commands),
+                plan.unique_commands - len(shared_commands),
+                plan.total_commands,
+            )
+            for command, count in sorted(shared_commands.items()):
+                logger.log(log_level, "Command '%s' shared by %d tests on '%s'", command, count, device_name)
+
+    def _log_resource_limits(self, ctx: AntaRunContext) -> None:
+        """Log the runner settings and potential resource limit warnings of the ANTA run in this process."""
         logger.debug("Max concurrent tests configured: %d", self._settings.max_concurrency)
         if (potential_connections := ctx.selected_inventory.max_potential_connections) is not None:
             logger.debug("Potential device connections estimated for this run: %d", potential_connections)
@@ -495,6 +1083,13 @@ class AntaRunner:
             else:
                 logger.debug("Caching is not enabled on %s", device.name)
 
+    def _log_concurrency_windows(self, ctx: AntaRunContext) -> None:
+        """Store and log the concurrency window of each device in the inventory at the end of the test execution."""
+        for device in ctx.selected_inventory.devices:
+            if (window := device.concurrency_window) is not None:
+                ctx.concurrency_windows[device.name] = window
+                logger.debug("Concurrency window for '%s': %d concurrent requests", device.name, window)
+
     def _log_warning_msg(self, msg: str, ctx: AntaRunContext) -> None:
         """Log the provided message at WARNING level and add it to the context warnings_at_setup list."""
         logger.warning(msg)
@@ -443,6 +443,9 @@ def _print_commands(tests: list[type[AntaTest]]) -> None:
                     console.print(f"    - {command.command}")
                 else:  # isinstance(command, AntaTemplate):
                     console.print(f"    - {command.template}")
+                    for full_command in (command.fallback, command.aggregate):
+                        if full_command is not None:
+                            console.print(f"    - {full_command.command}")
 
 
 def _get_unique_commands(tests: list[type[AntaTest]]) -> set[str]:
@@ -466,6 +469,7 @@ def _get_unique_commands(tests: list[type[AntaTest]]) -> set[str]:
                 result.add(command.command)
             else:  # isinstance(command, AntaTemplate):
                 result.add(command.template)
+                result.update(full_command.command for full_command in (command.fallback, command.aggregate) if full_command is not None)
 
     return result
 
@@ -17,6 +17,9 @@ P = ParamSpec("P")
 T_TestAsyncFunc = Callable[P, Coroutine[Any, Any, TestResult]]
 T_TestAsyncDecorator = Callable[[T_TestAsyncFunc], T_TestAsyncFunc]
 
+# Attribute of the test functions decorated with `skip_on_platforms` storing the skipped hardware models
+_SKIPPED_PLATFORMS_ATTR = "_anta_skipped_platforms"
+
 
 # TODO: Remove this decorator in ANTA v2.0.0 in favor of deprecated_test_class
 def deprecated_test(new_tests: list[str] | None = None) -> T_TestAsyncDecorator:
@@ -183,6 +186,26 @@ def skip_on_platforms(platforms: list[str]) -> T_TestAsyncDecorator:
 
             return await function(*args, **kwargs)
 
+        # Read by the ANTA runner to skip the test before creating its instances, see `get_skipped_platforms()`
+        setattr(wrapper, _SKIPPED_PLATFORMS_ATTR, frozenset(platforms))
         return wrapper
 
     return decorator
+
+
+def get_skipped_platforms(test: type[AntaTest]) -> frozenset[str]:
+    """Return the hardware models on which a test is skipped by the `skip_on_platforms` decorator.
+
+    The ANTA runner uses it to skip the test on these hardware models without creating the test instances.
+
+    Parameters
+    ----------
+    test
+        The AntaTest subclass.
+
+    Returns
+    -------
+    frozenset[str]
+        The hardware models on which the test is skipped. Empty if the test is not decorated with `skip_on_platforms`.
+    """
+    return getattr(test.test, _SKIPPED_PLATFORMS_ATTR, frozenset())
@@ -7,28 +7,39 @@ from __future__ import annotations
 
 import asyncio
 import logging
+import sqlite3
 from abc import ABC, abstractmethod
 from collections import OrderedDict, defaultdict
+from functools import cache, partial
+from socket import getservbyname
 from time import monotonic
 from typing import TYPE_CHECKING, Any, Literal
 
 import asyncssh
 import httpcore
+import httpx
 from asyncssh import SSHClientConnection, SSHClientConnectionOptions
-from httpx import ConnectError, HTTPError, TimeoutException
+from httpx import ConnectError, ConnectTimeout, HTTPError, HTTPStatusError, PoolTimeout, TimeoutException
 
 import asynceapi
 from anta import __DEBUG__
+from anta._cache import get_cache_store
+from anta._circuit_breaker import CircuitBreaker
+from anta._limiter import AIMDLimiter
+from anta._readonly import freeze
 from anta.logger import anta_log_exception, exc_to_str
 from anta.models import AntaCommand
-from anta.settings import get_httpx_settings
+from anta.settings import DEFAULT_DEVICE_MAX_CONCURRENCY, get_cache_settings, get_device_settings, get_httpx_settings
 from asynceapi._models import EAPIClientConnectionOptions
 from asynceapi._types import EapiComplexCommand
 
 if TYPE_CHECKING:
-    from collections.abc import Iterator
+    import ssl
+    from collections.abc import Iterator, Sequence
     from pathlib import Path
 
+    from anta._cache import SQLiteCacheStore
+    from anta.models import RuntimeCommand
     from asynceapi._types import EapiSimpleCommand
 
 logger = logging.getLogger(__name__)
@@ -37,32 +48,63 @@ logger = logging.getLogger(__name__)
 # https://github.com/pyca/cryptography/issues/7236#issuecomment-1131908472
 CLIENT_KEYS = asyncssh.public_key.load_default_keypairs()
 
-# Limit concurrency to 100 requests (HTTPX default) to avoid high-concurrency performance issues
-# See: https://github.com/encode/httpx/issues/3215
-MAX_CONCURRENT_REQUESTS = 100
+# Kept for backward compatibility, the concurrency of eAPI requests is now adaptive. See ANTA_DEVICE_MAX_CONCURRENCY.
+MAX_CONCURRENT_REQUESTS = DEFAULT_DEVICE_MAX_CONCURRENCY
+
+
+@cache
+def get_ssl_context(*, trust_env: bool) -> ssl.SSLContext:
+    """Return the SSL context of the eAPI clients, shared by all the AsyncEOSDevice instances of the process.
+
+    Creating an SSL context is expensive, sharing it keeps the creation of the eAPI clients cheap for large inventories.
+    The eAPI clients do not verify the TLS certificates of the devices.
+
+    Parameters
+    ----------
+    trust_env
+        Whether the SSL context is configured from the environment variables, e.g. SSLKEYLOGFILE.
+
+    Returns
+    -------
+    ssl.SSLContext
+        The shared SSL context.
+    """
+    return httpx.create_ssl_context(verify=False, trust_env=trust_env)
 
 
 class AntaCache:
     """Class to be used as cache.
 
+    By default, entries are evicted following a LRU policy once `max_size` is reached and expire after `ttl` seconds.
+
+    Entries can also be reference-counted: `retain()` registers pending consumers for a key and `release()`
+    unregisters them. A retained entry is exempted from LRU eviction and TTL expiration, and is dropped from
+    the cache as soon as its last consumer releases it. This is used by the runner command collection plan
+    to keep the memory footprint of a run proportional to the in-flight work.
+
+    When a persistent `store` is provided, entries missing from memory are looked up in the store and new entries are
+    also written to the store, so that they can be reused by subsequent ANTA runs until their time-to-live expires.
+
     Example
     -------
 
     ```python
     # Create cache
     cache = AntaCache("device1")
-    with cache.locks[key]:
-        command_output = cache.get(key)
+    command_output = await cache.get(key)
     ```
     """
 
-    def __init__(self, device: str, max_size: int = 128, ttl: int = 60) -> None:
+    def __init__(self, device: str, max_size: int = 128, ttl: int = 60, store: SQLiteCacheStore | None = None) -> None:
         """Initialize the cache."""
         self.device = device
         self.cache: OrderedDict[str, Any] = OrderedDict()
+        # Not used by ANTA anymore, concurrent collections are coalesced by AntaDevice. Kept for backward compatibility.
         self.locks: defaultdict[str, asyncio.Lock] = defaultdict(asyncio.Lock)
         self.max_size = max_size
         self.ttl = ttl
+        self.store = store
+        self.refcounts: dict[str, int] = {}
 
         # Stats
         self.stats: dict[str, int] = {}
@@ -72,34 +114,103 @@ class AntaCache:
         """Initialize the stats."""
         self.stats["hits"] = 0
         self.stats["total"] = 0
+        self.stats["persistent_hits"] = 0
 
     async def get(self, key: str) -> Any:  # noqa: ANN401
         """Return the cached entry for key."""
         self.stats["total"] += 1
         if key in self.cache:
             timestamp, value = self.cache[key]
-            if monotonic() - timestamp < self.ttl:
+            if key in self.refcounts or monotonic() - timestamp < self.ttl:
                 # checking the value is still valid
                 self.cache.move_to_end(key)
                 self.stats["hits"] += 1
                 return value
             # Time expired
             del self.cache[key]
-            del self.locks[key]
+            self.locks.pop(key, None)
+        if self.store is not None and (value := await self._store_get(key)) is not None:
+            self.cache[key] = monotonic(), value
+            self.stats["hits"] += 1
+            self.stats["persistent_hits"] += 1
+            return value
         return None
 
-    async def set(self, key: str, value: Any) -> bool:  # noqa: ANN401
-        """Set the cached entry for key to value."""
+    async def set(self, key: str, value: Any, ttl: int | None = None) -> bool:  # noqa: ANN401
+        """Set the cached entry for key to value.
+
+        The optional ttl overrides the cache time-to-live of the entry in the persistent store.
+        """
+        if self.store is not None and value is not None:
+            await self._store_set(key, value, ttl if ttl is not None else self.ttl)
         timestamp = monotonic()
         if len(self.cache) > self.max_size:
-            self.cache.popitem(last=False)
+            # Evict the least recently used entry which is not retained
+            lru_key = next((k for k in self.cache if k not in self.refcounts), None)
+            if lru_key is not None:
+                del self.cache[lru_key]
         self.cache[key] = timestamp, value
         return True
 
+    async def _store_get(self, key: str) -> Any:  # noqa: ANN401
+        """Return the entry for key from the persistent store, None if missing or if the store is not available."""
+        if self.store is None:
+            return None
+        try:
+            return await asyncio.to_thread(self.store.get, self.device, key)
+        except sqlite3.Error as e:
+            logger.warning("Failed to read the persistent cache of %s: %s", self.device, exc_to_str(e))
+            return None
+
+    async def _store_set(self, key: str, value: Any, ttl: int) -> None:  # noqa: ANN401
+        """Write the entry for key to the persistent store."""
+        if self.store is None:
+            return
+        try:
+            await asyncio.to_thread(self.store.set, self.device, key, value, ttl)
+        except sqlite3.Error as e:
+            logger.warning("Failed to write the persistent cache of %s: %s", self.device, exc_to_str(e))
+
+    def retain(self, key: str, count: int = 1) -> None:
+        """Register pending consumers for key.
+
+        The entry for key is exempted from LRU eviction and TTL expiration until all its consumers release it.
+
+        Parameters
+        ----------
+        key
+            The cache key.
+        count
+            Number of consumers to register.
+        """
+        self.refcounts[key] = self.refcounts.get(key, 0) + count
+
+    def release(self, key: str, count: int = 1) -> None:
+        """Unregister consumers for key, dropping the entry once its last consumer released it.
+
+        Releasing a key that is not retained is a no-op.
+
+        Parameters
+        ----------
+        key
+            The cache key.
+        count
+            Number of consumers to unregister.
+        """
+        if key not in self.refcounts:
+            return
+        if (remaining := self.refcounts[key] - count) > 0:
+            self.refcounts[key] = remaining
+            return
+        del self.refcounts[key]
+        self.cache.pop(key, None)
+        self.locks.pop(key, None)
+
     def clear(self) -> None:
         """Empty the cache."""
         logger.debug("Clearing cache for device %s", self.device)
         self.cache = OrderedDict()
+        self.refcounts = {}
         self._init_stats()
 
 
@@ -119,6 +230,8 @@ class AntaDevice(ABC):
         True if remote command execution succeeds.
     hw_model : str | None
         Hardware model of the device.
+    eos_version : str | None
+        EOS version of the device, None if unknown.
     tags : set[str]
         Tags for this device.
     cache : AntaCache | None
@@ -126,6 +239,9 @@ class AntaDevice(ABC):
     cache_locks : defaultdict[str, asyncio.Lock] | None
         Dictionary mapping keys to asyncio locks to guarantee exclusive access to the cache if not disabled.
         Deprecated, will be removed in ANTA v2.0.0, use self.cache.locks instead.
+    circuit_breaker : CircuitBreaker | None
+        Circuit breaker short-circuiting the collections after repeated transport failures (None if disabled).
+        Implementations of `_collect()` feed it with `record_success()` and `record_failure()`.
     max_connections : int | None
         For informational/logging purposes only. Can be used by the runner to verify that
         the total potential connections of a run do not exceed the system file descriptor limit.
@@ -147,6 +263,7 @@ class AntaDevice(ABC):
         """
         self.name: str = name
         self.hw_model: str | None = None
+        self.eos_version: str | None = None
         self.tags: set[str] = tags if tags is not None else set()
         # A device always has its own name as tag
         self.tags.add(self.name)
@@ -160,6 +277,16 @@ class AntaDevice(ABC):
         if not disable_cache:
             self._init_cache()
 
+        device_settings = get_device_settings()
+        self.circuit_breaker: CircuitBreaker | None = (
+            CircuitBreaker(self.name, threshold=device_settings.circuit_breaker_threshold, cooldown=device_settings.circuit_breaker_cooldown)
+            if device_settings.circuit_breaker_threshold > 0
+            else None
+        )
+        self.readonly_outputs: bool = device_settings.readonly_outputs
+        # In-flight collections per command UID, removed once complete
+        self._flights: dict[str, asyncio.Future[AntaCommand | RuntimeCommand | None]] = {}
+
     @property
     @abstractmethod
     def _keys(self) -> tuple[Any, ...]:
@@ -170,6 +297,16 @@ class AntaDevice(ABC):
         """Maximum number of concurrent connections allowed by the device. Can be overridden by subclasses, returns None if not available."""
         return None
 
+    @property
+    def concurrency_window(self) -> int | None:
+        """Current number of concurrent requests allowed to the device. Can be overridden by subclasses, returns None if not available."""
+        return None
+
+    @property
+    def facts_key(self) -> str | None:
+        """Key of the device in the persisted device facts. Can be overridden by subclasses, returns None if the facts of the device are not persisted."""
+        return None
+
     def __eq__(self, other: object) -> bool:
         """Implement equality for AntaDevice objects."""
         return self._keys == other._keys if isinstance(other, self.__class__) else False
@@ -180,7 +317,9 @@ class AntaDevice(ABC):
 
     def _init_cache(self) -> None:
         """Initialize cache for the device, can be overridden by subclasses to manipulate how it works."""
-        self.cache = AntaCache(device=self.name, ttl=60)
+        settings = get_cache_settings()
+        store = get_cache_store(settings.path) if settings.path is not None else None
+        self.cache = AntaCache(device=self.name, ttl=settings.ttl, store=store)
         self.cache_locks = self.cache.locks
 
     @property
@@ -189,7 +328,10 @@ class AntaDevice(ABC):
         if self.cache is not None:
             stats = self.cache.stats
             ratio = stats["hits"] / stats["total"] if stats["total"] > 0 else 0
-            return {"total_commands_sent": stats["total"], "cache_hits": stats["hits"], "cache_hit_ratio": f"{ratio * 100:.2f}%"}
+            statistics: dict[str, Any] = {"total_commands_sent": stats["total"], "cache_hits": stats["hits"], "cache_hit_ratio": f"{ratio * 100:.2f}%"}
+            if self.cache.store is not None:
+                statistics["persistent_cache_hits"] = stats["persistent_hits"]
+            return statistics
         return None
 
     def __rich_repr__(self) -> Iterator[tuple[str, Any]]:
@@ -216,7 +358,7 @@ class AntaDevice(ABC):
         )
 
     @abstractmethod
-    async def _collect(self, command: AntaCommand, *, collection_id: str | None = None) -> None:
+    async def _collect(self, command: AntaCommand | RuntimeCommand, *, collection_id: str | None = None) -> None:
         """Collect device command output.
 
         This abstract coroutine can be used to implement any command collection method
@@ -237,16 +379,23 @@ class AntaDevice(ABC):
             An identifier used to build the eAPI request ID.
         """
 
-    async def collect(self, command: AntaCommand, *, collection_id: str | None = None) -> None:
+    async def collect(self, command: AntaCommand | RuntimeCommand, *, collection_id: str | None = None) -> None:
         """Collect the output for a specified command.
 
         When caching is activated on both the device and the command,
         this method prioritizes retrieving the output from the cache. In cases where the output isn't cached yet,
-        it will be freshly collected and then stored in the cache for future access.
-        The method employs asynchronous locks based on the command's UID to guarantee exclusive access to the cache.
+        it will be freshly collected and then stored in the cache for future access. Concurrent collections of the same
+        command on the device are coalesced: the first caller collects the command and the other callers wait for it
+        and get its output and errors, whether caching is enabled on the device or not.
 
-        When caching is NOT enabled, either at the device or command level, the method directly collects the output
-        via the private `_collect` method without interacting with the cache.
+        When caching is NOT enabled at the device level, the output is collected via the private `_collect` method
+        without being stored in the cache. When caching is NOT enabled at the command level, the method directly
+        collects the output via the private `_collect` method without interacting with the cache or with the
+        concurrent collections.
+
+        Cached outputs are shared with every test requiring the same command and their nested data must not be modified.
+        When `readonly_outputs` is True, the outputs are converted to read-only containers raising a TypeError on any
+        attempted mutation.
 
         Parameters
         ----------
@@ -255,20 +404,70 @@ class AntaDevice(ABC):
         collection_id
             An identifier used to build the eAPI request ID.
         """
-        if self.cache is not None and command.use_cache:
-            async with self.cache.locks[command.uid]:
-                cached_output = await self.cache.get(command.uid)
+        if not command.use_cache:
+            # Commands bypassing the cache expect a fresh output
+            await self._guarded_collect(command=command, collection_id=collection_id)
+            return
 
-                if cached_output is not None:
-                    logger.debug("Cache hit for %s on %s", command.command, self.name)
-                    command.output = cached_output
-                else:
-                    await self._collect(command=command, collection_id=collection_id)
-                    await self.cache.set(command.uid, command.output)
+        uid = command.uid
+        while (flight := self._flights.get(uid)) is not None:
+            # Shielded so that a cancelled caller does not cancel the collection shared with the other callers
+            leader = await asyncio.shield(flight)
+            if leader is not None:
+                logger.debug("Sharing the in-flight collection of %s on %s", command.command, self.name)
+                command.output = leader.output
+                command.errors = list(leader.errors)
+                return
+            # The leader has been cancelled or failed, retry the collection
+
+        flight = asyncio.get_running_loop().create_future()
+        self._flights[uid] = flight
+        try:
+            if self.cache is not None:
+                await self._cached_collect(self.cache, command=command, collection_id=collection_id)
+            else:
+                await self._guarded_collect(command=command, collection_id=collection_id)
+            flight.set_result(command)
+        finally:
+            if not flight.done():
+                flight.set_result(None)
+            del self._flights[uid]
+
+    async def _cached_collect(self, cache: AntaCache, command: AntaCommand | RuntimeCommand, *, collection_id: str | None = None) -> None:
+        """Collect the output of a command from the device cache, or from the device on a cache miss and store it in the cache."""
+        cached_output = await cache.get(command.uid)
+
+        if cached_output is not None:
+            logger.debug("Cache hit for %s on %s", command.command, self.name)
+            command.output = freeze(cached_output) if self.readonly_outputs else cached_output
         else:
-            await self._collect(command=command, collection_id=collection_id)
+            await self._guarded_collect(command=command, collection_id=collection_id)
+            await cache.set(command.uid, command.output, ttl=command.cache_ttl)
+
+    async def _guarded_collect(self, command: AntaCommand | RuntimeCommand, *, collection_id: str | None = None) -> None:
+        """Collect the output of a command unless the circuit breaker of the device is open."""
+        if self.circuit_breaker is not None and not await self.circuit_breaker.allow(self._probe):
+            logger.debug("Circuit breaker open for device %s, skipping the collection of %s", self.name, command.command)
+            command.errors = [self.circuit_breaker.error_message]
+            return
+        await self._collect(command=command, collection_id=collection_id)
+        if self.readonly_outputs and command.output is not None:
+            command.output = freeze(command.output)
+
+    async def _probe(self) -> bool:
+        """Check whether the device is reachable again after the circuit breaker opened.
+
+        Can be overridden by subclasses with a lighter check. The default implementation refreshes the device.
 
-    async def collect_commands(self, commands: list[AntaCommand], *, collection_id: str | None = None) -> None:
+        Returns
+        -------
+        bool
+            True if the device is reachable.
+        """
+        await self.refresh()
+        return self.established
+
+    async def collect_commands(self, commands: Sequence[AntaCommand | RuntimeCommand], *, collection_id: str | None = None) -> None:
         """Collect multiple commands.
 
         Parameters
@@ -291,6 +490,8 @@ class AntaDevice(ABC):
         - `established`: When a command execution succeeds.
 
         - `hw_model`: The hardware model of the device.
+
+        It can also update `eos_version`, the EOS version of the device, persisted with the device facts.
         """
 
     async def copy(self, sources: list[Path], destination: Path, direction: Literal["to", "from"] = "from") -> None:
@@ -342,25 +543,18 @@ class AsyncEOSDevice(AntaDevice):
         True if remote command execution succeeds.
     hw_model : str
         Hardware model of the device.
+    eos_version : str | None
+        EOS version of the device, None if unknown.
     tags : set[str]
         Tags for this device.
     enable : bool
         When True, commands are collected in privileged (enable) mode.
     """
 
-    _client: asynceapi.Device
-    """
-    The underlying HTTPX-based eAPI client. Created by `_create_client()`.
-    Closed by `disconnect()`; automatically recreated on the next `refresh()` call.
-    """
     _eapi_opts: EAPIClientConnectionOptions
     """
     eAPI client connection options used to create `_client`.
     """
-    _ssh_opts: SSHClientConnectionOptions
-    """
-    SSH client connection options used to establish transient SSH connections in `copy()`.
-    """
 
     def __init__(  # noqa: PLR0913
         self,
@@ -428,17 +622,62 @@ class AsyncEOSDevice(AntaDevice):
         self.enable = enable
         self._enable_password = enable_password
         self._eapi_opts = EAPIClientConnectionOptions(host=host, username=username, password=password, port=port, proto=proto, timeout=timeout)
-        self._client = self._create_client()
-        ssh_params: dict[str, Any] = {}
-        if insecure:
-            ssh_params["known_hosts"] = None
-        self._ssh_opts = SSHClientConnectionOptions(host=host, port=ssh_port, username=username, password=password, client_keys=CLIENT_KEYS, **ssh_params)
+        self._eapi_port = port or getservbyname(proto)
+        # The eAPI client is created on first use, devices filtered out of a run never create one
+        self._eapi_client: asynceapi.Device | None = None
+        # The SSH client connection options are also created on first use, loading the SSH configuration and keys is expensive
+        self._ssh_port = ssh_port
+        self._insecure = insecure
+        self._ssh_client_opts: SSHClientConnectionOptions | None = None
+
+        device_settings = get_device_settings()
+
+        # Adaptive concurrency of eAPI requests
+        self._limiter = AIMDLimiter(
+            self.name,
+            maximum=device_settings.max_concurrency,
+            minimum=device_settings.min_concurrency,
+            latency_threshold=device_settings.latency_threshold,
+        )
+
+        # eAPI request batching
+        self._batch_size = device_settings.batch_size
+        self._batch_window = device_settings.batch_window
+        self._pending_batches: dict[tuple[Literal["json", "text"], Literal[1, "latest"]], list[tuple[AntaCommand | RuntimeCommand, asyncio.Future[None]]]] = {}
+        self._batch_timers: dict[tuple[Literal["json", "text"], Literal[1, "latest"]], asyncio.TimerHandle] = {}
+        self._batch_tasks: set[asyncio.Task[None]] = set()
+
+    @property
+    def _client(self) -> asynceapi.Device:
+        """The underlying HTTPX-based eAPI client.
 
-        self._command_semaphore = asyncio.Semaphore(MAX_CONCURRENT_REQUESTS)
+        Created by `_create_client()` on first access. Closed by `disconnect()`; automatically recreated on the next `refresh()` call.
+        """
+        if self._eapi_client is None:
+            self._eapi_client = self._create_client()
+        return self._eapi_client
+
+    @_client.setter
+    def _client(self, client: asynceapi.Device) -> None:
+        self._eapi_client = client
+
+    @property
+    def _ssh_opts(self) -> SSHClientConnectionOptions:
+        """SSH client connection options used to establish transient SSH connections in `copy()`. Created on first access."""
+        if self._ssh_client_opts is None:
+            eapi_opts = self._eapi_opts
+            ssh_params: dict[str, Any] = {}
+            if self._insecure:
+                ssh_params["known_hosts"] = None
+            self._ssh_client_opts = SSHClientConnectionOptions(
+                host=eapi_opts.host, port=self._ssh_port, username=eapi_opts.username, password=eapi_opts.password, client_keys=CLIENT_KEYS, **ssh_params
+            )
+        return self._ssh_client_opts
 
     def _create_client(self) -> asynceapi.Device:
         """Create and return a new asynceapi.Device client using stored connection options."""
         eapi_opts = self._eapi_opts
+        trust_env = get_httpx_settings().trust_env
         return asynceapi.Device(
             host=eapi_opts.host,
             port=eapi_opts.port,
@@ -446,7 +685,8 @@ class AsyncEOSDevice(AntaDevice):
             password=eapi_opts.password,
             proto=eapi_opts.proto,
             timeout=eapi_opts.timeout,
-            trust_env=get_httpx_settings().trust_env,
+            trust_env=trust_env,
+            verify=get_ssl_context(trust_env=trust_env),
         )
 
     def __rich_repr__(self) -> Iterator[tuple[str, Any]]:
@@ -455,11 +695,11 @@ class AsyncEOSDevice(AntaDevice):
         https://rich.readthedocs.io/en/stable/pretty.html#rich-repr-protocol.
         """
         yield from super().__rich_repr__()
-        yield ("host", self._client.host)
-        yield ("eapi_port", self._client.port)
-        yield ("username", self._ssh_opts.username)
+        yield ("host", self._eapi_opts.host)
+        yield ("eapi_port", self._eapi_port)
+        yield ("username", self._eapi_opts.username)
         yield ("enable", self.enable)
-        yield ("insecure", self._ssh_opts.known_hosts is None)
+        yield ("insecure", self._insecure)
         if __DEBUG__:
             _ssh_opts = vars(self._ssh_opts).copy()
             removed_pw = "<removed>"
@@ -486,20 +726,43 @@ class AsyncEOSDevice(AntaDevice):
             f"is_online={self.is_online!r}, "
             f"established={self.established!r}, "
             f"disable_cache={self.cache is None!r}, "
-            f"host={self._client.host!r}, "
-            f"eapi_port={self._client.port!r}, "
-            f"username={self._ssh_opts.username!r}, "
+            f"host={self._eapi_opts.host!r}, "
+            f"eapi_port={self._eapi_port!r}, "
+            f"username={self._eapi_opts.username!r}, "
             f"enable={self.enable!r}, "
-            f"insecure={self._ssh_opts.known_hosts is None!r})"
+            f"insecure={self._insecure!r})"
         )
 
+    def __reduce__(self) -> tuple[Any, ...]:
+        """Support pickling, used to send the device to the worker processes of a sharded ANTA run.
+
+        The device is rebuilt from its parameters: its eAPI client, cache and runtime state are not pickled.
+        """
+        eapi_opts = self._eapi_opts
+        kwargs: dict[str, Any] = {
+            "host": eapi_opts.host,
+            "username": eapi_opts.username,
+            "password": eapi_opts.password,
+            "name": self.name,
+            "enable_password": self._enable_password,
+            "port": eapi_opts.port,
+            "ssh_port": self._ssh_port,
+            "tags": self.tags,
+            "timeout": eapi_opts.timeout,
+            "proto": eapi_opts.proto,
+            "enable": self.enable,
+            "insecure": self._insecure,
+            "disable_cache": self.cache is None,
+        }
+        return (partial(self.__class__, **kwargs), ())
+
     @property
     def _keys(self) -> tuple[Any, ...]:
         """Two AsyncEOSDevice objects are equal if the hostname and the port are the same.
 
         This covers the use case of port forwarding when the host is localhost and the devices have different ports.
         """
-        return (self._client.host, self._client.port)
+        return (self._eapi_opts.host, self._eapi_port)
 
     @property
     def max_connections(self) -> int | None:
@@ -509,13 +772,26 @@ class AsyncEOSDevice(AntaDevice):
         except AttributeError:
             return None
 
-    async def _collect(self, command: AntaCommand, *, collection_id: str | None = None) -> None:
+    @property
+    def concurrency_window(self) -> int | None:
+        """Current number of concurrent eAPI requests allowed to the device, adapted at runtime."""
+        return self._limiter.window
+
+    @property
+    def facts_key(self) -> str | None:
+        """Key of the device in the persisted device facts, built from the hostname and the eAPI port like the device equality."""
+        return f"{self._eapi_opts.host}:{self._eapi_port}"
+
+    async def _collect(self, command: AntaCommand | RuntimeCommand, *, collection_id: str | None = None) -> None:
         """Collect device command output from EOS using asynceapi.
 
         Supports outformat `json` and `text` as output structure.
         Gain privileged access using the `enable_password` attribute
         of the `AntaDevice` instance if populated.
 
+        When batching is enabled with the `ANTA_DEVICE_BATCH_SIZE` environment variable, commands collected
+        within the `ANTA_DEVICE_BATCH_WINDOW` time window are coalesced into a single eAPI request.
+
         Parameters
         ----------
         command
@@ -531,63 +807,195 @@ class AsyncEOSDevice(AntaDevice):
         if self._client.is_closed:
             msg = f"Device {self.name}: httpx client is closed. Call refresh() to reconnect before collecting commands."
             raise RuntimeError(msg)
-        async with self._command_semaphore:
-            commands: list[EapiComplexCommand | EapiSimpleCommand] = []
-            if self.enable and self._enable_password is not None:
-                commands.append(
-                    {
-                        "cmd": "enable",
-                        "input": str(self._enable_password),
-                    },
-                )
-            elif self.enable:
-                # No password
-                commands.append(EapiComplexCommand(cmd="enable"))
-            commands += [EapiComplexCommand(cmd=command.command, revision=command.revision)] if command.revision else [EapiComplexCommand(cmd=command.command)]
-            try:
-                response = await self._client.cli(
-                    commands=commands,
-                    ofmt=command.ofmt,
-                    version=command.version,
-                    req_id=f"ANTA-{collection_id}-{id(command)}" if collection_id else f"ANTA-{id(command)}",
-                )
-                # Do not keep response of 'enable' command
-                command.output = response[-1]
-            except asynceapi.EapiCommandError as e:
-                # This block catches exceptions related to EOS issuing an error.
-                self._handle_eapi_command_error(command, e)
-            except TimeoutException as e:
-                # This block catches Timeout exceptions.
-                command.errors = [exc_to_str(e)]
-                timeouts = self._client.timeout.as_dict()
-                logger.error(
-                    "%s occurred while sending a command to %s. Consider increasing the timeout.\nCurrent timeouts: Connect: %s | Read: %s | Write: %s | Pool: %s",
-                    exc_to_str(e),
-                    self.name,
-                    timeouts["connect"],
-                    timeouts["read"],
-                    timeouts["write"],
-                    timeouts["pool"],
-                )
-            except (ConnectError, OSError) as e:
-                # This block catches OSError and socket issues related exceptions.
-                command.errors = [exc_to_str(e)]
-                # pylint: disable=no-member
-                if (isinstance(exc := e.__cause__, httpcore.ConnectError) and isinstance(os_error := exc.__context__, OSError)) or isinstance(
-                    os_error := e, OSError
-                ):
-                    if isinstance(os_error.__cause__, OSError):
-                        os_error = os_error.__cause__
-                    logger.error("A local OS error occurred while connecting to %s: %s.", self.name, os_error)
+        if self._batch_size > 1:
+            await self._collect_batched(command)
+            return
+        await self._send_commands([command], req_id=f"ANTA-{collection_id}-{id(command)}" if collection_id else f"ANTA-{id(command)}")
+
+    async def _collect_batched(self, command: AntaCommand | RuntimeCommand) -> None:
+        """Add a command to the pending batch matching its output format and version, and wait for the batch to be sent.
+
+        The batch is sent when the batch window expires or when it reaches the maximum batch size, whichever comes first.
+
+        Parameters
+        ----------
+        command
+            The command to collect.
+        """
+        loop = asyncio.get_running_loop()
+        key = (command.ofmt, command.version)
+        future: asyncio.Future[None] = loop.create_future()
+        batch = self._pending_batches.setdefault(key, [])
+        batch.append((command, future))
+        if len(batch) >= self._batch_size:
+            self._flush_batch(key)
+        elif len(batch) == 1:
+            self._batch_timers[key] = loop.call_later(self._batch_window, self._flush_batch, key)
+        await future
+
+    def _flush_batch(self, key: tuple[Literal["json", "text"], Literal[1, "latest"]]) -> None:
+        """Schedule the eAPI request of the pending batch identified by key."""
+        if (timer := self._batch_timers.pop(key, None)) is not None:
+            timer.cancel()
+        if not (batch := self._pending_batches.pop(key, [])):
+            return
+        task = asyncio.get_running_loop().create_task(self._send_batch(batch))
+        # Keep a reference to the task to avoid it being garbage collected
+        self._batch_tasks.add(task)
+        task.add_done_callback(self._batch_tasks.discard)
+
+    async def _send_batch(self, batch: list[tuple[AntaCommand | RuntimeCommand, asyncio.Future[None]]]) -> None:
+        """Send a batch of commands and wake up the coroutines waiting for them.
+
+        An exception raised while sending the batch is set on the future of each waiting coroutine, which raises it,
+        instead of being raised by the task of the batch, which is never awaited.
+        """
+        exception: BaseException | None = None
+        try:
+            await self._send_commands([command for command, _ in batch], req_id=f"ANTA-batch-{id(batch)}")
+        except asyncio.CancelledError as e:
+            exception = e
+            raise
+        except Exception as e:  # noqa: BLE001
+            exception = e
+        finally:
+            for _, future in batch:
+                if future.done():
+                    # The waiting coroutine has been cancelled
+                    continue
+                if exception is None:
+                    future.set_result(None)
                 else:
-                    anta_log_exception(e, f"An error occurred while issuing an eAPI request to {self.name}", logger)
-            except HTTPError as e:
-                # This block catches most of the httpx Exceptions and logs a general message.
-                command.errors = [exc_to_str(e)]
+                    future.set_exception(exception)
+
+    def _get_enable_commands(self) -> list[EapiComplexCommand | EapiSimpleCommand]:
+        """Return the commands to prepend to an eAPI request to gain privileged access."""
+        if self.enable and self._enable_password is not None:
+            return [
+                {
+                    "cmd": "enable",
+                    "input": str(self._enable_password),
+                },
+            ]
+        if self.enable:
+            # No password
+            return [EapiComplexCommand(cmd="enable")]
+        return []
+
+    async def _send_commands(self, commands: Sequence[AntaCommand | RuntimeCommand], req_id: str) -> None:
+        """Send commands sharing the same output format and version in a single eAPI request.
+
+        eAPI stops executing the commands of a request at the first failing command. The commands following
+        the failed one are resubmitted in a new request until all commands have an output or an error.
+
+        Parameters
+        ----------
+        commands
+            The commands to collect. All commands must have the same `ofmt` and `version` attributes.
+        req_id
+            The eAPI request ID.
+        """
+        async with self._limiter as started:
+            pending = commands
+            try:
+                while pending:
+                    pending = await self._send_eapi_request(pending, req_id=req_id)
+            except (TimeoutException, ConnectError, OSError, HTTPError) as e:
+                if self._is_congestion_error(e):
+                    self._limiter.on_congestion(started, reason=exc_to_str(e))
+                if self.circuit_breaker is not None and isinstance(e, (TimeoutException, ConnectError)) and not isinstance(e, PoolTimeout):
+                    self.circuit_breaker.record_failure()
+                self._handle_transport_error(pending, e)
+            else:
+                self._limiter.on_success(started)
+                if self.circuit_breaker is not None:
+                    self.circuit_breaker.record_success()
+                # The device may have been marked offline by a previous connect error
+                self.is_online = True
+            for command in commands:
+                logger.debug("%s: %s", self.name, command)
+
+    async def _send_eapi_request(self, commands: Sequence[AntaCommand | RuntimeCommand], req_id: str) -> list[AntaCommand | RuntimeCommand]:
+        """Send a single eAPI request for the provided commands and populate their output or errors.
+
+        Parameters
+        ----------
+        commands
+            The commands to collect. All commands must have the same `ofmt` and `version` attributes.
+        req_id
+            The eAPI request ID.
+
+        Returns
+        -------
+        list[AntaCommand | RuntimeCommand]
+            The commands that have not been executed by EOS because a previous command of the request failed.
+        """
+        enable_commands = self._get_enable_commands()
+        eapi_commands = enable_commands + [
+            EapiComplexCommand(cmd=command.command, revision=command.revision) if command.revision else EapiComplexCommand(cmd=command.command)
+            for command in commands
+        ]
+        try:
+            response = await self._client.cli(commands=eapi_commands, ofmt=commands[0].ofmt, version=commands[0].version, req_id=req_id)
+        except asynceapi.EapiCommandError as e:
+            # This block catches exceptions related to EOS issuing an error.
+            failed_index = len(e.passed) - len(enable_commands)
+            if failed_index < 0:
+                # The 'enable' command failed, none of the commands have been executed
+                for command in commands:
+                    self._handle_eapi_command_error(command, e)
+                return []
+            for index, command in enumerate(commands[:failed_index], start=len(enable_commands)):
+                command.output = e.passed[index]
+            self._handle_eapi_command_error(commands[failed_index], e)
+            return list(commands[failed_index + 1 :])
+        # Do not keep response of 'enable' command
+        for index, command in enumerate(commands, start=len(response) - len(commands)):
+            command.output = response[index]
+        return []
+
+    @staticmethod
+    def _is_congestion_error(e: Exception) -> bool:
+        """Return True if the exception indicates that the device is overloaded: a timeout or an HTTP 5xx error."""
+        if isinstance(e, TimeoutException):
+            # Pool timeouts are raised by the local HTTPX connection pool
+            return not isinstance(e, PoolTimeout)
+        return isinstance(e, HTTPStatusError) and e.response.is_server_error
+
+    def _handle_transport_error(self, commands: Sequence[AntaCommand | RuntimeCommand], e: Exception) -> None:
+        """Handle and appropriately log an exception raised while sending an eAPI request."""
+        for command in commands:
+            command.errors = [exc_to_str(e)]
+        if isinstance(e, (ConnectError, ConnectTimeout)):
+            # The device is not reachable anymore, its persisted facts are marked as stale by the inventory
+            self.is_online = False
+
+        if isinstance(e, TimeoutException):
+            # This block catches Timeout exceptions.
+            timeouts = self._client.timeout.as_dict()
+            logger.error(
+                "%s occurred while sending a command to %s. Consider increasing the timeout.\nCurrent timeouts: Connect: %s | Read: %s | Write: %s | Pool: %s",
+                exc_to_str(e),
+                self.name,
+                timeouts["connect"],
+                timeouts["read"],
+                timeouts["write"],
+                timeouts["pool"],
+            )
+        elif isinstance(e, (ConnectError, OSError)):
+            # This block catches OSError and socket issues related exceptions.
+            # pylint: disable=no-member
+            if (isinstance(exc := e.__cause__, httpcore.ConnectError) and isinstance(os_error := exc.__context__, OSError)) or isinstance(os_error := e, OSError):
+                if isinstance(os_error.__cause__, OSError):
+                    os_error = os_error.__cause__
+                logger.error("A local OS error occurred while connecting to %s: %s.", self.name, os_error)
+            else:
                 anta_log_exception(e, f"An error occurred while issuing an eAPI request to {self.name}", logger)
-            logger.debug("%s: %s", self.name, command)
+        else:
+            # This block catches most of the httpx Exceptions and logs a general message.
+            anta_log_exception(e, f"An error occurred while issuing an eAPI request to {self.name}", logger)
 
-    def _handle_eapi_command_error(self, command: AntaCommand, e: asynceapi.EapiCommandError) -> None:
+    def _handle_eapi_command_error(self, command: AntaCommand | RuntimeCommand, e: asynceapi.EapiCommandError) -> None:
         """Handle and appropriately log an EapiCommandError exception."""
         # Filter out empty strings from the list of errors
         error_details = [err for err in e.errors if err]
@@ -622,32 +1030,42 @@ class AsyncEOSDevice(AntaDevice):
         If the eAPI client has been closed (e.g. after a `disconnect()` call), it is
         automatically recreated before attempting to reach the device.
 
+        The device is refreshed in a single eAPI request running `show version`, without checking the eAPI HTTP endpoint
+        beforehand: the device is online when the endpoint answers this request, even with a command error. When the device
+        cache is enabled, the `show version` output is stored in the cache so that the tests collecting this command do not send it again.
+
         Updates the following attributes:
 
         - `is_online`: True when the eAPI HTTP endpoint responds successfully.
         - `established`: True when a command execution succeeds.
         - `hw_model`: Hardware model parsed from `show version`.
+        - `eos_version`: EOS version parsed from `show version`.
         """
         logger.debug("Refreshing device %s", self.name)
         if self._client.is_closed:
             logger.debug("Recreating closed httpx client for device %s", self.name)
             self._client = self._create_client()
+
+        # Same command as the ANTA tests collecting `show version` so that the output is cached under their command UID
+        show_version = AntaCommand(command="show version", revision=1)
         try:
-            self.is_online = await self._client.check_api_endpoint()
-        except HTTPError as e:
+            async with self._limiter:
+                await self._send_eapi_request([show_version], req_id=f"ANTA-{id(show_version)}")
+        except (HTTPError, OSError) as e:
             self.is_online = False
             self.established = False
             logger.warning("An error occurred while attempting to connect to device %s: %s", self.name, exc_to_str(e))
             return
+        # The eAPI HTTP endpoint responded, even if the command failed
+        self.is_online = True
 
-        show_version = AntaCommand(command="show version")
-        await self._collect(show_version)
         if not show_version.collected:
             self.established = False
             logger.warning("Cannot get hardware information from device %s", self.name)
             return
 
         self.hw_model = show_version.json_output.get("modelName", None)
+        self.eos_version = show_version.json_output.get("version", None)
         if self.hw_model is None:
             self.established = False
             logger.critical("Cannot parse 'show version' returned by device %s", self.name)
@@ -657,6 +1075,22 @@ class AsyncEOSDevice(AntaDevice):
             logger.critical("Got an empty 'modelName' in the 'show version' returned by device %s", self.name)
         else:
             self.established = True
+            if self.cache is not None:
+                await self.cache.set(show_version.uid, freeze(show_version.output) if self.readonly_outputs else show_version.output)
+
+    async def _probe(self) -> bool:
+        """Check whether the eAPI HTTP endpoint of the device responds again after the circuit breaker opened.
+
+        The device is marked online again when the endpoint responds.
+        """
+        try:
+            is_online = await self._client.check_api_endpoint()
+        except HTTPError as e:
+            logger.debug("Device %s is still unreachable: %s", self.name, exc_to_str(e))
+            return False
+        if is_online:
+            self.is_online = True
+        return is_online
 
     async def disconnect(self) -> None:
         """Close the eAPI httpx client.
@@ -665,8 +1099,8 @@ class AsyncEOSDevice(AntaDevice):
         Use `refresh()` to reconnect.
         """
         logger.debug("Disconnecting device %s", self.name)
-        if not self._client.is_closed:
-            await self._client.aclose()
+        if self._eapi_client is not None and not self._eapi_client.is_closed:
+            await self._eapi_client.aclose()
         self.is_online = False
         self.established = False
 
@@ -7,38 +7,97 @@ from __future__ import annotations
 
 import asyncio
 import logging
+from collections import defaultdict
+from dataclasses import dataclass, field
 from ipaddress import ip_address, ip_network
 from json import load as json_load
 from pathlib import Path
+from time import time
 from typing import TYPE_CHECKING, Any, ClassVar, Literal
 
+from httpx import URL
 from pydantic import ValidationError
 from yaml import YAMLError, safe_load
 
+from anta._discovery import DiscoveryCache, discover
+from anta._facts import DeviceFactsStore
 from anta.device import AntaDevice, AsyncEOSDevice
 from anta.inventory.exceptions import InventoryIncorrectSchemaError, InventoryRootKeyError
 from anta.inventory.models import AntaInventoryHost, AntaInventoryInput
 from anta.logger import anta_log_exception, exc_to_str
+from anta.settings import get_discovery_settings, get_facts_settings
 
 logger = logging.getLogger(__name__)
 
 if TYPE_CHECKING:
-    from typing_extensions import TypeIs
+    from _collections_abc import dict_items, dict_values
+    from collections.abc import ItemsView, Iterable, Mapping
+
+    from typing_extensions import Self, TypeIs
+
+
+@dataclass(eq=False)
+class _LazyDevices:
+    """Compact definition of the devices of a network or range section of an inventory file.
+
+    The inventory stores this object instead of the devices of the section, which are only created when accessed.
+    Created devices are kept so that all the inventories sharing the section, e.g. filtered inventories, get the same device objects.
+
+    Attributes
+    ----------
+    tags
+        Tags of the section.
+    kwargs
+        Keyword arguments used to create the devices.
+    devices
+        Devices of the section created so far, keyed by host.
+    """
+
+    tags: set[str] | None
+    kwargs: dict[str, Any]
+    devices: dict[str, AsyncEOSDevice] = field(default_factory=dict)
+
+    def create(self, host: str) -> AsyncEOSDevice:
+        """Return the device of the section for a host, creating it if needed."""
+        if (device := self.devices.get(host)) is None:
+            device = AsyncEOSDevice(host=host, tags=set(self.tags) if self.tags is not None else None, **self.kwargs)
+            self.devices[host] = device
+        return device
+
+    def url(self, host: str) -> URL:
+        """Return the eAPI URL of the device of the section for a host, without creating it."""
+        return URL(scheme=self.kwargs.get("proto", "https"), host=host, port=self.kwargs.get("port"))
+
+    def device_tags(self, host: str) -> set[str]:
+        """Return the tags of the device of the section for a host, without creating it."""
+        return (self.tags or set()) | {host}
 
 
 class AntaInventory(dict[str, AntaDevice]):
-    """Inventory abstraction for ANTA framework."""
+    """Inventory abstraction for ANTA framework.
+
+    The inventory maintains an index of the device names per tag, built on the first filtering by tags and then updated when
+    devices are added or removed, including with the `dict` methods modifying the inventory like `update()` or `pop()`.
+    The tags of a device must therefore not be modified once the device is added to the inventory.
+    """
 
     # Root key of inventory part of the inventory file
     INVENTORY_ROOT_KEY: str = "anta_inventory"
     # Supported Output format
     INVENTORY_OUTPUT_FORMAT: ClassVar[list[str]] = ["native", "json"]
+    # Whether the inventory contains devices of network or range sections which have not been created yet
+    _has_lazy_devices: bool = False
+    # Device names per tag, built on the first filtering by tags
+    _tag_index: dict[str, set[str]] | None = None
+    # Device facts persisted across runs, loaded when connecting the inventory
+    _facts_store: DeviceFactsStore | None = None
 
     def __str__(self) -> str:
         """Human readable string representing the inventory."""
         devs = {}
-        for dev in self.values():
-            if (dev_type := dev.__class__.__name__) not in devs:
+        for _, dev in self._raw_items():
+            dev_type = AsyncEOSDevice.__name__ if isinstance(dev, _LazyDevices) else dev.__class__.__name__
+            if dev_type not in devs:
                 devs[dev_type] = 1
             else:
                 devs[dev_type] += 1
@@ -121,9 +180,9 @@ class AntaInventory(dict[str, AntaDevice]):
         try:
             for network in inventory_input.networks:
                 updated_kwargs = AntaInventory._update_disable_cache(kwargs, inventory_disable_cache=network.disable_cache)
+                lazy_devices = _LazyDevices(tags=network.tags, kwargs=updated_kwargs)
                 for host_ip in ip_network(str(network.network)):
-                    device = AsyncEOSDevice(host=str(host_ip), tags=network.tags, **updated_kwargs)
-                    inventory.add_device(device)
+                    inventory._add_lazy_device(str(host_ip), lazy_devices)
         except ValueError as e:
             message = "Could not parse the network section in the inventory"
             anta_log_exception(e, message, logger)
@@ -158,13 +217,13 @@ class AntaInventory(dict[str, AntaDevice]):
         try:
             for range_def in inventory_input.ranges:
                 updated_kwargs = AntaInventory._update_disable_cache(kwargs, inventory_disable_cache=range_def.disable_cache)
+                lazy_devices = _LazyDevices(tags=range_def.tags, kwargs=updated_kwargs)
                 range_increment = ip_address(str(range_def.start))
                 range_stop = ip_address(str(range_def.end))
                 while range_increment <= range_stop:  # type: ignore[operator]
                     # mypy raise an issue about comparing IPv4Address and IPv6Address
                     # but this is handled by the ipaddress module natively by raising a TypeError
-                    device = AsyncEOSDevice(host=str(range_increment), tags=range_def.tags, **updated_kwargs)
-                    inventory.add_device(device)
+                    inventory._add_lazy_device(str(range_increment), lazy_devices)
                     range_increment += 1
         except ValueError as e:
             message = "Could not parse the range section in the inventory"
@@ -190,7 +249,9 @@ class AntaInventory(dict[str, AntaDevice]):
     ) -> AntaInventory:
         """Create an AntaInventory instance from an inventory file.
 
-        The inventory devices are AsyncEOSDevice instances.
+        The inventory devices are AsyncEOSDevice instances. The devices of the network and range sections are stored
+        compactly and only created when accessed, e.g. when connecting to them, so that `len()`, iterating over the
+        device names and filtering the inventory with `get_inventory()` do not create them.
 
         Parameters
         ----------
@@ -284,6 +345,8 @@ class AntaInventory(dict[str, AntaDevice]):
     def get_inventory(self, *, established_only: bool = False, tags: set[str] | None = None, devices: set[str] | None = None) -> AntaInventory:
         """Return a filtered inventory.
 
+        Devices are selected by tags using the tag index of the inventory.
+
         Parameters
         ----------
         established_only
@@ -298,21 +361,47 @@ class AntaInventory(dict[str, AntaDevice]):
         AntaInventory
             An inventory with filtered AntaDevice objects.
         """
-
-        def _filter_devices(device: AntaDevice) -> bool:
-            """Select the devices based on the inputs `tags`, `devices` and `established_only`."""
-            if tags is not None and all(tag not in tags for tag in device.tags):
-                return False
-            if devices is None or device.name in devices:
-                return bool(not established_only or device.established)
-            return False
-
-        filtered_devices: list[AntaDevice] = list(filter(_filter_devices, self.values()))
-        result = AntaInventory()
-        for device in filtered_devices:
-            result.add_device(device)
+        selected: set[str] | None = None
+        if tags is not None:
+            tag_index = self._get_tag_index()
+            selected = set().union(*(tag_index.get(tag, ()) for tag in tags))
+        if devices is not None:
+            selected = selected & devices if selected is not None else devices
+
+        items: Iterable[tuple[str, AntaDevice | _LazyDevices]] = (
+            self._raw_items() if selected is None else ((name, device) for name, device in self._raw_items() if name in selected)
+        )
+        if established_only:
+            # Devices of the network and range sections which have not been created yet have never been connected
+            items = ((name, device) for name, device in items if not isinstance(device, _LazyDevices) and device.established)
+        # The dict constructor does not call __setitem__, the device names of the inventory are already checked
+        result = AntaInventory(items)  # type: ignore[arg-type]
+        result._has_lazy_devices = self._has_lazy_devices and not established_only
         return result
 
+    def _get_tag_index(self) -> dict[str, set[str]]:
+        """Return the index of the device names per tag, building it if needed."""
+        if self._tag_index is None:
+            tag_index: defaultdict[str, set[str]] = defaultdict(set)
+            for name, device in self._raw_items():
+                for tag in device.device_tags(name) if isinstance(device, _LazyDevices) else device.tags:
+                    tag_index[tag].add(name)
+            self._tag_index = dict(tag_index)
+        return self._tag_index
+
+    def _index_device(self, name: str, device: AntaDevice | _LazyDevices, *, remove: bool = False) -> None:
+        """Add or remove a device to or from the tag index, if built."""
+        if self._tag_index is None:
+            return
+        for tag in device.device_tags(name) if isinstance(device, _LazyDevices) else device.tags:
+            if (names := self._tag_index.get(tag)) is not None:
+                if remove:
+                    names.discard(name)
+                else:
+                    names.add(name)
+            elif not remove:
+                self._tag_index[tag] = {name}
+
     def _get_potential_connections(self) -> int | None:
         """Calculate the total potential concurrent connections for the current inventory.
 
@@ -336,6 +425,57 @@ class AntaInventory(dict[str, AntaDevice]):
             potential_connections += device.max_connections
         return None if not all_have_connections else potential_connections
 
+    def __getitem__(self, key: str) -> AntaDevice:
+        """Get a device from the inventory, creating it if needed."""
+        device = super().__getitem__(key)
+        if isinstance(device, _LazyDevices):
+            device = device.create(key)
+            super().__setitem__(key, device)
+        return device
+
+    def get(self, key: str, default: AntaDevice | None = None) -> AntaDevice | None:  # type: ignore[override]
+        """Get a device from the inventory, creating it if needed. Return `default` if the device is not in the inventory."""
+        try:
+            return self[key]
+        except KeyError:
+            return default
+
+    def values(self) -> dict_values[str, AntaDevice]:
+        """Return the devices of the inventory, creating them if needed."""
+        self._create_lazy_devices()
+        return super().values()
+
+    def items(self) -> dict_items[str, AntaDevice]:
+        """Return the device names and devices of the inventory, creating the devices if needed."""
+        self._create_lazy_devices()
+        return super().items()
+
+    def copy(self) -> AntaInventory:
+        """Return a shallow copy of the inventory, sharing its devices."""
+        result = AntaInventory(self._raw_items())  # type: ignore[arg-type]
+        result._has_lazy_devices = self._has_lazy_devices
+        return result
+
+    def __reduce__(self) -> tuple[Any, ...]:
+        """Support pickling without creating the devices of the network and range sections, e.g. to send a shard of the inventory to a worker process.
+
+        The devices of the network and range sections which have not been created yet are pickled as their section definition.
+        """
+        return (self.__class__, (list(self._raw_items()),), {"_has_lazy_devices": self._has_lazy_devices})
+
+    def _raw_items(self) -> ItemsView[str, AntaDevice | _LazyDevices]:
+        """Return the device names and devices of the inventory without creating the devices of the network and range sections."""
+        return super().items()
+
+    def _create_lazy_devices(self) -> None:
+        """Create the devices of the network and range sections which have not been created yet."""
+        if not self._has_lazy_devices:
+            return
+        for name, device in self._raw_items():
+            if isinstance(device, _LazyDevices):
+                super().__setitem__(name, device.create(name))
+        self._has_lazy_devices = False
+
     ###########################################################################
     # SET methods
     ###########################################################################
@@ -345,7 +485,60 @@ class AntaInventory(dict[str, AntaDevice]):
         if key != value.name:
             msg = f"The key must be the device name for device '{value.name}'. Use AntaInventory.add_device()."
             raise RuntimeError(msg)
-        return super().__setitem__(key, value)
+        if (previous := super().get(key)) is not None:
+            self._index_device(key, previous, remove=True)
+        super().__setitem__(key, value)
+        self._index_device(key, value)
+
+    def __delitem__(self, key: str) -> None:
+        """Remove a device from the inventory."""
+        self._index_device(key, super().__getitem__(key), remove=True)
+        super().__delitem__(key)
+
+    def update(self, *args: Mapping[str, AntaDevice] | Iterable[tuple[str, AntaDevice]], **kwargs: AntaDevice) -> None:  # type: ignore[override]
+        """Set multiple devices in the inventory."""
+        for key, value in dict(*args, **kwargs).items():
+            self[key] = value
+
+    def __ior__(self, other: Mapping[str, AntaDevice] | Iterable[tuple[str, AntaDevice]]) -> Self:  # type: ignore[override,misc]
+        """Set multiple devices in the inventory."""
+        self.update(other)
+        return self
+
+    def setdefault(self, key: str, default: AntaDevice) -> AntaDevice:
+        """Get a device from the inventory, creating it if needed. Set the `default` device if the device is not in the inventory."""
+        if key not in self:
+            self[key] = default
+        return self[key]
+
+    def pop(self, key: str, *default: AntaDevice | None) -> AntaDevice | None:  # type: ignore[override]
+        """Remove a device from the inventory and return it, creating it if needed. Return `default` if the device is not in the inventory."""
+        if key not in self:
+            if default:
+                return default[0]
+            raise KeyError(key)
+        device = self[key]
+        del self[key]
+        return device
+
+    def popitem(self) -> tuple[str, AntaDevice]:
+        """Remove the last device from the inventory and return its name and the device, creating it if needed."""
+        key = next(reversed(self))
+        return key, self.pop(key)  # type: ignore[return-value]
+
+    def clear(self) -> None:
+        """Remove all the devices from the inventory."""
+        super().clear()
+        self._tag_index = None
+        self._has_lazy_devices = False
+
+    def _add_lazy_device(self, name: str, lazy_devices: _LazyDevices) -> None:
+        """Add a device of a network or range section to the inventory without creating it."""
+        if (previous := super().get(name)) is not None:
+            self._index_device(name, previous, remove=True)
+        super().__setitem__(name, lazy_devices)  # type: ignore[assignment]
+        self._index_device(name, lazy_devices)
+        self._has_lazy_devices = True
 
     def add_device(self, device: AntaDevice) -> None:
         """Add a device to final inventory.
@@ -363,27 +556,83 @@ class AntaInventory(dict[str, AntaDevice]):
     ###########################################################################
 
     async def connect_inventory(self) -> None:
-        """Run `refresh()` coroutines for all AntaDevice objects in this inventory."""
+        """Run `refresh()` coroutines for all AntaDevice objects in this inventory.
+
+        The devices of the network and range sections which have not been created yet are discovered first: their eAPI port
+        is checked with a short timeout and only the hosts with an open eAPI port are created and refreshed.
+        The other devices are never established. The discovery sweep is configured by the `ANTA_DISCOVERY_*` environment variables.
+
+        When the `ANTA_FACTS_PATH` environment variable is set, the devices with fresh persisted facts are established from
+        these facts without being refreshed, and the facts of the refreshed devices are persisted for the next runs.
+        """
+        await self._discover_lazy_devices()
+        devices = [device for _, device in self._raw_items() if not isinstance(device, _LazyDevices)]
+        settings = get_facts_settings()
+        if settings.path is not None:
+            self._facts_store = DeviceFactsStore(settings.path, settings.ttl)
+            devices = [device for device in devices if not self._load_device_facts(device)]
         logger.debug("Refreshing devices...")
-        results = await asyncio.gather(
-            *(device.refresh() for device in self.values()),
-            return_exceptions=True,
-        )
+        results = await asyncio.gather(*(device.refresh() for device in devices), return_exceptions=True)
         for r in results:
             if isinstance(r, Exception):
                 message = "Error when refreshing inventory"
                 anta_log_exception(r, message, logger)
+        if self._facts_store is not None:
+            self._save_device_facts(devices)
+
+    def _load_device_facts(self, device: AntaDevice) -> bool:
+        """Establish a device from its fresh persisted facts. Return False if the device must be refreshed."""
+        if self._facts_store is None or (key := device.facts_key) is None or (facts := self._facts_store.get(key)) is None or not facts.established:
+            return False
+        logger.debug("Using the persisted facts of device %s, last seen %s seconds ago", device.name, int(time() - facts.last_seen))
+        device.is_online = facts.is_online
+        device.established = facts.established
+        device.hw_model = facts.hw_model
+        device.eos_version = facts.eos_version
+        return True
+
+    def _save_device_facts(self, devices: Iterable[AntaDevice]) -> None:
+        """Persist the facts of the established devices and mark the facts of the unreachable devices as stale."""
+        if self._facts_store is None:
+            return
+        for device in devices:
+            if (key := device.facts_key) is None:
+                continue
+            if device.is_online and device.established and device.hw_model:
+                self._facts_store.set(key, hw_model=device.hw_model, eos_version=device.eos_version, is_online=device.is_online, established=device.established)
+            else:
+                self._facts_store.invalidate(key)
+        self._facts_store.save()
+
+    async def _discover_lazy_devices(self) -> None:
+        """Create the devices of the network and range sections which have an open eAPI port."""
+        settings = get_discovery_settings()
+        if not settings.enabled:
+            self._create_lazy_devices()
+            return
+        urls = {name: device.url(name) for name, device in self._raw_items() if isinstance(device, _LazyDevices)}
+        if not urls:
+            return
+        cache = DiscoveryCache(settings.cache_path, settings.cache_ttl, settings.cache_negative_ttl) if settings.cache_path is not None else None
+        for name in await discover(urls, timeout=settings.timeout, max_concurrency=settings.max_concurrency, cache=cache):
+            _ = self[name]
 
     def is_base_class(self, device: AntaDevice) -> TypeIs[AntaDevice]:
         """Check the type of device, return True if the device is an AntaDevice."""
         return not hasattr(device, "host") and not hasattr(device, "port")
 
     async def disconnect_inventory(self) -> None:
-        """Run `disconnect()` coroutines for all AntaDevice objects in this inventory."""
-        results = await asyncio.gather(
-            *(device.disconnect() for device in self.values()),
-            return_exceptions=True,
-        )
+        """Run `disconnect()` coroutines for all the created AntaDevice objects in this inventory.
+
+        The persisted facts of the devices which became unreachable since the inventory has been connected are marked as stale.
+        """
+        # Devices which have not been created yet have never been connected
+        devices = [device for _, device in self._raw_items() if not isinstance(device, _LazyDevices)]
+        if self._facts_store is not None:
+            if unreachable := [device for device in devices if not device.is_online]:
+                self._save_device_facts(unreachable)
+            self._facts_store = None
+        results = await asyncio.gather(*(device.disconnect() for device in devices), return_exceptions=True)
         for r in results:
             if isinstance(r, Exception):
                 logger.warning("Error when disconnecting inventory: %s", exc_to_str(r))
@@ -394,13 +643,15 @@ class AntaInventory(dict[str, AntaDevice]):
         Each hosts is dumped individually.
         """
         hosts = [
-            AntaInventoryHost(
+            AntaInventoryHost(name=name, host=name, tags=device.device_tags(name), disable_cache=bool(device.kwargs.get("disable_cache")))
+            if isinstance(device, _LazyDevices)
+            else AntaInventoryHost(
                 name=device.name,
                 host=device.host if not self.is_base_class(device) else device.name,
                 port=device.port if not self.is_base_class(device) else None,
                 tags=device.tags,
                 disable_cache=device.cache is None,
             )
-            for device in self.devices
+            for name, device in self._raw_items()
         ]
         return AntaInventoryInput(hosts=hosts)
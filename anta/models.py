@@ -9,22 +9,29 @@ import hashlib
 import logging
 import re
 from abc import ABC, abstractmethod
-from functools import wraps
+from copy import deepcopy
+from functools import lru_cache, wraps
+from inspect import unwrap
 from string import Formatter
+from types import CodeType
 from typing import TYPE_CHECKING, Any, ClassVar, Literal
 
-from pydantic import BaseModel, ConfigDict, ValidationError, create_model, field_serializer
+from pydantic import BaseModel, ConfigDict, PositiveInt, ValidationError, create_model, field_serializer, model_validator
 
+from anta._readonly import ReadOnlyDict, freeze
 from anta.constants import EOS_BLACKLIST_CMDS, KNOWN_EOS_ERRORS, UNSUPPORTED_PLATFORM_ERRORS
 from anta.custom_types import Revision
 from anta.logger import anta_log_exception, exc_to_str
 from anta.result_manager.models import TestResult
+from anta.settings import get_device_settings, get_tests_settings
+from anta.tools import OutputIndexes
 
 if TYPE_CHECKING:
-    from collections.abc import Callable, Coroutine
+    from collections.abc import Callable, Coroutine, Mapping
 
     from rich.progress import Progress, TaskID
 
+    from anta._planner import DeviceCommandPlan
     from anta.device import AntaDevice
 
 # Proper way to type input class - revisit this later if we get any issue @gmuloc
@@ -57,6 +64,14 @@ class AntaTemplate:
         eAPI output - json or text.
     use_cache
         Enable or disable caching for this AntaTemplate if the AntaDevice supports it.
+    cache_ttl
+        Time-to-live in seconds of the rendered commands outputs in the persistent cache. If None, the cache default is used.
+    fallback
+        Full-table command collected instead of the rendered commands when the inputs of the test render more commands than
+        the `ANTA_TESTS_NARROWING_THRESHOLD` setting. The test must handle the outputs of both the rendered commands and the fallback.
+    aggregate
+        Aggregate command collected once instead of the rendered commands when the inputs of the test render more commands than
+        the `ANTA_TESTS_AGGREGATION_THRESHOLD` setting. Its output is mapped to each rendered command by `AntaTest.map_aggregate()`.
     """
 
     # pylint: disable=too-few-public-methods
@@ -69,12 +84,18 @@ class AntaTemplate:
         ofmt: Literal["json", "text"] = "json",
         *,
         use_cache: bool = True,
+        cache_ttl: PositiveInt | None = None,
+        fallback: AntaCommand | None = None,
+        aggregate: AntaCommand | None = None,
     ) -> None:
         self.template = template
         self.version: Literal[1, "latest"] = version
         self.revision = revision
         self.ofmt: Literal["json", "text"] = ofmt
         self.use_cache = use_cache
+        self.cache_ttl = cache_ttl
+        self.fallback = fallback
+        self.aggregate = aggregate
 
         # Create a AntaTemplateParams model to elegantly store AntaTemplate variables
         field_names = [fname for _, fname, _, _ in Formatter().parse(self.template) if fname]
@@ -127,64 +148,24 @@ class AntaTemplate:
             template=self,
             params=self.params_schema(**params),
             use_cache=self.use_cache,
+            cache_ttl=self.cache_ttl,
         )
 
 
-class AntaCommand(BaseModel):
-    """Class to define a command.
-
-    !!! info
-        eAPI models are revisioned, this means that if a model is modified in a non-backwards compatible way, then its revision will be bumped up
-        (revisions are numbers, default value is 1).
+class _CommandOutput:
+    """Accessors of the output and errors of a command, shared by `AntaCommand` and `RuntimeCommand`."""
 
-        By default an eAPI request will return revision 1 of the model instance,
-        this ensures that older management software will not suddenly stop working when a switch is upgraded.
-        A **revision** applies to a particular CLI command whereas a **version** is global and is internally
-        translated to a specific **revision** for each CLI command in the RPC.
+    __slots__ = ()
 
-        __Revision has precedence over version.__
+    if TYPE_CHECKING:
+        output: dict[str, Any] | str | None
+        errors: list[str]
 
-    Attributes
-    ----------
-    command
-        Device command.
-    version
-        eAPI version - valid values are 1 or "latest".
-    revision
-        eAPI revision of the command. Valid values are 1 to 99. Revision has precedence over version.
-    ofmt
-        eAPI output - json or text.
-    output
-        Output of the command. Only defined if there was no errors.
-    template
-        AntaTemplate object used to render this command.
-    errors
-        If the command execution fails, eAPI returns a list of strings detailing the error(s).
-    params
-        Pydantic Model containing the variables values used to render the template.
-    use_cache
-        Enable or disable caching for this AntaCommand if the AntaDevice supports it.
-
-    """
-
-    model_config = ConfigDict(arbitrary_types_allowed=True)
-
-    command: str
-    version: Literal[1, "latest"] = "latest"
-    revision: Revision | None = None
-    ofmt: Literal["json", "text"] = "json"
-    output: dict[str, Any] | str | None = None
-    template: AntaTemplate | None = None
-    errors: list[str] = []
-    params: AntaParamsBaseModel = AntaParamsBaseModel()
-    use_cache: bool = True
-
-    @property
-    def uid(self) -> str:
-        """Generate a unique identifier for this command."""
-        uid_str = f"{self.command}_{self.version}_{self.revision or 'NA'}_{self.ofmt}"
-        # Ignoring S324 probable use of insecure hash function - sha1 is enough for our needs.
-        return hashlib.sha1(uid_str.encode()).hexdigest()  # noqa: S324
+        # Read-only in RuntimeCommand, pydantic fields in AntaCommand
+        @property
+        def command(self) -> str: ...
+        @property
+        def ofmt(self) -> Literal["json", "text"]: ...
 
     @property
     def json_output(self) -> dict[str, Any]:
@@ -195,7 +176,7 @@ class AntaCommand(BaseModel):
         if self.ofmt != "json" or not isinstance(self.output, dict):
             msg = f"Output of command '{self.command}' is invalid"
             raise RuntimeError(msg)
-        return dict(self.output)
+        return self.output
 
     @property
     def text_output(self) -> str:
@@ -273,6 +254,232 @@ class AntaCommand(BaseModel):
         return any(any(re.match(pattern, e) for e in self.errors) for pattern in KNOWN_EOS_ERRORS)
 
 
+@lru_cache(maxsize=4096)
+def _command_uid(command: str, version: Literal[1, "latest"], revision: int | None, ofmt: str) -> str:
+    """Return the unique identifier of a command."""
+    uid_str = f"{command}_{version}_{revision or 'NA'}_{ofmt}"
+    # Ignoring S324 probable use of insecure hash function - sha1 is enough for our needs.
+    return hashlib.sha1(uid_str.encode()).hexdigest()  # noqa: S324
+
+
+class AntaCommand(_CommandOutput, BaseModel):
+    """Class to define a command.
+
+    !!! info
+        eAPI models are revisioned, this means that if a model is modified in a non-backwards compatible way, then its revision will be bumped up
+        (revisions are numbers, default value is 1).
+
+        By default an eAPI request will return revision 1 of the model instance,
+        this ensures that older management software will not suddenly stop working when a switch is upgraded.
+        A **revision** applies to a particular CLI command whereas a **version** is global and is internally
+        translated to a specific **revision** for each CLI command in the RPC.
+
+        __Revision has precedence over version.__
+
+    Attributes
+    ----------
+    command
+        Device command.
+    version
+        eAPI version - valid values are 1 or "latest".
+    revision
+        eAPI revision of the command. Valid values are 1 to 99. Revision has precedence over version.
+    ofmt
+        eAPI output - json or text.
+    output
+        Output of the command. Only defined if there was no errors.
+    template
+        AntaTemplate object used to render this command.
+    errors
+        If the command execution fails, eAPI returns a list of strings detailing the error(s).
+    params
+        Pydantic Model containing the variables values used to render the template.
+    use_cache
+        Enable or disable caching for this AntaCommand if the AntaDevice supports it.
+    cache_ttl
+        Time-to-live in seconds of the command output in the persistent cache. If None, the cache default is used.
+
+    """
+
+    model_config = ConfigDict(arbitrary_types_allowed=True)
+
+    command: str
+    version: Literal[1, "latest"] = "latest"
+    revision: Revision | None = None
+    ofmt: Literal["json", "text"] = "json"
+    output: dict[str, Any] | str | None = None
+    template: AntaTemplate | None = None
+    errors: list[str] = []
+    params: AntaParamsBaseModel = AntaParamsBaseModel()
+    use_cache: bool = True
+    cache_ttl: PositiveInt | None = None
+
+    @model_validator(mode="before")
+    @classmethod
+    def _validate_runtime_command(cls, data: Any) -> Any:  # noqa: ANN401
+        """Validate a RuntimeCommand as the AntaCommand it wraps, with its output and errors."""
+        if isinstance(data, RuntimeCommand):
+            return {**dict(data.definition), "output": data.output, "errors": list(data.errors)}
+        return data
+
+    @property
+    def uid(self) -> str:
+        """Generate a unique identifier for this command.
+
+        The identifier is memoized per command string, version, revision and output format.
+        """
+        return _command_uid(self.command, self.version, self.revision, self.ofmt)
+
+    @property
+    def json_output(self) -> dict[str, Any]:
+        """Get the command output as JSON. Returns a shallow copy of the output."""
+        return dict(super().json_output)
+
+
+class RuntimeCommand(_CommandOutput):
+    """Lightweight representation of a command collected by an AntaTest instance.
+
+    `AntaCommand` is the public model used to define, render and serialize commands. At runtime, the test
+    instances sharing the same rendered `AntaCommand`, e.g. the instances of a test definition across the
+    devices of a run, wrap it in a `RuntimeCommand` which only carries the output and errors of the instance.
+    The other attributes are read from the wrapped `AntaCommand` and the unique identifier is memoized.
+
+    A `RuntimeCommand` exposes the attributes of `AntaCommand` and its `model_copy()`, `model_dump()` and
+    `model_dump_json()` methods. Only `output` and `errors` can be assigned, and it is not an instance of
+    `AntaCommand`: use `to_command()` to get an `AntaCommand` with the output and errors of the `RuntimeCommand`.
+    Pydantic models with `AntaCommand` fields validate a `RuntimeCommand` as such an `AntaCommand`.
+
+    The output can be shared with the other tests requiring the same command. Like `AntaCommand.json_output`,
+    `json_output` returns a shallow copy of the output, unless the output is read-only.
+
+    Attributes
+    ----------
+    definition
+        The wrapped AntaCommand. Never modified by the collection.
+    output
+        Output of the command. Only defined if there was no errors.
+    errors
+        If the command execution fails, eAPI returns a list of strings detailing the error(s).
+    """
+
+    __slots__ = ("_indexes", "_uid", "definition", "errors", "output")
+
+    def __init__(self, definition: AntaCommand) -> None:
+        """Initialize a RuntimeCommand.
+
+        Parameters
+        ----------
+        definition
+            The AntaCommand to wrap. Its output and errors are used as initial values.
+        """
+        self.definition = definition
+        self.output: dict[str, Any] | str | None = definition.output
+        self.errors: list[str] = list(definition.errors)
+        self._uid: str | None = None
+        self._indexes: OutputIndexes | None = None
+
+    def __repr__(self) -> str:
+        """Return a printable representation of a RuntimeCommand."""
+        return f"RuntimeCommand(command={self.command!r}, ofmt={self.ofmt!r}, output={self.output!r}, errors={self.errors!r})"
+
+    @property
+    def command(self) -> str:
+        """Device command."""
+        return self.definition.command
+
+    @property
+    def version(self) -> Literal[1, "latest"]:
+        """Version of eAPI used to collect the command."""
+        return self.definition.version
+
+    @property
+    def revision(self) -> Revision | None:
+        """Revision of the eAPI model of the command."""
+        return self.definition.revision
+
+    @property
+    def ofmt(self) -> Literal["json", "text"]:
+        """Output format of the command, json or text."""
+        return self.definition.ofmt
+
+    @property
+    def template(self) -> AntaTemplate | None:
+        """AntaTemplate object used to render the command."""
+        return self.definition.template
+
+    @property
+    def params(self) -> AntaParamsBaseModel:
+        """Pydantic Model containing the variables values used to render the template."""
+        return self.definition.params
+
+    @property
+    def use_cache(self) -> bool:
+        """Enable or disable caching for the command if the AntaDevice supports it."""
+        return self.definition.use_cache
+
+    @property
+    def cache_ttl(self) -> int | None:
+        """Time-to-live in seconds of the command output in the persistent cache."""
+        return self.definition.cache_ttl
+
+    @property
+    def uid(self) -> str:
+        """Unique identifier of the command, computed once."""
+        if self._uid is None:
+            self._uid = self.definition.uid
+        return self._uid
+
+    @property
+    def json_output(self) -> dict[str, Any]:
+        """Get the command output as JSON.
+
+        Returns a shallow copy of the output on each access, as the nested data is shared with the other tests requiring the
+        same command and must not be modified. The nested data is not protected against mutations: only read-only outputs,
+        see the `readonly_outputs` device setting, are returned without copy.
+        """
+        output = super().json_output
+        return output if isinstance(output, ReadOnlyDict) else dict(output)
+
+    @property
+    def indexes(self) -> OutputIndexes:
+        """Indexes of the output data, shared with the other commands holding the same output. See `anta.tools.OutputIndex`."""
+        if self._indexes is None or self._indexes.output is not self.output:
+            self._indexes = OutputIndexes.of(self.output)
+        return self._indexes
+
+    def to_command(self) -> AntaCommand:
+        """Return a copy of the wrapped AntaCommand with the output and errors of this RuntimeCommand."""
+        return self.definition.model_copy(update={"output": self.output, "errors": list(self.errors)})
+
+    def model_copy(self, *, update: Mapping[str, Any] | None = None, deep: bool = False) -> RuntimeCommand:
+        """Return a copy of this RuntimeCommand, mirroring `AntaCommand.model_copy()`.
+
+        Parameters
+        ----------
+        update
+            Values to change in the copy. Values other than `output` and `errors` are changed in a copy of the wrapped AntaCommand.
+        deep
+            Set to True to make a deep copy of the output and of the wrapped AntaCommand.
+        """
+        update = dict(update or {})
+        output = update.pop("output", self.output)
+        errors = update.pop("errors", self.errors)
+        definition = self.definition.model_copy(update=update, deep=deep) if update or deep else self.definition
+        copy = RuntimeCommand(definition)
+        copy.output = deepcopy(output) if deep else output
+        copy.errors = list(errors)
+        copy._uid = self._uid if definition is self.definition else None
+        return copy
+
+    def model_dump(self, **kwargs: Any) -> dict[str, Any]:  # noqa: ANN401
+        """Return the dictionary representation of the command, mirroring `AntaCommand.model_dump()`."""
+        return self.to_command().model_dump(**kwargs)
+
+    def model_dump_json(self, **kwargs: Any) -> str:  # noqa: ANN401
+        """Return the JSON representation of the command, mirroring `AntaCommand.model_dump_json()`."""
+        return self.to_command().model_dump_json(**kwargs)
+
+
 class AntaTemplateRenderError(RuntimeError):
     """Raised when an AntaTemplate object could not be rendered because of missing parameters."""
 
@@ -292,6 +499,17 @@ class AntaTemplateRenderError(RuntimeError):
         super().__init__(f"'{self.key}' was not provided for template '{self.template.template}'")
 
 
+def _reads_device(function: Callable[..., Any]) -> bool:
+    """Return True if the code of a function, including its nested functions and comprehensions, reads a `device` name or attribute."""
+    codes = [unwrap(function).__code__]
+    while codes:
+        code = codes.pop()
+        if "device" in code.co_names or "device" in code.co_varnames:
+            return True
+        codes.extend(const for const in code.co_consts if isinstance(const, CodeType))
+    return False
+
+
 class AntaTest(ABC):
     """Abstract class defining a test in ANTA.
 
@@ -337,11 +555,16 @@ class AntaTest(ABC):
     inputs
         AntaTest.Input instance carrying the test inputs.
     instance_commands
-        List of AntaCommand instances of this test.
+        List of RuntimeCommand instances of this test, wrapping the rendered AntaCommand instances.
     result
         TestResult instance representing the result of this test.
     logger
         Python logger for this test instance.
+    command_plan
+        Command collection plan of the device shared with the other tests of the run. Set by the runner,
+        None when the test collects its commands directly from the device.
+    aggregations
+        Aggregate commands collected instead of the rendered commands of their template, mapped to these rendered commands.
     """
 
     # Mandatory class variables (enforced at runtime by __init_subclass__)
@@ -351,6 +574,8 @@ class AntaTest(ABC):
     # Optional class variables (auto-populated if not set)
     name: ClassVar[str]
     description: ClassVar[str]
+    # Whether `render()` depends on the device, set to True if the `render()` method of the class reads the device
+    render_per_device: ClassVar[bool] = False
 
     # Internal class variable set by the `deprecated_test_class` decorator
     __removal_in_version: ClassVar[str]
@@ -365,9 +590,11 @@ class AntaTest(ABC):
     # Instance attributes
     device: AntaDevice
     inputs: AntaTest.Input
-    instance_commands: list[AntaCommand]
+    instance_commands: list[RuntimeCommand]
     result: TestResult
     logger: logging.Logger
+    command_plan: DeviceCommandPlan | None = None
+    aggregations: list[tuple[RuntimeCommand, list[RuntimeCommand]]]
 
     class Input(BaseModel):
         """Class defining inputs for a test in ANTA.
@@ -444,6 +671,8 @@ class AntaTest(ABC):
         device: AntaDevice,
         inputs: dict[str, Any] | AntaTest.Input | None = None,
         eos_data: list[dict[str, Any] | str] | None = None,
+        *,
+        commands: list[AntaCommand] | None = None,
     ) -> None:
         """Initialize an AntaTest instance.
 
@@ -456,14 +685,18 @@ class AntaTest(ABC):
         eos_data
             Populate outputs of the test commands instead of collecting from devices.
             This list must have the same length and order than the `instance_commands` instance attribute.
+        commands
+            Commands already rendered from the same inputs by another instance of this test, e.g. for another device.
+            The `instance_commands` instance attribute wraps these commands instead of rendering them again.
         """
         self.logger = logging.getLogger(f"{self.module}.{self.__class__.__name__}")
         self.device = device
         self.instance_commands = []
+        self.aggregations = []
         self.result = TestResult(name=device.name, test=self.name, categories=self.categories, description=self.description)
         self._init_inputs(inputs)
         if hasattr(self, "inputs"):
-            self._init_commands(eos_data)
+            self._init_commands(eos_data, commands)
             if res_ow := self.inputs.result_overwrite:
                 if res_ow.categories:
                     self.result.categories = res_ow.categories
@@ -489,11 +722,14 @@ class AntaTest(ABC):
             self.logger.error(message)
             self.result.is_error(message=message)
 
-    def _init_commands(self, eos_data: list[dict[str, Any] | str] | None) -> None:
+    def _init_commands(self, eos_data: list[dict[str, Any] | str] | None, commands: list[AntaCommand] | None = None) -> None:
         """Instantiate the `instance_commands` instance attribute from the `commands` class attribute.
 
-        - Copy of the `AntaCommand` instances
-        - Render all `AntaTemplate` instances using the `render()` method.
+        - Wrap the `AntaCommand` instances in `RuntimeCommand` instances
+        - Render all `AntaTemplate` instances using the `render()` method and wrap the rendered commands.
+          The fallback of an `AntaTemplate` replaces its rendered commands when they exceed the narrowing threshold.
+
+        If already rendered `commands` are provided, these commands are wrapped instead.
 
         Any template rendering error will set this test result status as 'error'.
         Any exception in user code in `render()` will set this test result status as 'error'.
@@ -501,43 +737,72 @@ class AntaTest(ABC):
         if not self.__class__.commands:
             return
 
-        for cmd in self.__class__.commands:
-            if isinstance(cmd, AntaCommand):
-                self.instance_commands.append(cmd.model_copy())
-                continue
-
-            # Try to render the AntaTemplate
-            try:
-                self.instance_commands.extend(self.render(cmd))
-            except AntaTemplateRenderError as e:
-                self.result.is_error(message=f"Cannot render template {{{e.template}}}")
-                return
-            except NotImplementedError as e:
-                self.result.is_error(message=e.args[0])
-                return
-            except Exception as e:  # noqa: BLE001
-                # render() is user-defined code.
-                # We need to catch everything if we want the AntaTest object
-                # to live until the reporting
-                message = f"Exception in {self.module}.{self.__class__.__name__}.render()"
-                anta_log_exception(e, message, self.logger)
-                self.result.is_error(message=f"{message}: {exc_to_str(e)}")
-                return
+        if commands is not None:
+            self.instance_commands = [RuntimeCommand(command) for command in commands]
+        else:
+            for cmd in self.__class__.commands:
+                if isinstance(cmd, AntaCommand):
+                    self.instance_commands.append(RuntimeCommand(cmd))
+                    continue
+
+                # Try to render the AntaTemplate
+                try:
+                    rendered_commands = self.render(cmd)
+                    if cmd.fallback is not None and len(rendered_commands) > get_tests_settings().narrowing_threshold:
+                        rendered_commands = [cmd.fallback]
+                    self.instance_commands.extend(RuntimeCommand(command) for command in rendered_commands)
+                except AntaTemplateRenderError as e:
+                    self.result.is_error(message=f"Cannot render template {{{e.template}}}")
+                    return
+                except NotImplementedError as e:
+                    self.result.is_error(message=e.args[0])
+                    return
+                except Exception as e:  # noqa: BLE001
+                    # render() is user-defined code.
+                    # We need to catch everything if we want the AntaTest object
+                    # to live until the reporting
+                    message = f"Exception in {self.module}.{self.__class__.__name__}.render()"
+                    anta_log_exception(e, message, self.logger)
+                    self.result.is_error(message=f"{message}: {exc_to_str(e)}")
+                    return
+
+        self._init_aggregations()
 
         if eos_data is not None:
             self.logger.debug("Test %s initialized with input data", self.name)
             self.save_commands_data(eos_data)
 
+    def _init_aggregations(self) -> None:
+        """Instantiate the `aggregations` instance attribute from the templates with an aggregate command.
+
+        The rendered commands of a template are replaced by its aggregate command in the collection when they exceed the aggregation threshold.
+        """
+        if (threshold := get_tests_settings().aggregation_threshold) == 0:
+            return
+        rendered_commands: dict[AntaTemplate, list[RuntimeCommand]] = {}
+        for command in self.instance_commands:
+            if command.template is not None and command.template.aggregate is not None:
+                rendered_commands.setdefault(command.template, []).append(command)
+        self.aggregations = [
+            (RuntimeCommand(template.aggregate), commands)
+            for template, commands in rendered_commands.items()
+            if template.aggregate is not None and len(commands) > threshold
+        ]
+
     def save_commands_data(self, eos_data: list[dict[str, Any] | str]) -> None:
-        """Populate output of all AntaCommand instances in `instance_commands`."""
+        """Populate output of all RuntimeCommand instances in `instance_commands`.
+
+        The outputs are converted to read-only containers when the `readonly_outputs` device setting is enabled.
+        """
         if len(eos_data) > len(self.instance_commands):
             self.result.is_error(message="Test initialization error: Trying to save more data than there are commands for the test")
             return
         if len(eos_data) < len(self.instance_commands):
             self.result.is_error(message="Test initialization error: Trying to save less data than there are commands for the test")
             return
+        readonly_outputs = get_device_settings().readonly_outputs
         for index, data in enumerate(eos_data or []):
-            self.instance_commands[index].output = data
+            self.instance_commands[index].output = freeze(data) if readonly_outputs else data
 
     def __init_subclass__(cls) -> None:
         """Verify that the mandatory class attributes are defined and set name and description if not set."""
@@ -553,6 +818,9 @@ class AntaTest(ABC):
                 msg = f"Cannot set the description for class {cls.name}, either set it in the class definition or add a docstring to the class."
                 raise AttributeError(msg)
             cls.description = cls.__doc__.split(sep="\n", maxsplit=1)[0]
+        if "render_per_device" not in cls.__dict__ and "render" in cls.__dict__:
+            # The commands rendered by a render() method reading the device depend on the device
+            cls.render_per_device = _reads_device(cls.render)
 
     @property
     def module(self) -> str:
@@ -565,9 +833,17 @@ class AntaTest(ABC):
         return all(command.collected for command in self.instance_commands)
 
     @property
-    def failed_commands(self) -> list[AntaCommand]:
+    def commands_to_collect(self) -> list[RuntimeCommand]:
+        """Return the commands collected from the device, i.e. the instance commands with the aggregated commands replaced by their aggregate command."""
+        if not self.aggregations:
+            return self.instance_commands
+        aggregated = {id(command) for _, commands in self.aggregations for command in commands}
+        return [command for command in self.instance_commands if id(command) not in aggregated] + [aggregate for aggregate, _ in self.aggregations]
+
+    @property
+    def failed_commands(self) -> list[RuntimeCommand]:
         """Return a list of all the commands that have failed."""
-        return [command for command in self.instance_commands if command.error]
+        return [command for command in self.commands_to_collect if command.error]
 
     def render(self, template: AntaTemplate) -> list[AntaCommand]:
         """Render an AntaTemplate instance of this AntaTest using the provided AntaTest.Input instance at self.inputs.
@@ -599,7 +875,11 @@ class AntaTest(ABC):
         """Collect outputs of all commands of this test class from the device of this test instance."""
         try:
             if self.blocked is False:
-                await self.device.collect_commands(self.instance_commands, collection_id=self.name)
+                if self.command_plan is not None:
+                    await self.command_plan.collect_commands(self.commands_to_collect, collection_id=self.name)
+                else:
+                    await self.device.collect_commands(self.commands_to_collect, collection_id=self.name)
+                self._map_aggregations()
         except Exception as e:  # noqa: BLE001
             # device._collect() is user-defined code.
             # We need to catch everything if we want the AntaTest object
@@ -608,6 +888,25 @@ class AntaTest(ABC):
             anta_log_exception(e, message, self.logger)
             self.result.is_error(message=exc_to_str(e))
 
+    def map_aggregate(self, command: RuntimeCommand, output: dict[str, Any] | str) -> dict[str, Any] | str:
+        """Return the output of a rendered command from the output of the aggregate command of its template.
+
+        The default implementation returns the output of the aggregate command unchanged, for the tests looking up the
+        parameters of their rendered commands in an output with the same structure. Override it otherwise.
+        """
+        _ = command
+        return output
+
+    def _map_aggregations(self) -> None:
+        """Populate the output of the aggregated commands from the output of their collected aggregate command."""
+        readonly_outputs = get_device_settings().readonly_outputs
+        for aggregate, commands in self.aggregations:
+            if aggregate.output is None:
+                continue
+            for command in commands:
+                output = self.map_aggregate(command, aggregate.output)
+                command.output = freeze(output) if readonly_outputs and output is not aggregate.output else output
+
     @staticmethod
     def anta_test(function: Callable[..., Any]) -> Callable[..., Coroutine[Any, Any, TestResult]]:
         """Decorate the `test()` method in child classes.
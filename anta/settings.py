@@ -9,8 +9,9 @@ import logging
 import os
 import sys
 from functools import cache
+from pathlib import Path
 
-from pydantic import Field, PositiveInt, PrivateAttr, ValidationError, model_validator
+from pydantic import Field, NonNegativeFloat, NonNegativeInt, PositiveFloat, PositiveInt, PrivateAttr, ValidationError, model_validator
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
 from anta.logger import exc_to_str
@@ -23,9 +24,57 @@ DEFAULT_MAX_CONCURRENCY = 50000
 DEFAULT_NOFILE = 16384
 """Default value for the maximum number of open file descriptors for the ANTA process."""
 
+DEFAULT_WORKERS = 1
+"""Default value for the number of worker processes running the tests. A value of 1 runs the tests in the ANTA process."""
+
 DEFAULT_HTTPX_TRUST_ENV = True
 """Default value for the trust_env parameter of the HTTPX client."""
 
+DEFAULT_DEVICE_BATCH_SIZE = 1
+"""Default value for the maximum number of commands sent in a single eAPI request. A value of 1 disables batching."""
+
+DEFAULT_DEVICE_BATCH_WINDOW = 0.01
+"""Default value in seconds for the time window during which commands are coalesced into a single eAPI request."""
+
+DEFAULT_DEVICE_MAX_CONCURRENCY = 100
+"""Default value for the maximum concurrency window of eAPI requests per device (HTTPX connection pool default).
+
+Limiting concurrency avoids high-concurrency performance issues, see https://github.com/encode/httpx/issues/3215.
+"""
+
+DEFAULT_DEVICE_MIN_CONCURRENCY = 1
+"""Default value for the minimum concurrency window of eAPI requests per device."""
+
+DEFAULT_DEVICE_CIRCUIT_BREAKER_THRESHOLD = 5
+"""Default value for the number of consecutive transport failures opening the circuit breaker of a device."""
+
+DEFAULT_DEVICE_CIRCUIT_BREAKER_COOLDOWN = 30.0
+"""Default value in seconds before probing a device once its circuit breaker is open."""
+
+DEFAULT_CACHE_TTL = 60
+"""Default value in seconds for the time-to-live of the entries of the persistent command output cache."""
+
+DEFAULT_DISCOVERY_TIMEOUT = 2.0
+"""Default value in seconds for the connect timeout of the eAPI port checks of the discovery sweep."""
+
+DEFAULT_DISCOVERY_MAX_CONCURRENCY = 500
+"""Default value for the maximum number of concurrent eAPI port checks of the discovery sweep."""
+
+DEFAULT_DISCOVERY_CACHE_TTL = 3600
+"""Default value in seconds for the time-to-live of the open eAPI ports persisted in the discovery cache file."""
+
+DEFAULT_DISCOVERY_CACHE_NEGATIVE_TTL = 60
+"""Default value in seconds for the time-to-live of the closed eAPI ports persisted in the discovery cache file."""
+
+DEFAULT_FACTS_TTL = 3600
+"""Default value in seconds after which the persisted device facts are stale."""
+
+DEFAULT_TESTS_NARROWING_THRESHOLD = 0
+"""Default value for the maximum number of targeted commands rendered by a test before collecting its full-table command instead."""
+
+DEFAULT_TESTS_AGGREGATION_THRESHOLD = 0
+"""Default value for the maximum number of commands rendered from a template before collecting its aggregate command instead."""
+
 
 class AntaRunnerSettings(BaseSettings):
     """Environment variables for configuring the ANTA runner.
@@ -50,12 +99,20 @@ class AntaRunnerSettings(BaseSettings):
         Environment variable: ANTA_MAX_CONCURRENCY
 
         The maximum number of concurrent tests that can run in the event loop. Defaults to 50000.
+
+    workers : PositiveInt
+        Environment variable: ANTA_WORKERS
+
+        The number of worker processes running the tests. When greater than 1, the filtered inventory is sharded
+        across spawned worker processes, each running its own event loop. The `nofile` and `max_concurrency` limits
+        apply to each worker process. Defaults to 1.
     """
 
     model_config = SettingsConfigDict(env_prefix="ANTA_")
 
     nofile: PositiveInt = Field(default=DEFAULT_NOFILE)
     max_concurrency: PositiveInt = Field(default=DEFAULT_MAX_CONCURRENCY)
+    workers: PositiveInt = Field(default=DEFAULT_WORKERS)
 
     _file_descriptor_limit: PositiveInt = PrivateAttr()
 
@@ -111,6 +168,211 @@ class AntaHttpxSettings(BaseSettings):
     trust_env: bool = Field(default=DEFAULT_HTTPX_TRUST_ENV)
 
 
+class AntaDeviceSettings(BaseSettings):
+    """Environment variables for configuring ANTA devices.
+
+    When initialized, relevant environment variables are loaded. If not set, default values are used.
+
+    Attributes
+    ----------
+    batch_size : PositiveInt
+        Environment variable: ANTA_DEVICE_BATCH_SIZE
+
+        The maximum number of commands coalesced into a single eAPI request by `AsyncEOSDevice`.
+        Defaults to 1, which disables batching.
+
+    batch_window : NonNegativeFloat
+        Environment variable: ANTA_DEVICE_BATCH_WINDOW
+
+        The time window in seconds during which `AsyncEOSDevice` waits for other commands to coalesce
+        before sending an eAPI request. Only used when batching is enabled. Defaults to 0.01.
+
+    max_concurrency : PositiveInt
+        Environment variable: ANTA_DEVICE_MAX_CONCURRENCY
+
+        The maximum number of concurrent eAPI requests per device. The concurrency window of each device starts at
+        this value and adapts at runtime to the observed timeouts, HTTP 5xx errors and latency. Defaults to 100.
+
+    min_concurrency : PositiveInt
+        Environment variable: ANTA_DEVICE_MIN_CONCURRENCY
+
+        The minimum concurrency window of eAPI requests per device. Defaults to 1.
+
+    latency_threshold : PositiveFloat | None
+        Environment variable: ANTA_DEVICE_LATENCY_THRESHOLD
+
+        The eAPI request latency in seconds above which the concurrency window of the device is decreased.
+        Defaults to None, which disables latency-based adaptation.
+
+    circuit_breaker_threshold : NonNegativeInt
+        Environment variable: ANTA_DEVICE_CIRCUIT_BREAKER_THRESHOLD
+
+        The number of consecutive transport failures (timeouts or connection errors) after which the remaining
+        collections on the device fail immediately. Defaults to 5. A value of 0 disables the circuit breaker.
+
+    circuit_breaker_cooldown : NonNegativeFloat
+        Environment variable: ANTA_DEVICE_CIRCUIT_BREAKER_COOLDOWN
+
+        The time in seconds after which a device with an open circuit breaker is probed before resuming the collections.
+        Defaults to 30.
+
+    readonly_outputs : bool
+        Environment variable: ANTA_DEVICE_READONLY_OUTPUTS
+
+        When True, the collected command outputs are converted to read-only containers raising a TypeError on any
+        attempted mutation. Intended to find tests modifying the outputs shared with other tests. Defaults to False.
+    """
+
+    model_config = SettingsConfigDict(env_prefix="ANTA_DEVICE_")
+
+    batch_size: PositiveInt = Field(default=DEFAULT_DEVICE_BATCH_SIZE)
+    batch_window: NonNegativeFloat = Field(default=DEFAULT_DEVICE_BATCH_WINDOW)
+    max_concurrency: PositiveInt = Field(default=DEFAULT_DEVICE_MAX_CONCURRENCY)
+    min_concurrency: PositiveInt = Field(default=DEFAULT_DEVICE_MIN_CONCURRENCY)
+    latency_threshold: PositiveFloat | None = Field(default=None)
+    circuit_breaker_threshold: NonNegativeInt = Field(default=DEFAULT_DEVICE_CIRCUIT_BREAKER_THRESHOLD)
+    circuit_breaker_cooldown: NonNegativeFloat = Field(default=DEFAULT_DEVICE_CIRCUIT_BREAKER_COOLDOWN)
+    readonly_outputs: bool = Field(default=False)
+
+    @model_validator(mode="after")
+    def validate_concurrency(self) -> AntaDeviceSettings:
+        """Validate that the minimum concurrency window does not exceed the maximum."""
+        if self.min_concurrency > self.max_concurrency:
+            msg = f"min_concurrency ({self.min_concurrency}) must be lower than or equal to max_concurrency ({self.max_concurrency})"
+            raise ValueError(msg)
+        return self
+
+
+class AntaCacheSettings(BaseSettings):
+    """Environment variables for configuring the ANTA command output cache.
+
+    When initialized, relevant environment variables are loaded. If not set, default values are used.
+
+    Attributes
+    ----------
+    path : Path | None
+        Environment variable: ANTA_CACHE_PATH
+
+        Path of the SQLite database used to persist the command outputs across ANTA runs.
+        The database can be shared by several ANTA processes. Defaults to None, which disables the persistent cache.
+
+    ttl : PositiveInt
+        Environment variable: ANTA_CACHE_TTL
+
+        The time-to-live in seconds of the persistent cache entries, unless overridden by the `cache_ttl`
+        attribute of the command or template. Defaults to 60.
+    """
+
+    model_config = SettingsConfigDict(env_prefix="ANTA_CACHE_")
+
+    path: Path | None = Field(default=None)
+    ttl: PositiveInt = Field(default=DEFAULT_CACHE_TTL)
+
+
+class AntaDiscoverySettings(BaseSettings):
+    """Environment variables for configuring the discovery sweep of the inventory network and range sections.
+
+    When initialized, relevant environment variables are loaded. If not set, default values are used.
+
+    Attributes
+    ----------
+    enabled : bool
+        Environment variable: ANTA_DISCOVERY_ENABLED
+
+        Set to False to refresh all the devices of the network and range sections without checking their eAPI port first.
+        Defaults to True.
+
+    timeout : PositiveFloat
+        Environment variable: ANTA_DISCOVERY_TIMEOUT
+
+        The connect timeout in seconds of the eAPI port checks. Defaults to 2.
+
+    max_concurrency : PositiveInt
+        Environment variable: ANTA_DISCOVERY_MAX_CONCURRENCY
+
+        The maximum number of concurrent eAPI port checks. Defaults to 500.
+
+    cache_path : Path | None
+        Environment variable: ANTA_DISCOVERY_CACHE_PATH
+
+        Path of the JSON file used to persist the port check results across ANTA runs.
+        Defaults to None, which disables the discovery cache.
+
+    cache_ttl : PositiveInt
+        Environment variable: ANTA_DISCOVERY_CACHE_TTL
+
+        The time-to-live in seconds of the open eAPI ports persisted in the discovery cache. Defaults to 3600.
+
+    cache_negative_ttl : PositiveInt
+        Environment variable: ANTA_DISCOVERY_CACHE_NEGATIVE_TTL
+
+        The time-to-live in seconds of the closed eAPI ports persisted in the discovery cache. Shorter than `cache_ttl`
+        so that a device which was briefly unreachable or has just been provisioned is checked again by the next runs. Defaults to 60.
+    """
+
+    model_config = SettingsConfigDict(env_prefix="ANTA_DISCOVERY_")
+
+    enabled: bool = Field(default=True)
+    timeout: PositiveFloat = Field(default=DEFAULT_DISCOVERY_TIMEOUT)
+    max_concurrency: PositiveInt = Field(default=DEFAULT_DISCOVERY_MAX_CONCURRENCY)
+    cache_path: Path | None = Field(default=None)
+    cache_ttl: PositiveInt = Field(default=DEFAULT_DISCOVERY_CACHE_TTL)
+    cache_negative_ttl: PositiveInt = Field(default=DEFAULT_DISCOVERY_CACHE_NEGATIVE_TTL)
+
+
+class AntaFactsSettings(BaseSettings):
+    """Environment variables for configuring the device facts persisted across ANTA runs.
+
+    When initialized, relevant environment variables are loaded. If not set, default values are used.
+
+    Attributes
+    ----------
+    path : Path | None
+        Environment variable: ANTA_FACTS_PATH
+
+        Path of the JSON file used to persist the facts of the established devices, e.g. their hardware model, across ANTA runs.
+        The devices with fresh facts are not refreshed when connecting the inventory. Defaults to None, which disables the device facts.
+
+    ttl : PositiveInt
+        Environment variable: ANTA_FACTS_TTL
+
+        The time in seconds after which the persisted facts of a device are stale and the device is refreshed again. Defaults to 3600.
+    """
+
+    model_config = SettingsConfigDict(env_prefix="ANTA_FACTS_")
+
+    path: Path | None = Field(default=None)
+    ttl: PositiveInt = Field(default=DEFAULT_FACTS_TTL)
+
+
+class AntaTestsSettings(BaseSettings):
+    """Environment variables for configuring the commands of ANTA tests.
+
+    When initialized, relevant environment variables are loaded. If not set, default values are used.
+
+    Attributes
+    ----------
+    narrowing_threshold : NonNegativeInt
+        Environment variable: ANTA_TESTS_NARROWING_THRESHOLD
+
+        The maximum number of targeted commands, e.g. `show interfaces Ethernet1`, rendered from the inputs of a test with
+        a full-table command fallback, e.g. `show interfaces`. Beyond this number, the full-table command is collected instead.
+        Defaults to 0, which always collects the full-table commands.
+
+    aggregation_threshold : NonNegativeInt
+        Environment variable: ANTA_TESTS_AGGREGATION_THRESHOLD
+
+        The maximum number of commands rendered from a template with an aggregate command, e.g. `show spanning-tree vlan {vlan}`
+        for `show spanning-tree vlan detail`. Beyond this number, the aggregate command is collected once instead and its output
+        is mapped to each rendered command. Defaults to 0, which disables the aggregation.
+    """
+
+    model_config = SettingsConfigDict(env_prefix="ANTA_TESTS_")
+
+    narrowing_threshold: NonNegativeInt = Field(default=DEFAULT_TESTS_NARROWING_THRESHOLD)
+    aggregation_threshold: NonNegativeInt = Field(default=DEFAULT_TESTS_AGGREGATION_THRESHOLD)
+
+
 @cache
 def get_httpx_settings() -> AntaHttpxSettings:
     """Return the cached ANTA HTTPX settings loaded from environment variables.
@@ -130,3 +392,108 @@ def get_httpx_settings() -> AntaHttpxSettings:
     except ValidationError as exc:
         msg = f"Failed to load ANTA HTTPX settings. Check ANTA_HTTPX_* environment variables: {exc_to_str(exc)}"
         raise ValueError(msg) from exc
+
+
+@cache
+def get_device_settings() -> AntaDeviceSettings:
+    """Return the cached ANTA device settings loaded from environment variables.
+
+    Returns
+    -------
+    AntaDeviceSettings
+        The device settings instance populated from `ANTA_DEVICE_*` environment variables.
+
+    Raises
+    ------
+    ValueError
+        If any `ANTA_DEVICE_*` environment variable has an invalid value.
+    """
+    try:
+        return AntaDeviceSettings()
+    except ValidationError as exc:
+        msg = f"Failed to load ANTA device settings. Check ANTA_DEVICE_* environment variables: {exc_to_str(exc)}"
+        raise ValueError(msg) from exc
+
+
+@cache
+def get_cache_settings() -> AntaCacheSettings:
+    """Return the cached ANTA cache settings loaded from environment variables.
+
+    Returns
+    -------
+    AntaCacheSettings
+        The cache settings instance populated from `ANTA_CACHE_*` environment variables.
+
+    Raises
+    ------
+    ValueError
+        If any `ANTA_CACHE_*` environment variable has an invalid value.
+    """
+    try:
+        return AntaCacheSettings()
+    except ValidationError as exc:
+        msg = f"Failed to load ANTA cache settings. Check ANTA_CACHE_* environment variables: {exc_to_str(exc)}"
+        raise ValueError(msg) from exc
+
+
+@cache
+def get_discovery_settings() -> AntaDiscoverySettings:
+    """Return the cached ANTA discovery settings loaded from environment variables.
+
+    Returns
+    -------
+    AntaDiscoverySettings
+        The discovery settings instance populated from `ANTA_DISCOVERY_*` environment variables.
+
+    Raises
+    ------
+    ValueError
+        If any `ANTA_DISCOVERY_*` environment variable has an invalid value.
+    """
+    try:
+        return AntaDiscoverySettings()
+    except ValidationError as exc:
+        msg = f"Failed to load ANTA discovery settings. Check ANTA_DISCOVERY_* environment variables: {exc_to_str(exc)}"
+        raise ValueError(msg) from exc
+
+
+@cache
+def get_facts_settings() -> AntaFactsSettings:
+    """Return the cached ANTA device facts settings loaded from environment variables.
+
+    Returns
+    -------
+    AntaFactsSettings
+        The device facts settings instance populated from `ANTA_FACTS_*` environment variables.
+
+    Raises
+    ------
+    ValueError
+        If any `ANTA_FACTS_*` environment variable has an invalid value.
+    """
+    try:
+        return AntaFactsSettings()
+    except ValidationError as exc:
+        msg = f"Failed to load ANTA device facts settings. Check ANTA_FACTS_* environment variables: {exc_to_str(exc)}"
+        raise ValueError(msg) from exc
+
+
+@cache
+def get_tests_settings() -> AntaTestsSettings:
+    """Return the cached ANTA tests settings loaded from environment variables.
+
+    Returns
+    -------
+    AntaTestsSettings
+        The tests settings instance populated from `ANTA_TESTS_*` environment variables.
+
+    Raises
+    ------
+    ValueError
+        If any `ANTA_TESTS_*` environment variable has an invalid value.
+    """
+    try:
+        return AntaTestsSettings()
+    except ValidationError as exc:
+        msg = f"Failed to load ANTA tests settings. Check ANTA_TESTS_* environment variables: {exc_to_str(exc)}"
+        raise ValueError(msg) from exc
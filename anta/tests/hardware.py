@@ -125,7 +125,7 @@ class VerifyTemperature(AntaTest):
         if not self.inputs.check_temp_sensors:
             return
 
-        temp_sensors = command_output["tempSensors"]
+        temp_sensors = list(command_output["tempSensors"])
         for power_supply in command_output["powerSupplySlots"]:
             temp_sensors.extend(power_supply["tempSensors"])
 
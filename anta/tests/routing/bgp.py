@@ -9,13 +9,14 @@
 # pyright: reportAttributeAccessIssue=false
 from __future__ import annotations
 
+from itertools import repeat
 from typing import Any, ClassVar, TypeVar
 
 from pydantic import PositiveInt, field_validator
 
 from anta.input_models.routing.bgp import BgpAddressFamily, BgpAfi, BgpNeighbor, BgpPeer, BgpRoute, BgpVrf, VxlanEndpoint
-from anta.models import AntaCommand, AntaTemplate, AntaTest
-from anta.tools import format_data, get_item, get_value
+from anta.models import AntaCommand, AntaTemplate, AntaTest, RuntimeCommand
+from anta.tools import OutputIndex, format_data, get_item, get_value
 
 T = TypeVar("T", bound=BgpPeer)
 
@@ -43,15 +44,15 @@ def _check_bgp_neighbor_capability(capability_status: dict[str, bool]) -> bool:
     return all(capability_status.get(state, False) for state in ("advertised", "received", "enabled"))
 
 
-def _get_bgp_peer_data(peer: BgpPeer, command_output: dict[str, Any]) -> dict[str, Any] | None:
+def _get_bgp_peer_data(peer: BgpPeer, command: RuntimeCommand) -> dict[str, Any] | None:
     """Retrieve BGP peer data for the given peer from the command output.
 
     Parameters
     ----------
     peer
         The BgpPeer object to look up.
-    command_output
-        Parsed output of the command.
+    command
+        The command holding the output of `show bgp neighbors`.
 
     Returns
     -------
@@ -66,9 +67,10 @@ def _get_bgp_peer_data(peer: BgpPeer, command_output: dict[str, Any]) -> dict[st
         identity = str(peer.peer_address)
         lookup_key = "peerAddress"
 
-    peer_list = get_value(command_output, f"vrfs.{peer.vrf}.peerList", default=[])
+    peer_list = get_value(command.json_output, f"vrfs.{peer.vrf}.peerList", default=[])
 
-    return get_item(peer_list, lookup_key, identity)
+    # The peer list index is shared by all the tests of the device consuming the same output
+    return OutputIndex.of(command, peer_list).get_item(lookup_key, identity)
 
 
 class VerifyBGPPeerCount(AntaTest):
@@ -348,7 +350,7 @@ class VerifyBGPSpecificPeers(AntaTest):
                 peer_ip = str(peer)
 
                 # Check if the peer is found
-                if (peer_data := get_item(vrf_output["peerList"], "peerAddress", peer_ip)) is None:
+                if (peer_data := OutputIndex.of(self.instance_commands[0], vrf_output["peerList"]).get_item("peerAddress", peer_ip)) is None:
                     self.result.is_failure(f"{address_family} Peer: {peer_ip} - Not configured")
                     continue
 
@@ -427,7 +429,9 @@ class VerifyBGPPeerSession(AntaTest):
     """
 
     categories: ClassVar[list[str]] = ["bgp"]
-    commands: ClassVar[list[AntaCommand | AntaTemplate]] = [AntaCommand(command="show bgp neighbors vrf all", revision=3)]
+    commands: ClassVar[list[AntaCommand | AntaTemplate]] = [
+        AntaTemplate(template="show bgp neighbors {peer} vrf {vrf}", revision=3, fallback=AntaCommand(command="show bgp neighbors vrf all", revision=3))
+    ]
     _atomic_support: ClassVar[bool] = True
 
     class Input(AntaTest.Input):
@@ -440,18 +444,27 @@ class VerifyBGPPeerSession(AntaTest):
         bgp_peers: list[BgpPeer]
         """List of BGP peers."""
 
+    inputs: VerifyBGPPeerSession.Input
+
+    def render(self, template: AntaTemplate) -> list[AntaCommand]:
+        """Render the template for each BGP peer in the input list, or return the fallback for RFC5549 peers."""
+        if template.fallback is not None and any(peer.interface is not None for peer in self.inputs.bgp_peers):
+            return [template.fallback]
+        return [template.render(peer=str(peer.peer_address), vrf=peer.vrf) for peer in self.inputs.bgp_peers]
+
     @AntaTest.anta_test
     def test(self) -> None:
         """Main test function for VerifyBGPPeerSession."""
-        output = self.instance_commands[0].json_output
+        # The targeted commands are in the order of the peers, the output of the fallback covers all the peers
+        peer_commands = self.instance_commands if len(self.instance_commands) != 1 else repeat(self.instance_commands[0])
 
-        for peer in self.inputs.bgp_peers:
+        for peer, command in zip(self.inputs.bgp_peers, peer_commands, strict=False):
             # atomic result
             result = self.result.add(description=str(peer))
             result.is_success()
 
             # Check if the peer is found
-            if (peer_data := _get_bgp_peer_data(peer, output)) is None:
+            if (peer_data := _get_bgp_peer_data(peer, command)) is None:
                 result.is_failure("Not found")
                 continue
 
@@ -671,11 +684,11 @@ class VerifyBGPPeerMPCaps(AntaTest):
         """Main test function for VerifyBGPPeerMPCaps."""
         self.result.is_success()
 
-        output = self.instance_commands[0].json_output
+        command = self.instance_commands[0]
 
         for peer in self.inputs.bgp_peers:
             # Check if the peer is found
-            if (peer_data := _get_bgp_peer_data(peer, output)) is None:
+            if (peer_data := _get_bgp_peer_data(peer, command)) is None:
                 self.result.is_failure(f"{peer} - Not found")
                 continue
 
@@ -752,11 +765,11 @@ class VerifyBGPPeerASNCap(AntaTest):
         """Main test function for VerifyBGPPeerASNCap."""
         self.result.is_success()
 
-        output = self.instance_commands[0].json_output
+        command = self.instance_commands[0]
 
         for peer in self.inputs.bgp_peers:
             # Check if the peer is found
-            if (peer_data := _get_bgp_peer_data(peer, output)) is None:
+            if (peer_data := _get_bgp_peer_data(peer, command)) is None:
                 self.result.is_failure(f"{peer} - Not found")
                 continue
 
@@ -822,11 +835,11 @@ class VerifyBGPPeerRouteRefreshCap(AntaTest):
         """Main test function for VerifyBGPPeerRouteRefreshCap."""
         self.result.is_success()
 
-        output = self.instance_commands[0].json_output
+        command = self.instance_commands[0]
 
         for peer in self.inputs.bgp_peers:
             # Check if the peer is found
-            if (peer_data := _get_bgp_peer_data(peer, output)) is None:
+            if (peer_data := _get_bgp_peer_data(peer, command)) is None:
                 self.result.is_failure(f"{peer} - Not found")
                 continue
 
@@ -894,11 +907,11 @@ class VerifyBGPPeerMD5Auth(AntaTest):
         """Main test function for VerifyBGPPeerMD5Auth."""
         self.result.is_success()
 
-        output = self.instance_commands[0].json_output
+        command = self.instance_commands[0]
 
         for peer in self.inputs.bgp_peers:
             # Check if the peer is found
-            if (peer_data := _get_bgp_peer_data(peer, output)) is None:
+            if (peer_data := _get_bgp_peer_data(peer, command)) is None:
                 self.result.is_failure(f"{peer} - Not found")
                 continue
 
@@ -1033,11 +1046,11 @@ class VerifyBGPAdvCommunities(AntaTest):
         """Main test function for VerifyBGPAdvCommunities."""
         self.result.is_success()
 
-        output = self.instance_commands[0].json_output
+        command = self.instance_commands[0]
 
         for peer in self.inputs.bgp_peers:
             # Check if the peer is found
-            if (peer_data := _get_bgp_peer_data(peer, output)) is None:
+            if (peer_data := _get_bgp_peer_data(peer, command)) is None:
                 self.result.is_failure(f"{peer} - Not found")
                 continue
 
@@ -1115,11 +1128,11 @@ class VerifyBGPTimers(AntaTest):
         """Main test function for VerifyBGPTimers."""
         self.result.is_success()
 
-        output = self.instance_commands[0].json_output
+        command = self.instance_commands[0]
 
         for peer in self.inputs.bgp_peers:
             # Check if the peer is found
-            if (peer_data := _get_bgp_peer_data(peer, output)) is None:
+            if (peer_data := _get_bgp_peer_data(peer, command)) is None:
                 self.result.is_failure(f"{peer} - Not found")
                 continue
 
@@ -1192,12 +1205,12 @@ class VerifyBGPPeerDropStats(AntaTest):
         """Main test function for VerifyBGPPeerDropStats."""
         self.result.is_success()
 
-        output = self.instance_commands[0].json_output
+        command = self.instance_commands[0]
 
         for peer in self.inputs.bgp_peers:
             drop_stats_input = peer.drop_stats
             # Check if the peer is found
-            if (peer_data := _get_bgp_peer_data(peer, output)) is None:
+            if (peer_data := _get_bgp_peer_data(peer, command)) is None:
                 self.result.is_failure(f"{peer} - Not found")
                 continue
 
@@ -1275,12 +1288,12 @@ class VerifyBGPPeerUpdateErrors(AntaTest):
         """Main test function for VerifyBGPPeerUpdateErrors."""
         self.result.is_success()
 
-        output = self.instance_commands[0].json_output
+        command = self.instance_commands[0]
 
         for peer in self.inputs.bgp_peers:
             update_errors_input = peer.update_errors
             # Check if the peer is found
-            if (peer_data := _get_bgp_peer_data(peer, output)) is None:
+            if (peer_data := _get_bgp_peer_data(peer, command)) is None:
                 self.result.is_failure(f"{peer} - Not found")
                 continue
 
@@ -1362,14 +1375,14 @@ class VerifyBgpRouteMaps(AntaTest):
         """Main test function for VerifyBgpRouteMaps."""
         self.result.is_success()
 
-        output = self.instance_commands[0].json_output
+        command = self.instance_commands[0]
 
         for peer in self.inputs.bgp_peers:
             inbound_route_map = peer.inbound_route_map
             outbound_route_map = peer.outbound_route_map
 
             # Check if the peer is found
-            if (peer_data := _get_bgp_peer_data(peer, output)) is None:
+            if (peer_data := _get_bgp_peer_data(peer, command)) is None:
                 self.result.is_failure(f"{peer} - Not found")
                 continue
 
@@ -1447,14 +1460,14 @@ class VerifyBGPPeerRouteLimit(AntaTest):
         """Main test function for VerifyBGPPeerRouteLimit."""
         self.result.is_success()
 
-        output = self.instance_commands[0].json_output
+        command = self.instance_commands[0]
 
         for peer in self.inputs.bgp_peers:
             maximum_routes = peer.maximum_routes
             warning_limit = peer.warning_limit
 
             # Check if the peer is found
-            if (peer_data := _get_bgp_peer_data(peer, output)) is None:
+            if (peer_data := _get_bgp_peer_data(peer, command)) is None:
                 self.result.is_failure(f"{peer} - Not found")
                 continue
 
@@ -1528,11 +1541,11 @@ class VerifyBGPPeerGroup(AntaTest):
         """Main test function for VerifyBGPPeerGroup."""
         self.result.is_success()
 
-        output = self.instance_commands[0].json_output
+        command = self.instance_commands[0]
 
         for peer in self.inputs.bgp_peers:
             # Check if the peer is found
-            if (peer_data := _get_bgp_peer_data(peer, output)) is None:
+            if (peer_data := _get_bgp_peer_data(peer, command)) is None:
                 self.result.is_failure(f"{peer} - Not found")
                 continue
 
@@ -1604,11 +1617,11 @@ class VerifyBGPPeerSessionRibd(AntaTest):
         """Main test function for VerifyBGPPeerSessionRibd."""
         self.result.is_success()
 
-        output = self.instance_commands[0].json_output
+        command = self.instance_commands[0]
 
         for peer in self.inputs.bgp_peers:
             # Check if the peer is found
-            if (peer_data := _get_bgp_peer_data(peer, output)) is None:
+            if (peer_data := _get_bgp_peer_data(peer, command)) is None:
                 self.result.is_failure(f"{peer} - Not found")
                 continue
 
@@ -2146,11 +2159,11 @@ class VerifyBGPPeerTtlMultiHops(AntaTest):
     def test(self) -> None:
         """Main test function for VerifyBGPPeerTtlMultiHops."""
         self.result.is_success()
-        command_output = self.instance_commands[0].json_output
+        command = self.instance_commands[0]
 
         for peer in self.inputs.bgp_peers:
             # Check if the peer is found
-            if (peer_details := _get_bgp_peer_data(peer, command_output)) is None:
+            if (peer_details := _get_bgp_peer_data(peer, command)) is None:
                 self.result.is_failure(f"{peer} - Not found")
                 continue
 
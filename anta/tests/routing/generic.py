@@ -7,8 +7,7 @@
 # pyright: reportAttributeAccessIssue=false
 from __future__ import annotations
 
-from functools import cache
-from ipaddress import IPv4Address, IPv4Interface
+from ipaddress import IPv4Address
 from typing import TYPE_CHECKING, Any, ClassVar, Literal
 
 from pydantic import field_validator, model_validator
@@ -16,9 +15,9 @@ from pydantic import field_validator, model_validator
 from anta.custom_types import PositiveInteger
 from anta.decorators import deprecated_test_class
 from anta.input_models.routing.generic import IPv4RouteEntry, RoutingTableSizeVRF
-from anta.models import AntaCommand, AntaTemplate, AntaTest
+from anta.models import AntaCommand, AntaTemplate, AntaTest, RuntimeCommand
 from anta.result_manager.models import AntaTestStatus
-from anta.tools import get_item, get_value
+from anta.tools import RouteIndex, get_item, get_value
 
 if TYPE_CHECKING:
     import sys
@@ -243,22 +242,12 @@ class VerifyRoutingTableEntry(AntaTest):
 
         return []
 
-    @staticmethod
-    @cache
-    def ip_interface_ip(route: str) -> IPv4Address:
-        """Return the IP address of the provided ip route with mask."""
-        return IPv4Interface(route).ip
-
     @AntaTest.anta_test
     def test(self) -> None:
         """Main test function for VerifyRoutingTableEntry."""
-        commands_output_route_ips = set()
-
-        for command in self.instance_commands:
-            command_output_vrf = command.json_output["vrfs"][self.inputs.vrf]
-            commands_output_route_ips |= {self.ip_interface_ip(route) for route in command_output_vrf["routes"]}
+        route_indexes = [RouteIndex.of(command, command.json_output["vrfs"][self.inputs.vrf]["routes"]) for command in self.instance_commands]
 
-        missing_routes = [str(route) for route in self.inputs.routes if route not in commands_output_route_ips]
+        missing_routes = [str(route) for route in self.inputs.routes if not any(index.is_network_address(route) for index in route_indexes)]
 
         if not missing_routes:
             self.result.is_success()
@@ -516,7 +505,9 @@ class VerifyIPv4RoutePresencePerPrefix(AntaTest):
     """
 
     categories: ClassVar[list[str]] = ["routing"]
-    commands: ClassVar[list[AntaCommand | AntaTemplate]] = [AntaTemplate(template="show ip route vrf {vrf} {prefix}", revision=4)]
+    commands: ClassVar[list[AntaCommand | AntaTemplate]] = [
+        AntaTemplate(template="show ip route vrf {vrf} {prefix}", revision=4, aggregate=AntaCommand(command="show ip route vrf all", revision=4))
+    ]
     _atomic_support: ClassVar[bool] = True
 
     class Input(AntaTest.Input):
@@ -529,6 +520,15 @@ class VerifyIPv4RoutePresencePerPrefix(AntaTest):
         """Render the template for each route entry in the input list."""
         return [template.render(vrf=entry.vrf, prefix=str(entry.prefix)) for entry in self.inputs.route_entries]
 
+    def map_aggregate(self, command: RuntimeCommand, output: dict[str, Any] | str) -> dict[str, Any] | str:
+        """Return the route of the prefix of the command in its VRF from the output of `show ip route vrf all`."""
+        params = command.params.model_dump()
+        vrf, prefix = params["vrf"], params["prefix"]
+        if not isinstance(output, dict) or (routes := get_value(output, f"vrfs..{vrf}..routes", separator="..")) is None:
+            return {"vrfs": {}}
+        route = routes.get(prefix)
+        return {"vrfs": {vrf: {"routes": {prefix: route} if route is not None else {}}}}
+
     @AntaTest.anta_test
     def test(self) -> None:
         """Main test function for VerifyIPv4RoutePresencePerPrefix."""
@@ -13,7 +13,7 @@ from pydantic import field_validator
 
 from anta.input_models.routing.isis import Entry, InterfaceCount, InterfaceState, ISISInstance, IsisInstance, ISISInterface, Tunnel, TunnelPath
 from anta.models import AntaCommand, AntaTemplate, AntaTest
-from anta.tools import get_item, get_value
+from anta.tools import OutputIndex, get_value
 
 
 class VerifyISISNeighborState(AntaTest):
@@ -274,8 +274,9 @@ class VerifyISISSegmentRoutingAdjacencySegments(AntaTest):
                 self.result.is_failure(f"{instance} - No adjacency segments found")
                 continue
 
+            segment_index = OutputIndex.of(self.instance_commands[0], act_segments)
             for segment in instance.segments:
-                if (act_segment := get_item(act_segments, "ipAddress", str(segment.address))) is None:
+                if (act_segment := segment_index.get_item("ipAddress", str(segment.address))) is None:
                     self.result.is_failure(f"{instance} {segment} - Adjacency segment not found")
                     continue
 
@@ -409,9 +410,9 @@ class VerifyISISSegmentRoutingTunnels(AntaTest):
             self.result.is_skipped("IS-IS-SR not configured")
             return
 
+        entry_index = OutputIndex(list(command_output["entries"].values()))
         for input_entry in self.inputs.entries:
-            entries = list(command_output["entries"].values())
-            if (eos_entry := get_item(entries, "endpoint", str(input_entry.endpoint))) is None:
+            if (eos_entry := entry_index.get_item("endpoint", str(input_entry.endpoint))) is None:
                 self.result.is_failure(f"{input_entry} - Tunnel not found")
                 continue
 
@@ -14,7 +14,7 @@ from anta.custom_types import PositiveInteger
 from anta.input_models.security import ACL, APISSLCertificate, IPSecPeer, IPSecPeers
 from anta.models import AntaCommand, AntaTemplate, AntaTest
 from anta.result_manager.models import AntaTestStatus
-from anta.tools import get_item, get_value
+from anta.tools import OutputIndex, get_value
 
 
 class VerifySSHStatus(AntaTest):
@@ -592,13 +592,15 @@ class VerifyIPv4ACL(AntaTest):
             self.result.is_failure("No Access Control List (ACL) configured")
             return
 
+        acl_index = OutputIndex.of(self.instance_commands[0], command_output)
         for access_list in self.inputs.ipv4_access_lists:
-            if not (access_list_output := get_item(command_output, "name", access_list.name)):
+            if not (access_list_output := acl_index.get_item("name", access_list.name)):
                 self.result.is_failure(f"{access_list} - Not configured")
                 continue
 
+            sequence_index = OutputIndex.of(self.instance_commands[0], access_list_output["sequence"])
             for entry in access_list.entries:
-                if not (actual_entry := get_item(access_list_output["sequence"], "sequenceNumber", entry.sequence)):
+                if not (actual_entry := sequence_index.get_item("sequenceNumber", entry.sequence)):
                     self.result.is_failure(f"{access_list} {entry} - Not configured")
                     continue
 
@@ -7,12 +7,12 @@
 # pyright: reportAttributeAccessIssue=false
 from __future__ import annotations
 
-from typing import ClassVar, Literal
+from typing import Any, ClassVar, Literal
 
 from pydantic import Field
 
 from anta.custom_types import Interface, InterfaceType, VlanId
-from anta.models import AntaCommand, AntaTemplate, AntaTest
+from anta.models import AntaCommand, AntaTemplate, AntaTest, RuntimeCommand
 from anta.result_manager.models import AntaTestStatus
 from anta.tools import get_value, is_interface_ignored
 
@@ -38,7 +38,9 @@ class VerifySTPMode(AntaTest):
     """
 
     categories: ClassVar[list[str]] = ["stp"]
-    commands: ClassVar[list[AntaCommand | AntaTemplate]] = [AntaTemplate(template="show spanning-tree vlan {vlan}", revision=1)]
+    commands: ClassVar[list[AntaCommand | AntaTemplate]] = [
+        AntaTemplate(template="show spanning-tree vlan {vlan}", revision=1, aggregate=AntaCommand(command="show spanning-tree vlan detail", revision=1))
+    ]
 
     class Input(AntaTest.Input):
         """Input model for the VerifySTPMode test."""
@@ -181,7 +183,11 @@ class VerifySTPForwardingPorts(AntaTest):
 
     description = "Verifies that all interfaces are forwarding for a provided list of VLAN(s)."
     categories: ClassVar[list[str]] = ["stp"]
-    commands: ClassVar[list[AntaCommand | AntaTemplate]] = [AntaTemplate(template="show spanning-tree topology vlan {vlan} status", revision=1)]
+    commands: ClassVar[list[AntaCommand | AntaTemplate]] = [
+        AntaTemplate(
+            template="show spanning-tree topology vlan {vlan} status", revision=1, aggregate=AntaCommand(command="show spanning-tree topology status", revision=1)
+        )
+    ]
 
     class Input(AntaTest.Input):
         """Input model for the VerifySTPForwardingPorts test."""
@@ -193,16 +199,24 @@ class VerifySTPForwardingPorts(AntaTest):
         """Render the template for each VLAN in the input list."""
         return [template.render(vlan=vlan) for vlan in self.inputs.vlans]
 
+    def map_aggregate(self, command: RuntimeCommand, output: dict[str, Any] | str) -> dict[str, Any] | str:
+        """Return the topologies of the VLAN of the command from the output of `show spanning-tree topology status`."""
+        vlan = int(command.params.model_dump()["vlan"])
+        if not isinstance(output, dict):
+            return {"topologies": {}}
+        topologies = output.get("topologies") or {}
+        return {"topologies": {name: topology for name, topology in topologies.items() if vlan in topology.get("vlans", [])}}
+
     @AntaTest.anta_test
     def test(self) -> None:
         """Main test function for VerifySTPForwardingPorts."""
         self.result.is_success()
-        interfaces_state = []
         for command in self.instance_commands:
             vlan_id = command.params.vlan
             if not (topologies := get_value(command.json_output, "topologies")):
                 self.result.is_failure(f"VLAN {vlan_id} - STP instance is not configured")
                 continue
+            interfaces_state = []
             for value in topologies.values():
                 if vlan_id and int(vlan_id) in value["vlans"]:
                     interfaces_state = [
@@ -303,10 +317,8 @@ class VerifyStpTopologyChanges(AntaTest):
         """Main test function for VerifyStpTopologyChanges."""
         self.result.is_success()
         command_output = self.instance_commands[0].json_output
-        stp_topologies = command_output.get("topologies", {})
-
         # verifies all available topologies except the "NoStp" topology.
-        stp_topologies.pop("NoStp", None)
+        stp_topologies = {topology: details for topology, details in command_output.get("topologies", {}).items() if topology != "NoStp"}
 
         # Verify the STP topology(s).
         if not stp_topologies:
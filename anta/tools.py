@@ -12,8 +12,11 @@ import re
 from collections.abc import Callable, Coroutine, Sequence
 from datetime import datetime, timezone
 from functools import cache, wraps
+from ipaddress import IPV4LENGTH, IPv4Address, IPv4Network
+from socket import inet_aton
 from time import perf_counter
-from typing import TYPE_CHECKING, Any, ParamSpec, TypeVar
+from typing import TYPE_CHECKING, Any, ClassVar, ParamSpec, TypeVar
+from weakref import WeakValueDictionary
 
 from anta.constants import ACRONYM_CATEGORIES
 from anta.custom_types import REGEXP_PATH_MARKERS
@@ -24,6 +27,8 @@ if TYPE_CHECKING:
     from logging import Logger
     from types import TracebackType
 
+    from anta.models import RuntimeCommand
+
     if sys.version_info >= (3, 11):
         from typing import Self
     else:
@@ -31,6 +36,7 @@ if TYPE_CHECKING:
 
 P = ParamSpec("P")
 T = TypeVar("T")
+IndexT = TypeVar("IndexT", bound="OutputIndex | RouteIndex")
 AsyncFunc = Callable[P, Coroutine[Any, Any, T]]
 AsyncDecorator = Callable[[AsyncFunc], AsyncFunc]
 
@@ -280,6 +286,285 @@ def get_item(
     return default
 
 
+# Sentinel of the keys missing from an item indexed by OutputIndex
+_MISSING = object()
+
+
+def _index_key(value: Any, *, case_sensitive: bool) -> Any:
+    """Return the key of a value in an OutputIndex lookup index, casefolded for case-insensitive indexes of strings."""
+    if not case_sensitive and isinstance(value, str):
+        return value.casefold()
+    return value
+
+
+class OutputIndexes:
+    """Indexes built over the data of a command output, shared by the commands holding this output.
+
+    The tests of a device requiring the same command share its output. The `RuntimeCommand` objects holding an output
+    reference its OutputIndexes, so the indexes of its data are built once, shared by these tests and released with the
+    last of them. The registry of the OutputIndexes only holds weak references.
+
+    Use `RuntimeCommand.indexes` to get the OutputIndexes of the output of a command.
+    """
+
+    __slots__ = ("__weakref__", "_indexes", "output")
+
+    # OutputIndexes of the outputs held by commands, keyed by the id of the output
+    _registry: ClassVar[WeakValueDictionary[int, OutputIndexes]] = WeakValueDictionary()
+
+    def __init__(self, output: Any) -> None:
+        """Initialize the OutputIndexes of a command output. The indexes are built on demand."""
+        # Also prevents the id of a registered output from being reused
+        self.output = output
+        self._indexes: dict[tuple[type, int], tuple[Any, Any]] = {}
+
+    @classmethod
+    def of(cls, output: Any) -> OutputIndexes:
+        """Return the OutputIndexes of a command output, shared by all the commands holding the same output object."""
+        key = id(output)
+        if (indexes := cls._registry.get(key)) is None or indexes.output is not output:
+            indexes = cls._registry[key] = cls(output)
+        return indexes
+
+    def get(self, index_class: type[IndexT], data: Any) -> IndexT:
+        """Return the index of some data of the output, building it if needed.
+
+        Parameters
+        ----------
+        index_class
+            Class of the index, `OutputIndex` or `RouteIndex`.
+        data
+            Data of the output to index. The data must not be modified once indexed.
+
+        Returns
+        -------
+        OutputIndex | RouteIndex
+            The shared or new index of the data.
+        """
+        key = (index_class, id(data))
+        # The data is stored with its index to prevent its id from being reused
+        if (entry := self._indexes.get(key)) is None or entry[0] is not data:
+            entry = self._indexes[key] = (data, index_class(data))
+        return entry[1]
+
+
+class OutputIndex:
+    """Hash indexes over a list of dictionaries of a command output, for the lookups of `get_item()` and `get_dict_superset()`.
+
+    `get_item()` and `get_dict_superset()` scan the list on every call. An OutputIndex builds, on the first lookup by a key
+    or a set of keys, a dictionary mapping the values of these keys to the first matching item of the list, then answers
+    the next lookups by these keys in constant time. The lookups have the same arguments and return the same items as
+    the functions they replace.
+
+    Use `OutputIndex.of()` to get the index of a list of a command output: the index is stored in the `OutputIndexes`
+    of the output, so the tests of a device sharing the same command output share the indexes of its lists. The list
+    must not be modified once indexed, which is already the case of the command outputs shared between tests.
+
+    Example
+    -------
+    ```python
+    index = OutputIndex.of(self.instance_commands[0], command_output["interfaces"])
+    for interface in self.inputs.interfaces:
+        if (interface_output := index.get_item("name", interface.name)) is None:
+            ...
+    ```
+    """
+
+    def __init__(self, list_of_dicts: list[dict[Any, Any]]) -> None:
+        """Initialize the OutputIndex of a list of dictionaries. The indexes are built on demand."""
+        self.list_of_dicts = list_of_dicts
+        self._indexes: dict[tuple[tuple[Any, ...], bool], dict[Any, dict[Any, Any]]] = {}
+
+    @classmethod
+    def of(cls, command: RuntimeCommand, list_of_dicts: list[dict[Any, Any]]) -> OutputIndex:
+        """Return the OutputIndex of a list of dictionaries of a command output, shared by the commands holding this output.
+
+        Parameters
+        ----------
+        command
+            Command whose output holds the list.
+        list_of_dicts
+            List of dictionaries to index.
+
+        Returns
+        -------
+        OutputIndex
+            The shared or new OutputIndex of the list.
+        """
+        if not isinstance(list_of_dicts, list) or not list_of_dicts:
+            # Nothing to index, do not store the default empty lists of the callers
+            return cls(list_of_dicts)
+        return command.indexes.get(cls, list_of_dicts)
+
+    def _get_index(self, keys: tuple[Any, ...], *, case_sensitive: bool) -> dict[Any, dict[Any, Any]]:
+        """Return the index of the items by the values of keys, building it if needed.
+
+        Items which are not dictionaries, miss one of the keys or have an unhashable value for one of the keys are not indexed.
+        """
+        if (index := self._indexes.get((keys, case_sensitive))) is not None:
+            return index
+        index = {}
+        if isinstance(self.list_of_dicts, list):
+            for item in self.list_of_dicts:
+                if not isinstance(item, dict):
+                    continue
+                values = tuple(_index_key(item.get(key, _MISSING), case_sensitive=case_sensitive) for key in keys)
+                if _MISSING in values:
+                    continue
+                try:
+                    # Keep the first matching item
+                    index.setdefault(values, item)
+                except TypeError:
+                    # Unhashable value, e.g. a list
+                    continue
+        self._indexes[(keys, case_sensitive)] = index
+        return index
+
+    def get_item(
+        self,
+        key: Any,
+        value: Any,
+        default: Any | None = None,
+        var_name: str | None = None,
+        custom_error_msg: str | None = None,
+        *,
+        required: bool = False,
+        case_sensitive: bool = False,
+    ) -> Any:
+        """Get one dictionary of the list by matching the given key and value, like `get_item()`.
+
+        Refer to `get_item()` for the description of the parameters and of the return value.
+        """
+        if (not isinstance(self.list_of_dicts, list)) or self.list_of_dicts == [] or value is None or key is None:
+            return get_item(self.list_of_dicts, key, value, default, var_name, custom_error_msg, required=required, case_sensitive=case_sensitive)
+        try:
+            item = self._get_index((key,), case_sensitive=case_sensitive).get((_index_key(value, case_sensitive=case_sensitive),))
+        except TypeError:
+            # Unhashable value, fall back to the linear scan
+            return get_item(self.list_of_dicts, key, value, default, var_name, custom_error_msg, required=required, case_sensitive=case_sensitive)
+        if item is not None:
+            return item
+        if required is True:
+            raise ValueError(custom_error_msg or (var_name if var_name is not None else key))
+        return default
+
+    def get_dict_superset(
+        self,
+        input_dict: dict[Any, Any],
+        default: Any | None = None,
+        var_name: str | None = None,
+        custom_error_msg: str | None = None,
+        *,
+        required: bool = False,
+    ) -> Any:
+        """Get the first dictionary of the list that is a superset of the input dict, like `get_dict_superset()`.
+
+        Refer to `get_dict_superset()` for the description of the parameters and of the return value.
+        """
+        if not isinstance(self.list_of_dicts, list) or not self.list_of_dicts or not isinstance(input_dict, dict) or not input_dict:
+            return get_dict_superset(self.list_of_dicts, input_dict, default, var_name, custom_error_msg, required=required)
+        try:
+            item = self._get_index(tuple(input_dict), case_sensitive=True).get(tuple(input_dict.values()))
+        except TypeError:
+            # Unhashable value, fall back to the linear scan
+            return get_dict_superset(self.list_of_dicts, input_dict, default, var_name, custom_error_msg, required=required)
+        if item is not None:
+            return item
+        if required:
+            error_msg = custom_error_msg or f"{var_name} not found in the provided list."
+            raise ValueError(error_msg)
+        return default
+
+
+class RouteIndex:
+    """Index of the routes of a VRF in a `show ip route` output.
+
+    The routes of a VRF are a dictionary keyed by prefix, which answers the exact lookups. A RouteIndex also answers the
+    lookups by network address: on the first one, it builds the set of the network addresses of the prefixes of the table,
+    so that each lookup costs a single set membership test whatever the size of the table, and the index holds one entry per route.
+
+    Only IPv4 routing tables are supported: the prefixes which are not valid IPv4 prefixes are not indexed, and the
+    lookups by address raise a TypeError for IPv6 addresses.
+
+    Use `RouteIndex.of()` to get the index of the routes of a VRF of a command output: the index is stored in the
+    `OutputIndexes` of the output, so the tests of a device sharing the same `show ip route` output share the indexes of
+    its VRFs. The routes must not be modified once indexed, which is already the case of the command outputs shared
+    between tests.
+
+    Example
+    -------
+    ```python
+    index = RouteIndex.of(self.instance_commands[0], command_output["vrfs"]["default"]["routes"])
+    if index.is_network_address(IPv4Address("10.1.0.1")):
+        ...
+    ```
+    """
+
+    # Smaller tables, e.g. the outputs of the per-prefix commands, are cheap to index and not stored
+    _shared_min_routes: ClassVar[int] = 64
+
+    def __init__(self, routes: dict[str, Any]) -> None:
+        """Initialize the RouteIndex of the routes of a VRF. The network addresses are indexed on demand."""
+        self.routes = routes
+        self._network_addresses: set[int] | None = None
+
+    @classmethod
+    def of(cls, command: RuntimeCommand, routes: dict[str, Any]) -> RouteIndex:
+        """Return the RouteIndex of the routes of a VRF of a command output, shared by the commands holding this output.
+
+        Parameters
+        ----------
+        command
+            Command whose output holds the routes.
+        routes
+            Routes of a VRF, keyed by prefix.
+
+        Returns
+        -------
+        RouteIndex
+            The shared or new RouteIndex of the routes.
+        """
+        if not isinstance(routes, dict) or len(routes) < cls._shared_min_routes:
+            return cls(routes)
+        return command.indexes.get(cls, routes)
+
+    @property
+    def network_addresses(self) -> set[int]:
+        """Network addresses of the prefixes of the routing table. Prefixes which are not valid IPv4 prefixes are not indexed."""
+        if self._network_addresses is None:
+            network_addresses: set[int] = set()
+            for prefix in self.routes if isinstance(self.routes, dict) else ():
+                address, _, length = prefix.partition("/")
+                try:
+                    prefix_length = int(length)
+                    network = int.from_bytes(inet_aton(address), "big")
+                except (ValueError, OSError):
+                    continue
+                if 0 <= prefix_length <= IPV4LENGTH:
+                    network_addresses.add(network)
+            self._network_addresses = network_addresses
+        return self._network_addresses
+
+    def get(self, prefix: IPv4Network | str, default: Any | None = None) -> Any:
+        """Return the route data of a prefix, or `default` if the prefix is not in the routing table."""
+        if not isinstance(self.routes, dict):
+            return default
+        return self.routes.get(str(prefix), default)
+
+    def is_network_address(self, address: IPv4Address) -> bool:
+        """Return True if the address is the address of a prefix of the routing table, whatever its length.
+
+        Raises
+        ------
+        TypeError
+            If the address is not an IPv4 address.
+        """
+        if not isinstance(address, IPv4Address):
+            msg = f"RouteIndex only supports IPv4 lookups, got {address!r}"
+            raise TypeError(msg)
+        return int(address) in self.network_addresses
+
+
 class Catchtime:
     """A class working as a context to capture time differences."""
 
@@ -33,9 +33,11 @@ __all__ = ["port_check_url"]
 # -----------------------------------------------------------------------------
 
 
-async def port_check_url(url: URL, timeout: int = 5) -> bool:
+async def port_check_url(url: URL, timeout: float = 5) -> bool:
     """Open the port designated by the URL given the timeout in seconds.
 
+    Connection errors, e.g. a refused connection or an unreachable host, are reported as a closed port.
+
     Parameters
     ----------
     url
@@ -57,6 +59,7 @@ async def port_check_url(url: URL, timeout: int = 5) -> bool:
         # MUST close if opened!
         wr.close()
 
-    except TimeoutError:
+    except (asyncio.TimeoutError, OSError):
+        # asyncio.TimeoutError is not a subclass of OSError before Python 3.11
         return False
     return True
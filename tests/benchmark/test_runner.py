@@ -87,9 +87,9 @@ def test__get_test_coroutines(benchmark: BenchmarkFixture, catalog: AntaCatalog,
 
     assert ctx.selected_tests is not None
 
-    def bench() -> list[Coroutine[Any, Any, TestResult]]:
-        coros = runner._get_test_coroutines(ctx)
-        for c in coros:
+    def bench() -> list[tuple[int, Coroutine[Any, Any, TestResult]]]:
+        coros = list(runner._get_test_coroutines(ctx))
+        for _, c in coros:
             c.close()
         return coros
 
@@ -0,0 +1,38 @@
+# Copyright (c) 2023-2026 Arista Networks, Inc.
+# Use of this source code is governed by the Apache License 2.0
+# that can be found in the LICENSE file.
+"""Benchmark tests for anta.tools."""
+
+from ipaddress import IPv4Address
+
+import pytest
+
+from anta.tools import OutputIndex, RouteIndex, get_item
+
+PEER_LIST = [{"peerAddress": f"10.{i // 65536}.{i // 256 % 256}.{i % 256}", "state": "Established"} for i in range(10000)]
+INPUT_PEERS = [peer["peerAddress"] for peer in PEER_LIST[::50]]
+ROUTES = {f"10.{i // 256}.{i % 256}.0/24": {"routeType": "eBGP"} for i in range(65536)}
+INPUT_ADDRESSES = [IPv4Address(f"10.{i}.1.0") for i in range(256)]
+
+
+@pytest.mark.benchmark
+def test_get_item() -> None:
+    """Benchmark get_item() for 200 peers in a list of 10000 peers."""
+    for peer in INPUT_PEERS:
+        get_item(PEER_LIST, "peerAddress", peer)
+
+
+@pytest.mark.benchmark
+def test_output_index_get_item() -> None:
+    """Benchmark OutputIndex.get_item() for 200 peers in a list of 10000 peers."""
+    index = OutputIndex(PEER_LIST)
+    for peer in INPUT_PEERS:
+        index.get_item("peerAddress", peer)
+
+
+@pytest.mark.benchmark
+def test_route_index_is_network_address() -> None:
+    """Benchmark RouteIndex.is_network_address() for 256 addresses in a routing table of 65536 routes, including the index build."""
+    index = RouteIndex(ROUTES)
+    for address in INPUT_ADDRESSES:
+        index.is_network_address(address)
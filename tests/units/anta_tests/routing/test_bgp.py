@@ -6,14 +6,17 @@
 # pylint: disable=C0302
 from __future__ import annotations
 
+import asyncio
 import sys
 from typing import TYPE_CHECKING, Any
+from unittest.mock import patch
 
 import pytest
 
-from anta.input_models.routing.bgp import BgpAddressFamily
-from anta.models import AntaTest
+from anta.input_models.routing.bgp import BgpAddressFamily, BgpPeer
+from anta.models import AntaCommand, AntaTest, RuntimeCommand
 from anta.result_manager.models import AntaTestStatus
+from anta.settings import AntaTestsSettings
 from anta.tests.routing.bgp import (
     VerifyBGPAdvCommunities,
     VerifyBGPExchangedRoutes,
@@ -40,10 +43,13 @@ from anta.tests.routing.bgp import (
     VerifyBGPTimers,
     VerifyEVPNType2Route,
     _check_bgp_neighbor_capability,
+    _get_bgp_peer_data,
 )
+from anta.tools import OutputIndex
 from tests.units.anta_tests import test
 
 if TYPE_CHECKING:
+    from anta.device import AntaDevice
     from tests.units.anta_tests import AntaUnitTestData
 
 
@@ -63,6 +69,58 @@ def test_check_bgp_neighbor_capability(input_dict: dict[str, bool], expected: bo
     assert _check_bgp_neighbor_capability(input_dict) == expected
 
 
+def test_get_bgp_peer_data() -> None:
+    """Test _get_bgp_peer_data looks up the peers in an index shared by the commands holding the same output."""
+    output = {
+        "vrfs": {
+            "default": {
+                "peerList": [
+                    {"peerAddress": "10.100.0.8", "state": "Established"},
+                    {"peerAddress": "10.100.0.8", "state": "Idle"},
+                    {"peerAddress": "fe80::250:56ff:fe01:112%Et1", "ifName": "Ethernet1", "state": "Established"},
+                ]
+            },
+            "MGMT": {"peerList": [{"peerAddress": "10.100.0.9", "state": "Idle"}]},
+        }
+    }
+    peer_list = output["vrfs"]["default"]["peerList"]
+    definition = AntaCommand(command="show bgp neighbors vrf all", revision=3)
+    command, other = RuntimeCommand(definition), RuntimeCommand(definition)
+    command.output = other.output = output
+
+    assert _get_bgp_peer_data(BgpPeer(peer_address="10.100.0.8"), command) is peer_list[0]
+    assert _get_bgp_peer_data(BgpPeer(interface="Ethernet1"), command) is peer_list[2]
+    assert _get_bgp_peer_data(BgpPeer(peer_address="10.100.0.9", vrf="MGMT"), command) == {"peerAddress": "10.100.0.9", "state": "Idle"}
+    assert _get_bgp_peer_data(BgpPeer(peer_address="10.100.0.9"), command) is None
+    assert _get_bgp_peer_data(BgpPeer(peer_address="10.100.0.8", vrf="PROD"), command) is None
+    assert _get_bgp_peer_data(BgpPeer(peer_address="10.100.0.8"), RuntimeCommand(AntaCommand(command="show bgp neighbors vrf all", output={}))) is None
+    # The index is shared by the commands holding the same output
+    assert OutputIndex.of(other, other.json_output["vrfs"]["default"]["peerList"]) is OutputIndex.of(command, peer_list)
+
+
+def test_verify_bgp_peer_session_narrowed(device: AntaDevice) -> None:
+    """Test VerifyBGPPeerSession collects one targeted command per peer below the narrowing threshold."""
+    inputs = {"check_tcp_queues": False, "bgp_peers": [{"peer_address": "10.100.0.8", "vrf": "default"}, {"peer_address": "10.100.0.9", "vrf": "MGMT"}]}
+    eos_data = [
+        {"vrfs": {"default": {"peerList": [{"peerAddress": "10.100.0.8", "state": "Established", "establishedTime": 169883}]}}},
+        {"vrfs": {"MGMT": {"peerList": [{"peerAddress": "10.100.0.9", "state": "Idle", "establishedTime": 0}]}}},
+    ]
+    with patch("anta.models.get_tests_settings", return_value=AntaTestsSettings(narrowing_threshold=10)):
+        test_instance = VerifyBGPPeerSession(device, inputs=inputs, eos_data=eos_data)
+        # RFC5549 peers cannot be targeted
+        rfc5549_instance = VerifyBGPPeerSession(device, inputs={"bgp_peers": [*inputs["bgp_peers"], {"interface": "Ethernet1", "vrf": "default"}]})
+
+    assert [command.command for command in test_instance.instance_commands] == [
+        "show bgp neighbors 10.100.0.8 vrf default",
+        "show bgp neighbors 10.100.0.9 vrf MGMT",
+    ]
+    assert [command.command for command in rfc5549_instance.instance_commands] == ["show bgp neighbors vrf all"]
+    asyncio.run(test_instance.test())
+    assert test_instance.result.result == AntaTestStatus.FAILURE
+    assert [result.result for result in test_instance.result.atomic_results] == [AntaTestStatus.SUCCESS, AntaTestStatus.FAILURE]
+    assert test_instance.result.messages == ["Peer: 10.100.0.9 VRF: MGMT - Incorrect session state - Expected: Established Actual: Idle"]
+
+
 DATA: AntaUnitTestData = {
     (VerifyBGPPeerCount, "success"): {
         "eos_data": [
@@ -5,8 +5,10 @@
 
 from __future__ import annotations
 
+import asyncio
 import sys
 from typing import TYPE_CHECKING, Any
+from unittest.mock import patch
 
 import pytest
 from pydantic import ValidationError
@@ -14,6 +16,7 @@ from pydantic import ValidationError
 from anta.input_models.routing.generic import RoutingTableSizeRouteSource, RoutingTableSizeVRF
 from anta.models import AntaTest
 from anta.result_manager.models import AntaTestStatus
+from anta.settings import AntaTestsSettings
 from anta.tests.routing.generic import (
     VerifyIPv4RouteNextHops,
     VerifyIPv4RoutePresencePerPrefix,
@@ -27,6 +30,7 @@ from anta.tests.routing.generic import (
 from tests.units.anta_tests import test
 
 if TYPE_CHECKING:
+    from anta.device import AntaDevice
     from tests.units.anta_tests import AntaUnitTestData
 
 DATA: AntaUnitTestData = {
@@ -1214,3 +1218,26 @@ class TestVerifyRoutingTableSizeInputs:
                     RoutingTableSizeRouteSource(source="bgp", minimum=1, maximum=10),
                 ],
             )
+
+
+def test_verify_ipv4_route_presence_per_prefix_aggregate(device: AntaDevice) -> None:
+    """Test VerifyIPv4RoutePresencePerPrefix maps the output of show ip route vrf all to each prefix above the aggregation threshold."""
+    inputs = {"route_entries": [{"prefix": "10.10.0.1/32", "vrf": "default"}, {"prefix": "10.100.0.12/31", "vrf": "MGMT"}, {"prefix": "10.1.0.0/16", "vrf": "data"}]}
+    with patch("anta.models.get_tests_settings", return_value=AntaTestsSettings(aggregation_threshold=2)):
+        test_instance = VerifyIPv4RoutePresencePerPrefix(device, inputs=inputs)
+
+    assert [command.command for command in test_instance.commands_to_collect] == ["show ip route vrf all"]
+    aggregate, _ = test_instance.aggregations[0]
+    aggregate.output = {
+        "vrfs": {
+            "default": {"routes": {"10.10.0.1/32": {"routeType": "eBGP"}, "10.10.0.2/32": {"routeType": "eBGP"}}},
+            "MGMT": {"routes": {"10.100.0.12/31": {"routeType": "connected"}}},
+        }
+    }
+    test_instance._map_aggregations()
+    asyncio.run(test_instance.test())
+
+    assert test_instance.instance_commands[0].json_output == {"vrfs": {"default": {"routes": {"10.10.0.1/32": {"routeType": "eBGP"}}}}}
+    assert test_instance.instance_commands[2].json_output == {"vrfs": {}}
+    assert test_instance.result.result == AntaTestStatus.FAILURE
+    assert [result.result for result in test_instance.result.atomic_results] == [AntaTestStatus.SUCCESS, AntaTestStatus.SUCCESS, AntaTestStatus.FAILURE]
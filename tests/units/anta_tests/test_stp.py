@@ -5,11 +5,14 @@
 
 from __future__ import annotations
 
+import asyncio
 import sys
 from typing import TYPE_CHECKING, Any
+from unittest.mock import patch
 
 from anta.models import AntaTest
 from anta.result_manager.models import AntaTestStatus
+from anta.settings import AntaTestsSettings
 from anta.tests.stp import (
     VerifySTPBlockedPorts,
     VerifySTPCounters,
@@ -22,6 +25,7 @@ from anta.tests.stp import (
 from tests.units.anta_tests import test
 
 if TYPE_CHECKING:
+    from anta.device import AntaDevice
     from tests.units.anta_tests import AntaUnitTestData
 
 DATA: AntaUnitTestData = {
@@ -648,3 +652,50 @@ DATA: AntaUnitTestData = {
         "expected": {"result": AntaTestStatus.FAILURE, "messages": ["VLAN: 6 - STP is enabled", "VLAN: 4094 - STP is enabled"]},
     },
 }
+
+
+def test_verify_stp_mode_aggregate(device: AntaDevice) -> None:
+    """Test VerifySTPMode looks up each VLAN in the output of show spanning-tree vlan detail above the aggregation threshold."""
+    with patch("anta.models.get_tests_settings", return_value=AntaTestsSettings(aggregation_threshold=1)):
+        test_instance = VerifySTPMode(device, inputs={"mode": "rapidPvst", "vlans": [10, 20, 30]})
+
+    assert [command.command for command in test_instance.commands_to_collect] == ["show spanning-tree vlan detail"]
+    aggregate, _ = test_instance.aggregations[0]
+    aggregate.output = {
+        "spanningTreeVlanInstances": {
+            "10": {"spanningTreeVlanInstance": {"protocol": "rapidPvst"}},
+            "20": {"spanningTreeVlanInstance": {"protocol": "mstp"}},
+        }
+    }
+    test_instance._map_aggregations()
+    asyncio.run(test_instance.test())
+
+    assert test_instance.result.result == AntaTestStatus.FAILURE
+    assert test_instance.result.messages == [
+        "VLAN 20 - Incorrect STP mode - Expected: rapidPvst Actual: mstp",
+        "VLAN 30 STP mode: rapidPvst - Not configured",
+    ]
+
+
+def test_verify_stp_forwarding_ports_aggregate(device: AntaDevice) -> None:
+    """Test VerifySTPForwardingPorts looks up the topologies of each VLAN in the output of show spanning-tree topology status above the aggregation threshold."""
+    with patch("anta.models.get_tests_settings", return_value=AntaTestsSettings(aggregation_threshold=1)):
+        test_instance = VerifySTPForwardingPorts(device, inputs={"vlans": [10, 20, 30]})
+
+    assert [command.command for command in test_instance.commands_to_collect] == ["show spanning-tree topology status"]
+    aggregate, _ = test_instance.aggregations[0]
+    aggregate.output = {
+        "unmappedVlans": [],
+        "topologies": {
+            "Vl10": {"vlans": [10], "interfaces": {"Ethernet1": {"state": "discarding"}}},
+            "Vl30": {"vlans": [30], "interfaces": {"Ethernet1": {"state": "forwarding"}}},
+        },
+    }
+    test_instance._map_aggregations()
+    asyncio.run(test_instance.test())
+
+    assert test_instance.result.result == AntaTestStatus.FAILURE
+    assert test_instance.result.messages == [
+        "VLAN 10 Interface: Ethernet1 - Invalid state - Expected: forwarding Actual: discarding",
+        "VLAN 20 - STP instance is not configured",
+    ]
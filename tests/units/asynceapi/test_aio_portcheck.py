@@ -0,0 +1,37 @@
+# Copyright (c) 2023-2026 Arista Networks, Inc.
+# Use of this source code is governed by the Apache License 2.0
+# that can be found in the LICENSE file.
+"""Unit tests for the asynceapi.aio_portcheck module."""
+
+from __future__ import annotations
+
+import asyncio
+from unittest.mock import patch
+
+from httpx import URL
+
+from asynceapi.aio_portcheck import port_check_url
+
+
+async def test_port_check_url_open() -> None:
+    """Test port_check_url() with an open port."""
+    server = await asyncio.start_server(lambda _reader, writer: writer.close(), host="127.0.0.1", port=0)
+    async with server:
+        port = server.sockets[0].getsockname()[1]
+        assert await port_check_url(URL(f"http://127.0.0.1:{port}"), timeout=1) is True
+
+
+async def test_port_check_url_connection_error() -> None:
+    """Test port_check_url() with a refused connection."""
+    with patch("asynceapi.aio_portcheck.asyncio.open_connection", side_effect=ConnectionRefusedError("refused")):
+        assert await port_check_url(URL("http://127.0.0.1:8080"), timeout=1) is False
+
+
+async def test_port_check_url_timeout() -> None:
+    """Test port_check_url() with a host not answering within the timeout."""
+
+    async def open_connection(**_kwargs: object) -> None:
+        await asyncio.sleep(1)
+
+    with patch("asynceapi.aio_portcheck.asyncio.open_connection", side_effect=open_connection):
+        assert await port_check_url(URL("http://127.0.0.1:8080"), timeout=0.01) is False
@@ -613,6 +613,13 @@ def test_get_commands(
             1,
             id="Get all unique commands from catalog",
         ),
+        pytest.param(
+            None,
+            "VerifyBGPPeerSession",
+            None,
+            3,
+            id="Get unique commands, template with fallback",
+        ),
     ],
 )
 def test_get_commands_unique(click_runner: CliRunner, module: str | None, test_name: str | None, catalog: str | None, expected_count: int) -> None:
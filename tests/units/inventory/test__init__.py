@@ -5,22 +5,27 @@
 
 from __future__ import annotations
 
+import json
 import logging
+import pickle
 from typing import TYPE_CHECKING
 from unittest.mock import AsyncMock, patch
 
 import pytest
 from pydantic import ValidationError
 
+from anta.device import AsyncEOSDevice
 from anta.inventory import AntaInventory
 from anta.inventory.exceptions import InventoryIncorrectSchemaError, InventoryRootKeyError
+from anta.inventory.models import AntaInventoryHost
+from anta.settings import get_discovery_settings, get_facts_settings
 
 if TYPE_CHECKING:
     from pathlib import Path
 
     from _pytest.mark.structures import ParameterSet
 
-    from anta.device import AntaDevice, AsyncEOSDevice
+    from anta.device import AntaDevice
 
 
 INIT_VALID_PARAMS: list[ParameterSet] = [
@@ -92,6 +97,229 @@ class TestAntaInventory:
             _ = AntaInventory.parse(filename="dummy.yml", username="arista", password="arista123")
         assert "Unable to parse ANTA Device Inventory file" in caplog.records[0].message
 
+    @pytest.mark.parametrize(
+        "yaml_file",
+        [
+            pytest.param(
+                {
+                    "anta_inventory": {
+                        "hosts": [{"host": "10.0.0.2", "name": "host"}],
+                        "networks": [{"network": "192.168.0.0/24", "tags": ["leaf"]}],
+                        "ranges": [{"start": "10.0.0.1", "end": "10.0.0.11", "tags": ["spine"], "disable_cache": True}],
+                    }
+                },
+                id="networks-and-ranges",
+            )
+        ],
+        indirect=["yaml_file"],
+    )
+    def test_parse_lazy_devices(self, yaml_file: Path) -> None:
+        """Test the devices of the network and range sections are created on demand."""
+        inventory = AntaInventory.parse(filename=yaml_file, username="arista", password="arista123")
+
+        def created() -> set[str]:
+            return {name for name, device in dict.items(inventory) if isinstance(device, AsyncEOSDevice)}
+
+        assert len(inventory) == 1 + 256 + 11
+        assert "192.168.0.42" in inventory
+        assert list(inventory)[:2] == ["host", "192.168.0.0"]
+        assert str(inventory) == "ANTA Inventory contains 268 devices (AsyncEOSDevice)"
+        assert len(inventory.get_inventory(tags={"leaf"})) == 256
+        assert len(inventory.get_inventory(tags={"spine", "10.0.0.2"})) == 11
+        assert not inventory.get_inventory(established_only=True)
+        assert inventory.dump().hosts[-1] == AntaInventoryHost(name="10.0.0.11", host="10.0.0.11", tags={"spine", "10.0.0.11"}, disable_cache=True)
+        assert created() == {"host"}
+
+        filtered = inventory.get_inventory(devices={"192.168.0.1", "10.0.0.1"})
+        device = filtered["192.168.0.1"]
+        assert isinstance(device, AsyncEOSDevice)
+        assert device.tags == {"leaf", "192.168.0.1"}
+        assert filtered.get("10.0.0.1").cache is None  # type: ignore[union-attr]
+        assert filtered.get("10.0.0.2") is None
+        # The inventories share the created devices
+        assert inventory["192.168.0.1"] is device
+        assert created() == {"host", "192.168.0.1"}
+
+        assert all(isinstance(device, AsyncEOSDevice) for device in inventory.values())
+        assert created() == set(inventory)
+
+    def test_get_inventory_tag_index(self) -> None:
+        """Test the tag index of the inventory is maintained when devices are added, replaced or removed."""
+        inventory = AntaInventory()
+        inventory.add_device(AsyncEOSDevice(host="10.0.0.1", name="leaf1", username="arista", password="arista123", tags={"leaf"}))
+        inventory.add_device(AsyncEOSDevice(host="10.0.0.2", name="spine1", username="arista", password="arista123", tags={"spine"}))
+        assert set(inventory.get_inventory(tags={"leaf", "spine"})) == {"leaf1", "spine1"}
+
+        inventory.add_device(AsyncEOSDevice(host="10.0.0.3", name="leaf2", username="arista", password="arista123", tags={"leaf"}))
+        assert set(inventory.get_inventory(tags={"leaf"})) == {"leaf1", "leaf2"}
+        inventory["leaf1"] = AsyncEOSDevice(host="10.0.0.1", name="leaf1", username="arista", password="arista123", tags={"border"})
+        assert set(inventory.get_inventory(tags={"leaf"})) == {"leaf2"}
+        assert set(inventory.get_inventory(tags={"border", "leaf1"})) == {"leaf1"}
+        del inventory["leaf2"]
+        assert not inventory.get_inventory(tags={"leaf"})
+        assert set(inventory.get_inventory(tags={"spine", "border"}, devices={"spine1", "unknown"})) == {"spine1"}
+        assert not inventory.get_inventory(tags={"unknown"})
+
+    def test_get_inventory_tag_index_dict_methods(self) -> None:
+        """Test the tag index of the inventory is maintained by the dict methods modifying the inventory."""
+        leaf1, leaf2, spine1, spine2 = (
+            AsyncEOSDevice(host=f"10.0.0.{i}", name=name, username="arista", password="arista123", tags={name[:-1]})
+            for i, name in enumerate(["leaf1", "leaf2", "spine1", "spine2"])
+        )
+        inventory = AntaInventory()
+        inventory.add_device(leaf1)
+        assert set(inventory.get_inventory(tags={"leaf"})) == {"leaf1"}
+
+        inventory.update({"leaf2": leaf2})
+        inventory |= {"spine1": spine1}
+        assert inventory.setdefault("spine2", spine2) is spine2
+        assert inventory.setdefault("spine2", leaf1) is spine2
+        assert set(inventory.get_inventory(tags={"leaf", "spine"})) == {"leaf1", "leaf2", "spine1", "spine2"}
+        with pytest.raises(RuntimeError, match="The key must be the device name"):
+            inventory.update(leaf3=leaf1)
+
+        assert inventory.pop("leaf1") is leaf1
+        assert inventory.pop("leaf1", None) is None
+        assert inventory.popitem() == ("spine2", spine2)
+        assert set(inventory.get_inventory(tags={"leaf", "spine"})) == {"leaf2", "spine1"}
+
+        copy = inventory.copy()
+        assert isinstance(copy, AntaInventory)
+        del copy["leaf2"]
+        assert set(copy.get_inventory(tags={"leaf", "spine"})) == {"spine1"}
+        assert set(inventory.get_inventory(tags={"leaf", "spine"})) == {"leaf2", "spine1"}
+
+        inventory.clear()
+        assert not inventory.get_inventory(tags={"leaf", "spine"})
+        inventory.add_device(leaf1)
+        assert set(inventory.get_inventory(tags={"leaf"})) == {"leaf1"}
+
+    @pytest.mark.parametrize(
+        "yaml_file",
+        [pytest.param({"anta_inventory": {"ranges": [{"start": "10.0.0.1", "end": "10.0.0.4", "tags": ["leaf"]}]}}, id="range")],
+        indirect=["yaml_file"],
+    )
+    def test_lazy_devices_dict_methods(self, yaml_file: Path) -> None:
+        """Test the dict methods returning devices create the devices of the network and range sections."""
+        inventory = AntaInventory.parse(filename=yaml_file, username="arista", password="arista123")
+
+        copy = inventory.copy()
+        assert isinstance(copy["10.0.0.1"], AsyncEOSDevice)
+        assert set(copy.get_inventory(tags={"leaf"})) == {"10.0.0.1", "10.0.0.2", "10.0.0.3", "10.0.0.4"}
+        assert isinstance(inventory.pop("10.0.0.2"), AsyncEOSDevice)
+        name, device = inventory.popitem()
+        assert name == "10.0.0.4"
+        assert isinstance(device, AsyncEOSDevice)
+        assert isinstance(inventory.setdefault("10.0.0.3", copy["10.0.0.1"]), AsyncEOSDevice)
+        assert set(inventory.get_inventory(tags={"leaf"})) == {"10.0.0.1", "10.0.0.3"}
+
+    @pytest.mark.parametrize(
+        "yaml_file",
+        [
+            pytest.param(
+                {"anta_inventory": {"hosts": [{"host": "10.0.1.1", "name": "host"}], "ranges": [{"start": "10.0.0.1", "end": "10.0.0.4", "tags": ["leaf"]}]}},
+                id="hosts-and-range",
+            )
+        ],
+        indirect=["yaml_file"],
+    )
+    def test_pickle(self, yaml_file: Path) -> None:
+        """Test pickling an inventory, e.g. a shard sent to a worker process, does not create the devices of the network and range sections."""
+        inventory = AntaInventory.parse(filename=yaml_file, username="arista", password="arista123")
+        shard = inventory.get_inventory(devices={"host", "10.0.0.1", "10.0.0.2"})
+
+        unpickled = pickle.loads(pickle.dumps(shard))  # noqa: S301
+
+        assert isinstance(unpickled, AntaInventory)
+        assert list(unpickled) == ["host", "10.0.0.1", "10.0.0.2"]
+        assert {name for name, device in dict.items(inventory) if isinstance(device, AsyncEOSDevice)} == {"host"}
+        assert {name for name, device in dict.items(unpickled) if isinstance(device, AsyncEOSDevice)} == {"host"}
+        assert set(unpickled.get_inventory(tags={"leaf"})) == {"10.0.0.1", "10.0.0.2"}
+        assert unpickled["host"] == inventory["host"]
+        assert unpickled["10.0.0.1"] == inventory["10.0.0.1"]
+
+    @pytest.mark.parametrize(
+        ("yaml_file", "enabled"),
+        [
+            pytest.param(
+                {"anta_inventory": {"hosts": [{"host": "10.0.1.1"}], "ranges": [{"start": "10.0.0.1", "end": "10.0.0.4"}]}},
+                True,
+                id="enabled",
+            ),
+            pytest.param(
+                {"anta_inventory": {"hosts": [{"host": "10.0.1.1"}], "ranges": [{"start": "10.0.0.1", "end": "10.0.0.4"}]}},
+                False,
+                id="disabled",
+            ),
+        ],
+        indirect=["yaml_file"],
+    )
+    async def test_connect_inventory_discovery(self, yaml_file: Path, setenvvar: pytest.MonkeyPatch, *, enabled: bool) -> None:
+        """Test connect_inventory() only creates and refreshes the devices of the network and range sections with an open eAPI port."""
+        setenvvar.setenv("ANTA_DISCOVERY_ENABLED", str(enabled))
+        get_discovery_settings.cache_clear()
+        inventory = AntaInventory.parse(filename=yaml_file, username="arista", password="arista123")
+
+        with (
+            patch("anta.inventory.discover", return_value={"10.0.0.2"}) as discover_mock,
+            patch.object(AsyncEOSDevice, "refresh", autospec=True) as refresh_mock,
+            patch.object(AsyncEOSDevice, "disconnect", autospec=True) as disconnect_mock,
+        ):
+            await inventory.connect_inventory()
+            await inventory.disconnect_inventory()
+        get_discovery_settings.cache_clear()
+
+        refreshed = {call.args[0].name for call in refresh_mock.call_args_list}
+        if enabled:
+            discover_mock.assert_awaited_once()
+            assert set(discover_mock.call_args.args[0]) == {"10.0.0.1", "10.0.0.2", "10.0.0.3", "10.0.0.4"}
+            assert refreshed == {"10.0.1.1", "10.0.0.2"}
+            assert {name for name, device in dict.items(inventory) if isinstance(device, AsyncEOSDevice)} == refreshed
+        else:
+            discover_mock.assert_not_awaited()
+            assert refreshed == set(inventory)
+        assert {call.args[0].name for call in disconnect_mock.call_args_list} == refreshed
+
+    async def test_connect_inventory_facts(self, setenvvar: pytest.MonkeyPatch, tmp_path: Path) -> None:
+        """Test connect_inventory() establishes the devices with fresh persisted facts without refreshing them."""
+        path = tmp_path / "facts.json"
+        setenvvar.setenv("ANTA_FACTS_PATH", str(path))
+        get_facts_settings.cache_clear()
+
+        async def refresh(device: AsyncEOSDevice) -> None:
+            device.is_online = device.established = device.name != "10.0.0.3"
+            device.hw_model = "cEOSLab" if device.established else None
+            device.eos_version = "4.31.1F" if device.established else None
+
+        def build_inventory() -> AntaInventory:
+            inventory = AntaInventory()
+            for i in range(1, 4):
+                inventory.add_device(AsyncEOSDevice(host=f"10.0.0.{i}", username="arista", password="arista123"))
+            return inventory
+
+        with (
+            patch.object(AsyncEOSDevice, "refresh", autospec=True, side_effect=refresh) as refresh_mock,
+            patch.object(AsyncEOSDevice, "disconnect", autospec=True),
+        ):
+            await build_inventory().connect_inventory()
+            assert refresh_mock.call_count == 3
+            assert set(json.loads(path.read_text(encoding="UTF-8"))) == {"10.0.0.1:443", "10.0.0.2:443"}
+
+            refresh_mock.reset_mock()
+            inventory = build_inventory()
+            await inventory.connect_inventory()
+            assert [call.args[0].name for call in refresh_mock.call_args_list] == ["10.0.0.3"]
+            assert set(inventory.get_inventory(established_only=True)) == {"10.0.0.1", "10.0.0.2"}
+            assert inventory["10.0.0.1"].hw_model == "cEOSLab"
+            assert inventory["10.0.0.1"].eos_version == "4.31.1F"
+
+            # The device became unreachable during the run
+            inventory["10.0.0.2"].is_online = False
+            await inventory.disconnect_inventory()
+        get_facts_settings.cache_clear()
+
+        assert set(json.loads(path.read_text(encoding="UTF-8"))) == {"10.0.0.1:443"}
+
     @pytest.mark.parametrize(("inventory"), [{"count": 3}], indirect=True)
     def test_max_potential_connections(self, inventory: AntaInventory) -> None:
         """Test max_potential_connections property with regular AsyncEOSDevice objects in the inventory."""
@@ -0,0 +1,69 @@
+# Copyright (c) 2023-2026 Arista Networks, Inc.
+# Use of this source code is governed by the Apache License 2.0
+# that can be found in the LICENSE file.
+"""Test anta._cache.py."""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+from unittest.mock import patch
+
+import pytest
+
+from anta._cache import SQLiteCacheStore, get_cache_store
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+
+class TestSQLiteCacheStore:
+    """Test SQLiteCacheStore class."""
+
+    @pytest.mark.parametrize("value", [pytest.param({"version": "4.31.1F", "uptime": 42}, id="json"), pytest.param("Arista DCS-7280CR3-32P4", id="text")])
+    def test_get_set(self, tmp_path: Path, value: str | dict[str, str | int]) -> None:
+        """Test SQLiteCacheStore.get() and SQLiteCacheStore.set()."""
+        store = SQLiteCacheStore(tmp_path / "cache.db")
+        assert store.get("device1", "uid") is None
+
+        store.set("device1", "uid", value, ttl=60)
+
+        assert store.get("device1", "uid") == value
+        assert store.get("device2", "uid") is None
+
+    def test_expired(self, tmp_path: Path) -> None:
+        """Test SQLiteCacheStore.get() with an expired entry."""
+        store = SQLiteCacheStore(tmp_path / "cache.db")
+        with patch("anta._cache.time", return_value=0):
+            store.set("device1", "uid", "value", ttl=60)
+
+        with patch("anta._cache.time", return_value=59):
+            assert store.get("device1", "uid") == "value"
+        with patch("anta._cache.time", return_value=60):
+            assert store.get("device1", "uid") is None
+
+    def test_shared_database(self, tmp_path: Path) -> None:
+        """Test two SQLiteCacheStore instances, e.g. from two ANTA processes, sharing the same database."""
+        store1 = SQLiteCacheStore(tmp_path / "cache.db")
+        store2 = SQLiteCacheStore(tmp_path / "cache.db")
+
+        store1.set("device1", "uid", "value", ttl=60)
+
+        assert store2.get("device1", "uid") == "value"
+
+    def test_purge_expired(self, tmp_path: Path) -> None:
+        """Test SQLiteCacheStore purges the expired entries when opening the database."""
+        store = SQLiteCacheStore(tmp_path / "cache.db")
+        with patch("anta._cache.time", return_value=0):
+            store.set("device1", "uid", "value", ttl=60)
+
+        SQLiteCacheStore(tmp_path / "cache.db")
+
+        assert store._connection.execute("SELECT COUNT(*) FROM cache").fetchone()[0] == 0
+
+
+def test_get_cache_store(tmp_path: Path) -> None:
+    """Test get_cache_store() returns a single store per database."""
+    store = get_cache_store(tmp_path / "cache.db")
+
+    assert store is get_cache_store(tmp_path / "cache.db")
+    assert store.path == tmp_path / "cache.db"
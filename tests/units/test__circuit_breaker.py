@@ -0,0 +1,70 @@
+# Copyright (c) 2023-2026 Arista Networks, Inc.
+# Use of this source code is governed by the Apache License 2.0
+# that can be found in the LICENSE file.
+"""Test anta._circuit_breaker.py."""
+
+from __future__ import annotations
+
+import logging
+from unittest.mock import AsyncMock
+
+import pytest
+
+from anta._circuit_breaker import CircuitBreaker
+
+
+class TestCircuitBreaker:
+    """Test CircuitBreaker class."""
+
+    def test_record_failure(self, caplog: pytest.LogCaptureFixture) -> None:
+        """Test CircuitBreaker.record_failure() opens the breaker once the threshold is reached."""
+        caplog.set_level(logging.WARNING)
+        breaker = CircuitBreaker("device", threshold=2, cooldown=30)
+
+        breaker.record_failure()
+        assert breaker.state == "closed"
+
+        breaker.record_failure()
+        assert breaker.state == "open"
+        assert repr(breaker) == "CircuitBreaker('device', state='open', failures=2)"
+        assert breaker.error_message == "Circuit breaker open for device device after 2 consecutive transport failures"
+        assert caplog.messages == ["Circuit breaker open for device device after 2 consecutive transport failures. Remaining collections will fail for 30s"]
+
+    def test_record_success(self) -> None:
+        """Test CircuitBreaker.record_success() resets the consecutive failures."""
+        breaker = CircuitBreaker("device", threshold=2, cooldown=30)
+
+        breaker.record_failure()
+        breaker.record_success()
+        breaker.record_failure()
+
+        assert breaker.state == "closed"
+        assert breaker.failures == 1
+
+    async def test_allow_closed(self) -> None:
+        """Test CircuitBreaker.allow() when the breaker is closed."""
+        breaker = CircuitBreaker("device", threshold=1, cooldown=30)
+        probe = AsyncMock(return_value=True)
+
+        assert await breaker.allow(probe)
+        probe.assert_not_called()
+
+    async def test_allow_open(self) -> None:
+        """Test CircuitBreaker.allow() when the breaker is open before the cooldown elapsed."""
+        breaker = CircuitBreaker("device", threshold=1, cooldown=30)
+        breaker.record_failure()
+        probe = AsyncMock(return_value=True)
+
+        assert not await breaker.allow(probe)
+        probe.assert_not_called()
+
+    @pytest.mark.parametrize(("probe_result", "expected_state"), [pytest.param(True, "closed", id="probe-ok"), pytest.param(False, "open", id="probe-failed")])
+    async def test_allow_half_open(self, probe_result: bool, expected_state: str) -> None:
+        """Test CircuitBreaker.allow() probes the device once the cooldown elapsed."""
+        breaker = CircuitBreaker("device", threshold=1, cooldown=0)
+        breaker.record_failure()
+        probe = AsyncMock(return_value=probe_result)
+
+        assert await breaker.allow(probe) is probe_result
+        assert breaker.state == expected_state
+        probe.assert_awaited_once()
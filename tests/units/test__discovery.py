@@ -0,0 +1,122 @@
+# Copyright (c) 2023-2026 Arista Networks, Inc.
+# Use of this source code is governed by the Apache License 2.0
+# that can be found in the LICENSE file.
+"""Test anta._discovery.py."""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import logging
+from typing import TYPE_CHECKING
+from unittest.mock import patch
+
+from httpx import URL
+
+from anta._discovery import DiscoveryCache, discover
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+    import pytest
+
+URLS = {f"10.0.0.{i}": URL(f"https://10.0.0.{i}") for i in range(1, 11)}
+
+
+async def port_check(url: URL, timeout: float) -> bool:  # noqa: ARG001
+    """Fake port check: only the hosts with an odd address have an open port."""
+    await asyncio.sleep(0)
+    return int(str(url.host).rsplit(".", maxsplit=1)[-1]) % 2 == 1
+
+
+class TestDiscover:
+    """Test the discover() function."""
+
+    async def test_discover(self) -> None:
+        """Test discover() returns the hosts with an open port and bounds the number of concurrent port checks."""
+        in_flight = max_in_flight = 0
+
+        async def bounded_port_check(url: URL, timeout: float) -> bool:
+            nonlocal in_flight, max_in_flight
+            in_flight += 1
+            max_in_flight = max(max_in_flight, in_flight)
+            result = await port_check(url, timeout)
+            in_flight -= 1
+            return result
+
+        with patch("anta._discovery.port_check_url", side_effect=bounded_port_check) as port_check_mock:
+            discovered = await discover(URLS, timeout=0.5, max_concurrency=3)
+
+        assert discovered == {"10.0.0.1", "10.0.0.3", "10.0.0.5", "10.0.0.7", "10.0.0.9"}
+        assert port_check_mock.call_count == 10
+        assert port_check_mock.call_args.kwargs == {"timeout": 0.5}
+        assert max_in_flight == 3
+
+    async def test_discover_cache(self, tmp_path: Path) -> None:
+        """Test discover() skips the port checks of the hosts in the discovery cache."""
+        path = tmp_path / "discovery.json"
+
+        with patch("anta._discovery.port_check_url", side_effect=port_check) as port_check_mock:
+            first = await discover(URLS, timeout=1, max_concurrency=10, cache=DiscoveryCache(path, ttl=60, negative_ttl=60))
+            assert port_check_mock.call_count == 10
+
+            urls = {**URLS, "10.0.0.11": URL("https://10.0.0.11")}
+            second = await discover(urls, timeout=1, max_concurrency=10, cache=DiscoveryCache(path, ttl=60, negative_ttl=60))
+            assert port_check_mock.call_count == 11
+
+        assert second == first | {"10.0.0.11"}
+        data = json.loads(path.read_text(encoding="UTF-8"))
+        assert len(data) == 11
+        assert data["https://10.0.0.1"][0] is True
+        assert data["https://10.0.0.2"][0] is False
+
+
+class TestDiscoveryCache:
+    """Test the DiscoveryCache class."""
+
+    def test_expired(self, tmp_path: Path) -> None:
+        """Test the expired entries are ignored."""
+        path = tmp_path / "discovery.json"
+        path.write_text(json.dumps({"https://10.0.0.1": [True, 0], "https://10.0.0.2": [False, 2**40]}), encoding="UTF-8")
+
+        cache = DiscoveryCache(path, ttl=60, negative_ttl=60)
+
+        assert cache.get(URL("https://10.0.0.1")) is None
+        assert cache.get(URL("https://10.0.0.2")) is False
+        cache.save()
+        assert json.loads(path.read_text(encoding="UTF-8")) == {"https://10.0.0.2": [False, 2**40]}
+
+    def test_invalid_file(self, tmp_path: Path, caplog: pytest.LogCaptureFixture) -> None:
+        """Test an invalid file is ignored and overwritten."""
+        caplog.set_level(logging.WARNING)
+        path = tmp_path / "discovery.json"
+        path.write_text("[invalid", encoding="UTF-8")
+
+        cache = DiscoveryCache(path, ttl=60, negative_ttl=60)
+        cache.set(URL("https://10.0.0.1"), is_open=True)
+        cache.save()
+
+        assert f"Ignoring the invalid discovery cache file {path}" in caplog.text
+        assert DiscoveryCache(path, ttl=60, negative_ttl=60).get(URL("https://10.0.0.1")) is True
+
+    def test_save_error(self, tmp_path: Path, caplog: pytest.LogCaptureFixture) -> None:
+        """Test a write error is logged."""
+        caplog.set_level(logging.WARNING)
+        path = tmp_path / "file"
+        path.write_text("", encoding="UTF-8")
+        cache = DiscoveryCache(path / "discovery.json", ttl=60, negative_ttl=60)
+
+        cache.save()
+
+        assert f"Failed to write the discovery cache file {path / 'discovery.json'}" in caplog.text
+
+    def test_negative_ttl(self, tmp_path: Path) -> None:
+        """Test the closed ports expire after the negative time-to-live."""
+        cache = DiscoveryCache(tmp_path / "discovery.json", ttl=3600, negative_ttl=1)
+
+        with patch("anta._discovery.time", return_value=1000.0):
+            cache.set(URL("https://10.0.0.1"), is_open=True)
+            cache.set(URL("https://10.0.0.2"), is_open=False)
+        with patch("anta._json_store.time", return_value=1001.0):
+            assert cache.get(URL("https://10.0.0.1")) is True
+            assert cache.get(URL("https://10.0.0.2")) is None
@@ -0,0 +1,105 @@
+# Copyright (c) 2023-2026 Arista Networks, Inc.
+# Use of this source code is governed by the Apache License 2.0
+# that can be found in the LICENSE file.
+"""Test anta._facts.py."""
+
+from __future__ import annotations
+
+import json
+import logging
+from typing import TYPE_CHECKING
+
+from anta._facts import DeviceFactsStore
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+    import pytest
+
+
+class TestDeviceFactsStore:
+    """Test the DeviceFactsStore class."""
+
+    def test_set_get(self, tmp_path: Path) -> None:
+        """Test the facts are persisted across stores and can be invalidated."""
+        path = tmp_path / "facts.json"
+        store = DeviceFactsStore(path, ttl=60)
+        assert store.get("10.0.0.1:443") is None
+        store.set("10.0.0.1:443", hw_model="cEOSLab", eos_version="4.31.1F")
+        store.set("10.0.0.2:443", hw_model="DCS-7280CR3-32P4-F", eos_version="4.31.1F")
+        store.save()
+
+        store = DeviceFactsStore(path, ttl=60)
+        facts = store.get("10.0.0.1:443")
+        assert facts is not None
+        assert facts.hw_model == "cEOSLab"
+        assert facts.eos_version == "4.31.1F"
+        assert facts.is_online
+        assert facts.established
+        store.invalidate("10.0.0.2:443")
+        store.invalidate("10.0.0.3:443")
+        store.save()
+
+        assert set(json.loads(path.read_text(encoding="UTF-8"))) == {"10.0.0.1:443"}
+
+    def test_concurrent_stores(self, tmp_path: Path) -> None:
+        """Test the facts set or invalidated by concurrent stores, e.g. of the worker processes of a sharded run, are merged."""
+        path = tmp_path / "facts.json"
+        store = DeviceFactsStore(path, ttl=60)
+        store.set("10.0.0.1:443", hw_model="cEOSLab", eos_version="4.31.1F")
+        store.save()
+        first = DeviceFactsStore(path, ttl=60)
+        second = DeviceFactsStore(path, ttl=60)
+
+        first.set("10.0.0.2:443", hw_model="cEOSLab", eos_version="4.31.1F")
+        first.save()
+        second.set("10.0.0.3:443", hw_model="cEOSLab", eos_version="4.31.1F")
+        second.invalidate("10.0.0.1:443")
+        second.save()
+
+        assert set(json.loads(path.read_text(encoding="UTF-8"))) == {"10.0.0.2:443", "10.0.0.3:443"}
+
+    def test_stale(self, tmp_path: Path) -> None:
+        """Test the stale facts are ignored."""
+        path = tmp_path / "facts.json"
+        path.write_text(
+            json.dumps(
+                {
+                    "10.0.0.1:443": {"hw_model": "cEOSLab", "eos_version": None, "is_online": True, "established": True, "last_seen": 0},
+                    "10.0.0.2:443": {"hw_model": "cEOSLab", "eos_version": None, "is_online": True, "established": True, "last_seen": 2**40},
+                }
+            ),
+            encoding="UTF-8",
+        )
+
+        store = DeviceFactsStore(path, ttl=60)
+
+        assert store.get("10.0.0.1:443") is None
+        assert store.get("10.0.0.2:443") is not None
+        store.save()
+        assert set(json.loads(path.read_text(encoding="UTF-8"))) == {"10.0.0.2:443"}
+
+    def test_invalid_file(self, tmp_path: Path, caplog: pytest.LogCaptureFixture) -> None:
+        """Test an invalid file is ignored and overwritten."""
+        caplog.set_level(logging.WARNING)
+        path = tmp_path / "facts.json"
+        path.write_text(json.dumps({"10.0.0.1:443": {"hw_model": "cEOSLab"}}), encoding="UTF-8")
+
+        store = DeviceFactsStore(path, ttl=60)
+        assert store.get("10.0.0.1:443") is None
+        store.set("10.0.0.1:443", hw_model="cEOSLab", eos_version="4.31.1F")
+        store.save()
+
+        assert f"Ignoring the invalid device facts file {path}" in caplog.text
+        assert DeviceFactsStore(path, ttl=60).get("10.0.0.1:443") is not None
+
+    def test_save_error(self, tmp_path: Path, caplog: pytest.LogCaptureFixture) -> None:
+        """Test a write error is logged."""
+        caplog.set_level(logging.WARNING)
+        path = tmp_path / "file"
+        path.write_text("", encoding="UTF-8")
+        store = DeviceFactsStore(path / "facts.json", ttl=60)
+
+        store.save()
+
+        assert f"Failed to write the device facts file {path / 'facts.json'}" in caplog.text
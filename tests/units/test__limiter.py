@@ -0,0 +1,120 @@
+# Copyright (c) 2023-2026 Arista Networks, Inc.
+# Use of this source code is governed by the Apache License 2.0
+# that can be found in the LICENSE file.
+"""Test anta._limiter.py."""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+from time import monotonic
+
+import pytest
+
+from anta._limiter import AIMDLimiter
+
+
+class TestAIMDLimiter:
+    """Test AIMDLimiter class."""
+
+    def test_init(self) -> None:
+        """Test AIMDLimiter initialization."""
+        limiter = AIMDLimiter("device", maximum=10, minimum=20)
+
+        assert limiter.window == 10
+        assert limiter.minimum == 10
+        assert limiter.in_flight == 0
+        assert repr(limiter) == "AIMDLimiter('device', window=10, in_flight=0)"
+
+    async def test_window(self) -> None:
+        """Test AIMDLimiter limits the number of concurrent requests to the window."""
+        limiter = AIMDLimiter("device", maximum=2)
+        max_in_flight = 0
+
+        async def request() -> None:
+            nonlocal max_in_flight
+            async with limiter:
+                max_in_flight = max(max_in_flight, limiter.in_flight)
+                await asyncio.sleep(0)
+
+        await asyncio.gather(*(request() for _ in range(10)))
+
+        assert max_in_flight == 2
+        assert limiter.in_flight == 0
+
+    def test_on_congestion(self, caplog: pytest.LogCaptureFixture) -> None:
+        """Test AIMDLimiter.on_congestion() decreases the window once per burst of congestion signals."""
+        caplog.set_level(logging.DEBUG)
+        limiter = AIMDLimiter("device", maximum=10)
+        started = monotonic()
+
+        limiter.on_congestion(started, reason="ReadTimeout")
+        limiter.on_congestion(started, reason="ReadTimeout")
+
+        assert limiter.window == 5
+        assert caplog.messages == ["Concurrency window of device decreased from 10 to 5 after ReadTimeout"]
+
+        limiter.on_congestion(monotonic())
+        assert limiter.window == 2
+
+    def test_on_congestion_minimum(self) -> None:
+        """Test AIMDLimiter.on_congestion() does not decrease the window below the minimum."""
+        limiter = AIMDLimiter("device", maximum=4, minimum=3)
+
+        limiter.on_congestion(monotonic())
+
+        assert limiter.window == 3
+
+    def test_on_success(self) -> None:
+        """Test AIMDLimiter.on_success() increases the window by one per window of successful requests."""
+        limiter = AIMDLimiter("device", maximum=10)
+        limiter.on_congestion(monotonic())
+        assert limiter.window == 5
+
+        for _ in range(6):
+            limiter.on_success(monotonic())
+        assert limiter.window == 6
+
+        for _ in range(100):
+            limiter.on_success(monotonic())
+        assert limiter.window == 10
+
+    def test_on_success_latency_threshold(self) -> None:
+        """Test AIMDLimiter.on_success() decreases the window when the latency exceeds the threshold."""
+        limiter = AIMDLimiter("device", maximum=10, latency_threshold=1.0)
+
+        limiter.on_success(monotonic() - 2.0)
+
+        assert limiter.window == 5
+
+    async def test_wake_up_on_increase(self) -> None:
+        """Test AIMDLimiter wakes up the waiters when the window increases."""
+        limiter = AIMDLimiter("device", maximum=2)
+        limiter.on_congestion(monotonic())
+        assert limiter.window == 1
+
+        async with limiter:
+            waiter = asyncio.create_task(limiter.__aenter__())
+            await asyncio.sleep(0)
+            assert not waiter.done()
+
+            limiter.on_success(monotonic())
+            assert limiter.window == 2
+            await asyncio.sleep(0)
+            assert waiter.done()
+
+        assert limiter.in_flight == 1
+
+    async def test_cancelled_waiter(self) -> None:
+        """Test AIMDLimiter with a cancelled waiter."""
+        limiter = AIMDLimiter("device", maximum=1)
+
+        async with limiter:
+            waiter = asyncio.create_task(limiter.__aenter__())
+            await asyncio.sleep(0)
+            waiter.cancel()
+            with pytest.raises(asyncio.CancelledError):
+                await waiter
+
+        assert limiter.in_flight == 0
+        assert not limiter._waiters
@@ -0,0 +1,153 @@
+# Copyright (c) 2023-2026 Arista Networks, Inc.
+# Use of this source code is governed by the Apache License 2.0
+# that can be found in the LICENSE file.
+"""Test anta._planner.py."""
+
+from __future__ import annotations
+
+import asyncio
+from typing import TYPE_CHECKING, ClassVar
+from unittest.mock import patch
+
+import pytest
+
+from anta._planner import DeviceCommandPlan
+from anta.models import AntaCommand, AntaTemplate, AntaTest
+from anta.settings import AntaTestsSettings
+from tests.units.test_models import FakeTestWithInput, FakeTestWithTemplateAggregate
+
+if TYPE_CHECKING:
+    from anta.device import AntaDevice
+
+
+class FakeTestShowVersion(AntaTest):
+    """ANTA test requiring `show version`."""
+
+    categories: ClassVar[list[str]] = []
+    commands: ClassVar[list[AntaCommand | AntaTemplate]] = [AntaCommand(command="show version")]
+
+    @AntaTest.anta_test
+    def test(self) -> None:
+        """Test function."""
+        self.result.is_success()
+
+
+class FakeTestShowVersionAndUptime(AntaTest):
+    """ANTA test requiring `show version`, `show uptime` and an uncached `show clock`."""
+
+    categories: ClassVar[list[str]] = []
+    commands: ClassVar[list[AntaCommand | AntaTemplate]] = [
+        AntaCommand(command="show version"),
+        AntaCommand(command="show uptime"),
+        AntaCommand(command="show clock", use_cache=False),
+    ]
+
+    @AntaTest.anta_test
+    def test(self) -> None:
+        """Test function."""
+        self.result.is_success()
+
+
+class TestDeviceCommandPlan:
+    """Test DeviceCommandPlan class."""
+
+    def test_add_test(self, device: AntaDevice) -> None:
+        """Test DeviceCommandPlan.add_test()."""
+        plan = DeviceCommandPlan(device)
+        tests = [FakeTestShowVersion(device), FakeTestShowVersion(device), FakeTestShowVersionAndUptime(device)]
+        for test in tests:
+            plan.add_test(test)
+
+        assert all(test.command_plan is plan for test in tests)
+        assert plan.total_commands == 4
+        assert plan.unique_commands == 2
+        assert plan.shared_commands == {"show version": 3}
+        assert repr(plan) == f"DeviceCommandPlan({device.name!r}, total_commands=4, unique_commands=2)"
+
+    def test_add_test_aggregate(self, device: AntaDevice) -> None:
+        """Test DeviceCommandPlan.add_test() plans the aggregate command instead of the aggregated commands."""
+        plan = DeviceCommandPlan(device)
+        with patch("anta.models.get_tests_settings", return_value=AntaTestsSettings(aggregation_threshold=1)):
+            test = FakeTestWithTemplateAggregate(device, inputs={"interfaces": ["Ethernet1", "Ethernet2"]})
+        plan.add_test(test)
+
+        assert plan.total_commands == 1
+        assert list(plan.commands.values()) == ["show interfaces"]
+
+    def test_add_commands(self, device: AntaDevice) -> None:
+        """Test DeviceCommandPlan.add_commands()."""
+        plan = DeviceCommandPlan(device)
+        plan.add_commands([AntaCommand(command="show version"), AntaCommand(command="show clock", use_cache=False)])
+        plan.add_commands([AntaCommand(command="show version")])
+
+        assert plan.total_commands == 2
+        assert plan.shared_commands == {"show version": 2}
+
+    def test_add_test_result_set(self, device: AntaDevice) -> None:
+        """Test DeviceCommandPlan.add_test() with a test which result is already set."""
+        plan = DeviceCommandPlan(device)
+        # Missing inputs, the test result is set to error
+        test = FakeTestWithInput(device)
+        plan.add_test(test)
+
+        assert test.command_plan is None
+        assert plan.total_commands == 0
+
+    @pytest.mark.parametrize("device", [{"disable_cache": True}], indirect=True)
+    async def test_collect_commands(self, device: AntaDevice) -> None:
+        """Test DeviceCommandPlan.collect_commands() collects each planned command once, even with caching disabled."""
+        plan = DeviceCommandPlan(device)
+        tests = [FakeTestShowVersion(device), FakeTestShowVersion(device), FakeTestShowVersionAndUptime(device)]
+        for test in tests:
+            plan.add_test(test)
+
+        results = await asyncio.gather(*(test.test() for test in tests))
+
+        assert all(result.result == "success" for result in results)
+        assert all(command.output is not None for test in tests for command in test.instance_commands)
+        collected = sorted(call.kwargs["command"].command for call in device._collect.call_args_list)  # type: ignore[attr-defined]
+        assert collected == ["show clock", "show uptime", "show version"]
+        # All the outputs have been released by the plan
+        assert not plan._remaining
+        assert not plan._collections
+
+    async def test_collect_commands_cache_released(self, device: AntaDevice) -> None:
+        """Test DeviceCommandPlan.collect_commands() drops the cache entries once all the tests requiring them are done."""
+        assert device.cache is not None
+        plan = DeviceCommandPlan(device)
+        tests = [FakeTestShowVersion(device), FakeTestShowVersionAndUptime(device)]
+        for test in tests:
+            plan.add_test(test)
+        uid = tests[0].instance_commands[0].uid
+        assert device.cache.refcounts[uid] == 2
+
+        await tests[0].test()
+        assert device.cache.refcounts[uid] == 1
+        assert uid in device.cache.cache
+
+        await tests[1].test()
+        assert not device.cache.refcounts
+        assert not device.cache.cache
+
+    async def test_collect_commands_unplanned(self, device: AntaDevice) -> None:
+        """Test DeviceCommandPlan.collect_commands() with commands that are not part of the plan."""
+        plan = DeviceCommandPlan(device)
+        command = AntaCommand(command="show version")
+
+        await plan.collect_commands([command])
+
+        assert command.output is not None
+        device._collect.assert_called_once()  # type: ignore[attr-defined]
+
+    async def test_clear(self, device: AntaDevice) -> None:
+        """Test DeviceCommandPlan.clear()."""
+        plan = DeviceCommandPlan(device)
+        plan.add_test(FakeTestShowVersion(device))
+        assert plan._remaining
+
+        plan.clear()
+
+        assert not plan._remaining
+        assert plan.unique_commands == 1
+        assert device.cache is not None
+        assert not device.cache.refcounts
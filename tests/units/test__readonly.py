@@ -0,0 +1,83 @@
+# Copyright (c) 2023-2026 Arista Networks, Inc.
+# Use of this source code is governed by the Apache License 2.0
+# that can be found in the LICENSE file.
+"""Test anta._readonly.py."""
+
+from __future__ import annotations
+
+import copy
+import json
+import pickle
+from typing import Any
+
+import pytest
+
+from anta._readonly import ReadOnlyDict, ReadOnlyList, freeze
+
+OUTPUT = {"interfaces": {"Ethernet1": {"ipv4": ["10.0.0.1", "10.0.0.2"]}}, "count": 1}
+
+
+@pytest.mark.parametrize(
+    ("value", "expected"),
+    [
+        pytest.param(OUTPUT, ReadOnlyDict, id="dict"),
+        pytest.param([1, 2], ReadOnlyList, id="list"),
+        pytest.param("text output", str, id="text"),
+        pytest.param(None, type(None), id="none"),
+    ],
+)
+def test_freeze(value: Any, expected: type) -> None:  # noqa: ANN401
+    """Test freeze() returns an equal read-only value."""
+    frozen = freeze(value)
+
+    assert isinstance(frozen, expected)
+    assert frozen == value
+
+
+def test_freeze_nested() -> None:
+    """Test freeze() converts nested containers and returns read-only values as is."""
+    frozen = freeze(OUTPUT)
+
+    assert isinstance(frozen["interfaces"]["Ethernet1"], ReadOnlyDict)
+    assert isinstance(frozen["interfaces"]["Ethernet1"]["ipv4"], ReadOnlyList)
+    assert freeze(frozen) is frozen
+    # The original value is not modified
+    assert type(OUTPUT["interfaces"]) is dict
+
+
+@pytest.mark.parametrize(
+    ("mutation", "method"),
+    [
+        pytest.param(lambda output: output.__setitem__("count", 2), "ReadOnlyDict.__setitem__", id="dict-setitem"),
+        pytest.param(lambda output: output.__delitem__("count"), "ReadOnlyDict.__delitem__", id="dict-delitem"),
+        pytest.param(lambda output: output.pop("count"), "ReadOnlyDict.pop", id="dict-pop"),
+        pytest.param(lambda output: output["interfaces"].update({}), "ReadOnlyDict.update", id="dict-update"),
+        pytest.param(lambda output: output["interfaces"].setdefault("Ethernet2", {}), "ReadOnlyDict.setdefault", id="dict-setdefault"),
+        pytest.param(lambda output: output.__ior__({}), "ReadOnlyDict.__ior__", id="dict-ior"),
+        pytest.param(lambda output: output["interfaces"]["Ethernet1"]["ipv4"].append("10.0.0.3"), "ReadOnlyList.append", id="list-append"),
+        pytest.param(lambda output: output["interfaces"]["Ethernet1"]["ipv4"].sort(), "ReadOnlyList.sort", id="list-sort"),
+        pytest.param(lambda output: output["interfaces"]["Ethernet1"]["ipv4"].__iadd__([]), "ReadOnlyList.__iadd__", id="list-iadd"),
+        pytest.param(lambda output: output["interfaces"]["Ethernet1"]["ipv4"].__setitem__(0, "10.0.0.3"), "ReadOnlyList.__setitem__", id="list-setitem"),
+    ],
+)
+def test_mutation(mutation: Any, method: str) -> None:  # noqa: ANN401
+    """Test read-only containers raise a TypeError on any attempted mutation."""
+    frozen = freeze(OUTPUT)
+
+    with pytest.raises(TypeError, match=rf"Command outputs are read-only, '{method}' is not supported"):
+        mutation(frozen)
+    assert frozen == OUTPUT
+
+
+def test_copy() -> None:
+    """Test read-only containers can be copied, serialized and pickled."""
+    frozen = freeze(OUTPUT)
+
+    mutable = frozen.copy()
+    mutable["count"] = 2
+    assert type(mutable) is dict
+    assert type(frozen["interfaces"]["Ethernet1"]["ipv4"].copy()) is list
+    assert json.loads(json.dumps(frozen)) == OUTPUT
+    for value in (copy.deepcopy(frozen), pickle.loads(pickle.dumps(frozen))):  # noqa: S301
+        assert value == OUTPUT
+        assert isinstance(value["interfaces"]["Ethernet1"]["ipv4"], ReadOnlyList)
@@ -5,31 +5,95 @@
 
 from __future__ import annotations
 
+import asyncio
+import json
 import logging
+import multiprocessing
 import os
+import threading
 from collections import defaultdict
+from inspect import getcoroutinelocals
 from pathlib import Path
-from typing import ClassVar
+from typing import TYPE_CHECKING, ClassVar
 from unittest.mock import AsyncMock, patch
 
+import httpx
 import pytest
 import respx
 from pydantic import ValidationError
 
 from anta._runner import AntaRunContext, AntaRunFilters, AntaRunner
 from anta.catalog import AntaCatalog, AntaTestDefinition
+from anta.decorators import skip_on_platforms
 from anta.device import AsyncEOSDevice
 from anta.inventory import AntaInventory
 from anta.models import AntaCommand, AntaTemplate, AntaTest
 from anta.result_manager import ResultManager
 from anta.result_manager.models import TestResult as AntaTestResult
-from anta.settings import DEFAULT_MAX_CONCURRENCY, DEFAULT_NOFILE, AntaRunnerSettings
+from anta.settings import DEFAULT_DEVICE_MAX_CONCURRENCY, DEFAULT_MAX_CONCURRENCY, DEFAULT_NOFILE, DEFAULT_WORKERS, AntaRunnerSettings, AntaTestsSettings
+from anta.tests.routing.bgp import VerifyBGPPeerSession
 from anta.tests.routing.generic import VerifyRoutingTableEntry
-from tests.units.test_models import FakeTest
+from tests.units.test__planner import FakeTestShowVersion
+from tests.units.test_models import FakeTest, FakeTestWithTemplate, FakeTestWithTemplateAggregate
+
+if TYPE_CHECKING:
+    from multiprocessing.connection import Connection
 
 DATA_DIR: Path = Path(__file__).parent.parent.resolve() / "data"
 
 
+class FakeTestSkippedOnPytest(AntaTest):
+    """ANTA test requiring `show version`, not supported on the `pytest` hardware model of the test devices."""
+
+    categories: ClassVar[list[str]] = ["system"]
+    commands: ClassVar[list[AntaCommand | AntaTemplate]] = [AntaCommand(command="show version")]
+
+    @skip_on_platforms(["pytest"])
+    @AntaTest.anta_test
+    def test(self) -> None:
+        """Test function."""
+        self.result.is_success()
+
+
+class ThreadConnection:
+    """Sending end of the pipe of a worker thread, closed once closed by both the main thread and the worker thread like the pipe of a worker process."""
+
+    def __init__(self, connection: Connection) -> None:
+        """Initialize the sending end of the pipe."""
+        self.connection = connection
+        self.opened = 2
+
+    def send(self, obj: object) -> None:
+        """Send an object to the main thread."""
+        self.connection.send(obj)
+
+    def close(self) -> None:
+        """Close the pipe once closed by both the main thread and the worker thread."""
+        self.opened -= 1
+        if not self.opened:
+            self.connection.close()
+
+
+class ThreadProcess(threading.Thread):
+    """Worker process running in a thread."""
+
+    def terminate(self) -> None:
+        """Worker threads cannot be terminated."""
+
+
+def thread_pipe(*, duplex: bool) -> tuple[Connection, ThreadConnection]:
+    """Return a pipe to a worker thread."""
+    receiver, sender = multiprocessing.Pipe(duplex=duplex)
+    return receiver, ThreadConnection(sender)
+
+
+class ThreadContext:
+    """Multiprocessing context running the worker processes in threads, as the devices of the fixtures are only mocked in this process."""
+
+    Process = ThreadProcess
+    Pipe = staticmethod(thread_pipe)
+
+
 # pylint: disable=too-many-public-methods
 class TestAntaRunner:
     """Test AntaRunner class."""
@@ -37,7 +101,7 @@ class TestAntaRunner:
     def test_init_with_default_settings(self, caplog: pytest.LogCaptureFixture) -> None:
         """Test initialization with default settings."""
         caplog.set_level(logging.DEBUG)
-        default_settings = {"nofile": DEFAULT_NOFILE, "max_concurrency": DEFAULT_MAX_CONCURRENCY}
+        default_settings = {"nofile": DEFAULT_NOFILE, "max_concurrency": DEFAULT_MAX_CONCURRENCY, "workers": DEFAULT_WORKERS}
 
         runner = AntaRunner()
 
@@ -47,9 +111,10 @@ class TestAntaRunner:
     def test_init_with_custom_env_settings(self, caplog: pytest.LogCaptureFixture, setenvvar: pytest.MonkeyPatch) -> None:
         """Test initialization with custom env settings."""
         caplog.set_level(logging.DEBUG)
-        desired_settings = {"nofile": 1048576, "max_concurrency": 10000}
+        desired_settings = {"nofile": 1048576, "max_concurrency": 10000, "workers": 4}
         setenvvar.setenv("ANTA_NOFILE", str(desired_settings["nofile"]))
         setenvvar.setenv("ANTA_MAX_CONCURRENCY", str(desired_settings["max_concurrency"]))
+        setenvvar.setenv("ANTA_WORKERS", str(desired_settings["workers"]))
 
         runner = AntaRunner()
 
@@ -294,6 +359,10 @@ class TestAntaRunner:
         catalog = AntaCatalog.from_list([(FakeTest, None)])
         runner = AntaRunner()
 
+        # Create the eAPI clients, as refresh() would do
+        assert not reachable._client.is_closed
+        assert not unreachable._client.is_closed
+
         async def refresh_reachable() -> None:
             reachable.is_online = True
             reachable.established = True
@@ -374,7 +443,7 @@ class TestAntaRunner:
 
         with (
             patch.object(device, "refresh", new=AsyncMock(side_effect=refresh)),
-            patch.object(runner, "_get_test_coroutines", return_value=[raise_during_execution()]),
+            patch.object(runner, "_get_test_coroutines", return_value=[(0, raise_during_execution())]),
             pytest.raises(RuntimeError, match="test execution failed"),
         ):
             await runner.run(inventory, catalog, disconnect=True)
@@ -448,6 +517,32 @@ class TestAntaRunner:
         for line in expected_output:
             assert line in caplog.text
 
+    async def test_log_run_information_command_plans(self, caplog: pytest.LogCaptureFixture) -> None:
+        """Test AntaRunner._log_run_information with the command plans in dry-run."""
+        caplog.set_level(logging.INFO)
+
+        inventory = AntaInventory.parse(filename=DATA_DIR / "test_inventory_with_tags.yml", username="anta", password="anta")
+        catalog = AntaCatalog(
+            tests=[
+                AntaTestDefinition(test=VerifyRoutingTableEntry, inputs={"routes": ["10.1.0.1"]}),
+                AntaTestDefinition(test=VerifyRoutingTableEntry, inputs={"routes": ["10.1.0.1", "10.1.0.2"]}),
+            ]
+        )
+        runner = AntaRunner()
+
+        ctx = await runner.run(inventory, catalog, filters=AntaRunFilters(devices={"leaf1"}), dry_run=True)
+
+        assert set(ctx.command_plans) == {"leaf1"}
+        assert ctx.total_commands_planned == 3
+        assert ctx.total_unique_commands_planned == 2
+        expected_output = [
+            "2 unique commands to collect for 3 commands required by the scheduled tests",
+            "Command plan for 'leaf1': 2 unique commands (1 shared, 1 required by a single test) for 3 commands",
+            "Command 'show ip route vrf default 10.1.0.1' shared by 2 tests on 'leaf1'",
+        ]
+        for line in expected_output:
+            assert line in caplog.messages
+
     async def test_log_run_information_concurrency_limit(self, caplog: pytest.LogCaptureFixture) -> None:
         """Test AntaRunner._log_run_information with higher tests count than concurrency limit."""
         caplog.set_level(logging.WARNING)
@@ -529,6 +624,409 @@ class TestAntaRunner:
         assert len(ctx.manager) == 15
         for result in ctx.manager.results:
             assert result.result == "failure"
+        assert ctx.concurrency_windows == {device.name: DEFAULT_DEVICE_MAX_CONCURRENCY for device in inventory.devices}
+
+    @pytest.mark.parametrize(("inventory"), [{"count": 2}], indirect=True)
+    @respx.mock
+    async def test_run_narrowed(self, inventory: AntaInventory) -> None:
+        """Test AntaRunner.run() collects the targeted commands of a template below the narrowing threshold."""
+        outputs = {
+            "show bgp neighbors 10.100.0.8 vrf default": {"vrfs": {"default": {"peerList": [{"peerAddress": "10.100.0.8", "state": "Established"}]}}},
+            "show bgp neighbors 10.100.0.9 vrf MGMT": {"vrfs": {"MGMT": {"peerList": [{"peerAddress": "10.100.0.9", "state": "Idle"}]}}},
+        }
+        route = respx.post(path="/command-api", headers={"Content-Type": "application/json-rpc"})
+        route.side_effect = lambda request: httpx.Response(200, json={"result": [outputs[cmd["cmd"]] for cmd in json.loads(request.content)["params"]["cmds"]]})
+        inputs = {"check_tcp_queues": False, "bgp_peers": [{"peer_address": "10.100.0.8", "vrf": "default"}, {"peer_address": "10.100.0.9", "vrf": "MGMT"}]}
+        catalog = AntaCatalog(tests=[AntaTestDefinition(test=VerifyBGPPeerSession, inputs=inputs)])
+        runner = AntaRunner()
+
+        with patch("anta.models.get_tests_settings", return_value=AntaTestsSettings(narrowing_threshold=2)):
+            ctx = await runner.run(inventory, catalog)
+
+        collected = sorted(cmd["cmd"] for request, _ in route.calls for cmd in json.loads(request.content)["params"]["cmds"])
+        # The targeted commands are collected on each device instead of the fallback
+        assert collected == sorted(list(outputs) * 2)
+        assert ctx.total_unique_commands_planned == 4
+        assert len(ctx.manager) == 2
+        for result in ctx.manager.results:
+            assert result.result == "failure"
+            assert [atomic.result for atomic in result.atomic_results] == ["success", "failure"]
+            assert result.messages == ["Peer: 10.100.0.9 VRF: MGMT - Incorrect session state - Expected: Established Actual: Idle"]
+
+    @pytest.mark.parametrize(("inventory"), [{"count": 3}], indirect=True)
+    @respx.mock
+    async def test_run_iter(self, inventory: AntaInventory) -> None:
+        """Test AntaRunner.run_iter()."""
+        respx.post(path="/command-api", headers={"Content-Type": "application/json-rpc"}, json__params__cmds__0__cmd="show ip route vrf default").respond(
+            json={"result": [{"vrfs": {"default": {"routes": {}}}}]}
+        )
+        tests = [AntaTestDefinition(test=VerifyRoutingTableEntry, inputs={"routes": [f"10.1.0.{i}"], "collect": "all"}) for i in range(5)]
+        ctx = AntaRunContext(inventory=inventory, catalog=AntaCatalog(tests=tests), manager=ResultManager(), filters=AntaRunFilters())
+        runner = AntaRunner()
+
+        results = [result async for result in runner.run_iter(ctx)]
+
+        assert len(results) == 15
+        assert all(result.result == "failure" for result in results)
+        # Results are not added to the context manager
+        assert len(ctx.manager) == 0
+        assert ctx.total_tests_scheduled == 15
+        assert ctx.start_time is not None
+        assert ctx.duration is not None
+
+    async def test_run_iter_dry_run(self) -> None:
+        """Test AntaRunner.run_iter() in dry-run."""
+        inventory = AntaInventory.parse(filename=DATA_DIR / "test_inventory_with_tags.yml", username="anta", password="anta")
+        catalog = AntaCatalog.parse(filename=DATA_DIR / "test_catalog_with_tags.yml")
+        ctx = AntaRunContext(inventory=inventory, catalog=catalog, manager=ResultManager(), filters=AntaRunFilters(), dry_run=True)
+
+        results = [result async for result in AntaRunner().run_iter(ctx)]
+
+        assert len(results) == ctx.total_tests_scheduled == 27
+        assert all(result.result == "unset" for result in results)
+
+    @pytest.mark.parametrize(("inventory"), [{"count": 1}], indirect=True)
+    async def test_run_iter_close(self, inventory: AntaInventory) -> None:
+        """Test closing AntaRunner.run_iter() before exhaustion cancels the pending tests."""
+        started = asyncio.Event()
+        cancelled = asyncio.Event()
+
+        class FastTest(FakeTest):
+            """ANTA test completing immediately."""
+
+        class SlowTest(FakeTest):
+            """ANTA test which command collection waits until cancelled."""
+
+            commands: ClassVar[list[AntaCommand | AntaTemplate]] = [AntaCommand(command="show version")]
+
+            async def collect(self) -> None:
+                """Collect function."""
+                started.set()
+                try:
+                    await asyncio.Event().wait()
+                except asyncio.CancelledError:
+                    cancelled.set()
+                    raise
+
+        catalog = AntaCatalog(tests=[AntaTestDefinition(test=FastTest, inputs=None), AntaTestDefinition(test=SlowTest, inputs=None)])
+        ctx = AntaRunContext(inventory=inventory, catalog=catalog, manager=ResultManager(), filters=AntaRunFilters())
+        run_iter = AntaRunner().run_iter(ctx)
+
+        result = await anext(run_iter)
+        assert result.result == "success"
+        await started.wait()
+        await run_iter.aclose()
+
+        await asyncio.wait_for(cancelled.wait(), timeout=1)
+        assert ctx.end_time is not None
+
+    @pytest.mark.parametrize(("inventory"), [{"count": 3}], indirect=True)
+    async def test_run_window(self, inventory: AntaInventory) -> None:
+        """Test AntaRunner.run() creates the test instances lazily within the max_concurrency window."""
+        running = 0
+        max_running = 0
+
+        class WindowTest(FakeTest):
+            """ANTA test tracking the number of running tests."""
+
+            commands: ClassVar[list[AntaCommand | AntaTemplate]] = [AntaCommand(command="show version")]
+
+            async def collect(self) -> None:
+                """Collect function."""
+                nonlocal running, max_running
+                running += 1
+                max_running = max(max_running, running)
+                await asyncio.sleep(0)
+                running -= 1
+                self.instance_commands[0].output = {}
+
+        catalog = AntaCatalog(tests=[AntaTestDefinition(test=WindowTest, inputs={"result_overwrite": {"description": str(i)}}) for i in range(5)])
+        runner = AntaRunner(settings=AntaRunnerSettings(max_concurrency=2))
+
+        with patch.object(runner, "_create_test", wraps=runner._create_test) as create_test_mock:
+            ctx = await runner.run(inventory, catalog)
+
+        assert len(ctx.manager) == 15
+        assert all(result.result == "success" for result in ctx.manager.results)
+        assert max_running == 2
+        # One prototype per test definition, reused for its first device
+        assert create_test_mock.call_count == 15
+        assert ctx.total_commands_planned == 15
+        assert ctx.total_unique_commands_planned == 3
+
+    @pytest.mark.parametrize(("inventory"), [{"count": 2}], indirect=True)
+    def test_get_test_coroutines_lazy(self, inventory: AntaInventory) -> None:
+        """Test AntaRunner._get_test_coroutines() creates the test instances lazily."""
+        catalog = AntaCatalog(tests=[AntaTestDefinition(test=FakeTest, inputs=None)])
+        runner = AntaRunner()
+        ctx = AntaRunContext(inventory=inventory, catalog=catalog, manager=ResultManager(), filters=AntaRunFilters(), selected_inventory=inventory)
+        runner._setup_tests(ctx)
+        prototypes = runner._plan_commands(ctx)
+        assert len(prototypes) == 1
+
+        with patch.object(runner, "_create_test", wraps=runner._create_test) as create_test_mock:
+            coros = runner._get_test_coroutines(ctx, prototypes)
+            create_test_mock.assert_not_called()
+
+            coros_list = list(coros)
+            # The prototype instance is used for the first device
+            create_test_mock.assert_called_once()
+
+        assert len(coros_list) == 2
+        # The prototype instance is released once scheduled, the rendered commands are kept for the other devices
+        assert prototypes[(catalog.tests[0], None)].test is None
+        assert [position for position, _ in coros_list] == [0, 0]
+        for _, coro in coros_list:
+            coro.close()
+
+    @pytest.mark.parametrize(("inventory"), [{"count": 2, "disable_cache": False}], indirect=True)
+    async def test_plan_commands_aggregate(self, inventory: AntaInventory) -> None:
+        """Test AntaRunner._plan_commands() plans the aggregate commands instead of the aggregated commands."""
+        catalog = AntaCatalog(tests=[AntaTestDefinition(test=FakeTestWithTemplateAggregate, inputs={"interfaces": ["Ethernet1", "Ethernet2", "Ethernet3"]})])
+        runner = AntaRunner()
+        ctx = AntaRunContext(inventory=inventory, catalog=catalog, manager=ResultManager(), filters=AntaRunFilters(), selected_inventory=inventory)
+        aggregate_uid = AntaCommand(command="show interfaces").uid
+
+        with patch("anta.models.get_tests_settings", return_value=AntaTestsSettings(aggregation_threshold=1)):
+            runner._setup_tests(ctx)
+            prototypes = runner._plan_commands(ctx)
+            coros = list(runner._get_test_coroutines(ctx, prototypes))
+
+        for device in inventory.devices:
+            assert ctx.command_plans[device.name].consumers == {aggregate_uid: 1}
+            assert device.cache is not None
+            assert dict(device.cache.refcounts) == {aggregate_uid: 1}
+        # The test instances collect the planned aggregate command
+        assert all([command.uid for command in getcoroutinelocals(coro)["self"].commands_to_collect] == [aggregate_uid] for _, coro in coros)
+
+        runner._close_test_coroutines(coros)
+        runner._clear_command_plans(ctx)
+        assert all(device.cache is not None and not device.cache.refcounts for device in inventory.devices)
+
+        with patch("anta.models.get_tests_settings", return_value=AntaTestsSettings(aggregation_threshold=1)):
+            ctx = await runner.run(inventory, catalog, dry_run=True)
+        assert ctx.total_commands_planned == 2
+        assert ctx.total_unique_commands_planned == 2
+
+    @pytest.mark.parametrize(("inventory"), [{"count": 3}], indirect=True)
+    async def test_run_skip_on_platforms(self, inventory: AntaInventory) -> None:
+        """Test AntaRunner.run() skips the tests not supported on the hardware model of the devices without creating them."""
+        tests = [
+            AntaTestDefinition(test=FakeTest, inputs=None),
+            AntaTestDefinition(test=FakeTestSkippedOnPytest, inputs={"result_overwrite": {"custom_field": "custom"}}),
+        ]
+        runner = AntaRunner()
+
+        with patch.object(runner, "_create_test", wraps=runner._create_test) as create_test_mock:
+            ctx = await runner.run(inventory, AntaCatalog(tests=tests))
+
+        assert {call.args[1].test for call in create_test_mock.call_args_list} == {FakeTest}
+        assert ctx.total_tests_scheduled == 6
+        assert len(ctx.results_skipped_at_setup) == 3
+        assert ctx.total_commands_planned == 0
+        skipped = [result for result in ctx.manager.results if result.test == "FakeTestSkippedOnPytest"]
+        assert len(skipped) == 3
+        for result in skipped:
+            assert result.result == "skipped"
+            assert result.messages == ["FakeTestSkippedOnPytest test is not supported on pytest"]
+            assert result.categories == ["system"]
+            assert result.custom_field == "custom"
+        assert all(result.result == "success" for result in ctx.manager.results if result.test == "FakeTest")
+
+    @pytest.mark.parametrize(("inventory"), [{"count": 3}], indirect=True)
+    async def test_run_order(self, inventory: AntaInventory) -> None:
+        """Test AntaRunner.run() adds the results in inventory order of the devices then in catalog order of the tests."""
+
+        class SlowTest(FakeTest):
+            """ANTA test completing after the other tests."""
+
+            name = "SlowTest"
+
+            async def collect(self) -> None:
+                """Collect function."""
+                await asyncio.sleep(0.01)
+
+        tests = [
+            AntaTestDefinition(test=SlowTest, inputs=None),
+            AntaTestDefinition(test=FakeTestSkippedOnPytest, inputs=None),
+            AntaTestDefinition(test=FakeTest, inputs=None),
+        ]
+        ctx = await AntaRunner().run(inventory, AntaCatalog(tests=tests))
+
+        assert [(result.name, result.test) for result in ctx.manager.results] == [
+            (device.name, test) for device in inventory.devices for test in ("SlowTest", "FakeTestSkippedOnPytest", "FakeTest")
+        ]
+
+    @pytest.mark.parametrize(("inventory"), [{"count": 3}], indirect=True)
+    async def test_run_render_once(self, inventory: AntaInventory) -> None:
+        """Test AntaRunner.run() renders the commands of a custom render() method only reading the inputs once per test definition."""
+        assert not FakeTestWithTemplate.render_per_device
+        catalog = AntaCatalog(tests=[AntaTestDefinition(test=FakeTestWithTemplate, inputs={"interface": "Ethernet1"})])
+        runner = AntaRunner()
+
+        with patch.object(FakeTestWithTemplate, "render", autospec=True, side_effect=FakeTestWithTemplate.render) as render_mock:
+            ctx = await runner.run(inventory, catalog, dry_run=True)
+
+        render_mock.assert_called_once()
+        assert len(ctx.manager) == 3
+        assert ctx.total_commands_planned == 3
+        assert ctx.total_unique_commands_planned == 3
+
+    @pytest.mark.parametrize(("inventory"), [{"count": 3}], indirect=True)
+    async def test_run_render_per_device(self, inventory: AntaInventory) -> None:
+        """Test AntaRunner.run() renders the commands of the custom render() methods once per device."""
+
+        class RenderPerDeviceTest(FakeTestWithTemplate):
+            """ANTA test whose render() depends on the device."""
+
+            def render(self, template: AntaTemplate) -> list[AntaCommand]:
+                """Render function."""
+                return [template.render(interface=f"{self.inputs.interface}-{self.device.name}")]
+
+        class FlaggedRenderPerDeviceTest(FakeTestWithTemplate):
+            """ANTA test whose render() depends on the device through another method."""
+
+            render_per_device: ClassVar[bool] = True
+
+        assert RenderPerDeviceTest.render_per_device
+        assert FlaggedRenderPerDeviceTest.render_per_device
+        assert not VerifyRoutingTableEntry.render_per_device
+        catalog = AntaCatalog(tests=[AntaTestDefinition(test=RenderPerDeviceTest, inputs={"interface": "Ethernet1"})])
+        runner = AntaRunner()
+        ctx = AntaRunContext(inventory=inventory, catalog=catalog, manager=ResultManager(), filters=AntaRunFilters(), selected_inventory=inventory)
+        runner._setup_tests(ctx)
+
+        with (
+            patch.object(runner, "_create_test", wraps=runner._create_test) as create_test_mock,
+            patch.object(RenderPerDeviceTest, "render", autospec=True, side_effect=RenderPerDeviceTest.render) as render_mock,
+        ):
+            prototypes = runner._plan_commands(ctx)
+            # One prototype instance per device, released once its commands are rendered
+            assert create_test_mock.call_count == 3
+            assert all(prototype.test is None and prototype.commands is not None for prototype in prototypes.values())
+            results = runner._close_test_coroutines(runner._get_test_coroutines(ctx, prototypes))
+
+        # The test instances are created lazily from the commands rendered for their device
+        assert create_test_mock.call_count == 6
+        assert render_mock.call_count == 3
+        assert len(results) == 3
+        assert {name: list(plan.commands.values()) for name, plan in ctx.command_plans.items()} == {
+            device.name: [f"show interface Ethernet1-{device.name}"] for device in inventory.devices
+        }
+
+    @pytest.mark.parametrize(("inventory"), [{"count": 3}], indirect=True)
+    async def test_run_sharded(self, caplog: pytest.LogCaptureFixture, inventory: AntaInventory) -> None:
+        """Test AntaRunner.run() with worker processes."""
+        caplog.set_level(logging.INFO)
+        catalog = AntaCatalog(tests=[AntaTestDefinition(test=FakeTestShowVersion, inputs=None), AntaTestDefinition(test=FakeTest, inputs=None)])
+        runner = AntaRunner(settings=AntaRunnerSettings(workers=2))
+
+        with patch("anta._runner.get_context", return_value=ThreadContext):
+            ctx = await runner.run(inventory, catalog)
+
+        assert "Running the tests of 3 devices in 2 worker processes" in caplog.messages
+        assert "6 total tests scheduled across all selected devices" in caplog.messages
+        assert [result.name for result in ctx.manager.results] == ["device-0", "device-0", "device-1", "device-1", "device-2", "device-2"]
+        assert len(ctx.manager) == 6
+        assert all(result.result == "success" for result in ctx.manager.results)
+        assert ctx.total_devices_selected_for_testing == 3
+        assert ctx.total_tests_scheduled == 6
+        assert ctx.total_commands_planned == 3
+        assert ctx.total_unique_commands_planned == 3
+        assert sorted(ctx.command_plans) == ["device-0", "device-1", "device-2"]
+        assert ctx.command_plans["device-0"].device is inventory["device-0"]
+        assert sorted(ctx.concurrency_windows) == ["device-0", "device-1", "device-2"]
+        assert ctx.end_time is not None
+
+    @pytest.mark.parametrize(("inventory"), [{"count": 2, "reachable": False}], indirect=True)
+    async def test_run_sharded_unreachable(self, inventory: AntaInventory) -> None:
+        """Test AntaRunner.run() with worker processes and unreachable devices."""
+        catalog = AntaCatalog(tests=[AntaTestDefinition(test=FakeTest, inputs=None)])
+        runner = AntaRunner(settings=AntaRunnerSettings(workers=2))
+
+        with patch("anta._runner.get_context", return_value=ThreadContext):
+            ctx = await runner.run(inventory, catalog)
+
+        assert len(ctx.manager) == 0
+        assert ctx.devices_unreachable_at_setup == ["device-0", "device-1"]
+        assert ctx.total_devices_selected_for_testing == 0
+        assert ctx.total_tests_scheduled == 0
+        # Warnings of the worker processes are not duplicated
+        assert ctx.warnings_at_setup == ["No reachable devices found for testing after connectivity checks. Exiting ..."]
+
+    @pytest.mark.parametrize(("inventory"), [{"count": 2}], indirect=True)
+    async def test_run_sharded_worker_failure(self, caplog: pytest.LogCaptureFixture, inventory: AntaInventory) -> None:
+        """Test AntaRunner.run() with a failing worker process."""
+        caplog.set_level(logging.ERROR)
+        catalog = AntaCatalog(tests=[AntaTestDefinition(test=FakeTest, inputs=None)])
+        runner = AntaRunner(settings=AntaRunnerSettings(workers=2))
+
+        with patch("anta._runner.get_context", return_value=ThreadContext), patch.object(AntaRunner, "_run_shard", side_effect=RuntimeError("Boom")):
+            ctx = await runner.run(inventory, catalog)
+
+        assert len(ctx.manager) == 0
+        assert "Worker process failed to run the tests on devices: device-0\nRuntimeError: Boom" in caplog.messages
+        assert "Worker process failed to run the tests on devices: device-1\nRuntimeError: Boom" in caplog.messages
+
+    @pytest.mark.parametrize(("inventory"), [{"count": 2}], indirect=True)
+    async def test_run_sharded_worker_exit(self, caplog: pytest.LogCaptureFixture, inventory: AntaInventory) -> None:
+        """Test AntaRunner.run() with a worker process exiting without its report."""
+        caplog.set_level(logging.ERROR)
+        catalog = AntaCatalog(tests=[AntaTestDefinition(test=FakeTest, inputs=None)])
+        runner = AntaRunner(settings=AntaRunnerSettings(workers=2))
+
+        def exit_worker(*args: object) -> None:
+            sender = args[4]
+            assert isinstance(sender, ThreadConnection)
+            sender.close()
+
+        with patch("anta._runner.get_context", return_value=ThreadContext), patch.object(AntaRunner, "_run_worker", side_effect=exit_worker):
+            ctx = await runner.run(inventory, catalog)
+
+        assert len(ctx.manager) == 0
+        assert "Worker process failed to run the tests on devices: device-0\nThe worker process exited unexpectedly" in caplog.messages
+        assert "Worker process failed to run the tests on devices: device-1\nThe worker process exited unexpectedly" in caplog.messages
+
+    async def test_run_sharded_processes(self, caplog: pytest.LogCaptureFixture) -> None:
+        """Test AntaRunner.run() with spawned worker processes."""
+        caplog.set_level(logging.DEBUG)
+        inventory = AntaInventory()
+        for port in (1, 2, 3):
+            inventory.add_device(AsyncEOSDevice(host="127.0.0.1", port=port, username="anta", password="anta", name=f"device-{port}", timeout=1))
+        catalog = AntaCatalog(tests=[AntaTestDefinition(test=VerifyRoutingTableEntry, inputs={"routes": ["10.1.0.1"]})])
+        runner = AntaRunner(settings=AntaRunnerSettings(workers=2))
+
+        ctx = await runner.run(inventory, catalog, filters=AntaRunFilters(established_only=False))
+
+        assert [result.name for result in ctx.manager.results] == ["device-1", "device-2", "device-3"]
+        assert all(result.result == "error" for result in ctx.manager.results)
+        assert ctx.total_tests_scheduled == 3
+        assert sorted(ctx.command_plans) == ["device-1", "device-2", "device-3"]
+        # The log records of the worker processes are handled by this process
+        assert any(record.process != os.getpid() for record in caplog.records)
+
+    @pytest.mark.parametrize(("inventory"), [{"count": 2}], indirect=True)
+    async def test_run_sharded_dry_run(self, inventory: AntaInventory) -> None:
+        """Test AntaRunner.run() in dry-run with worker processes runs in this process."""
+        catalog = AntaCatalog(tests=[AntaTestDefinition(test=FakeTest, inputs=None)])
+        runner = AntaRunner(settings=AntaRunnerSettings(workers=2))
+
+        with patch("anta._runner.get_context") as get_context_mock:
+            ctx = await runner.run(inventory, catalog, dry_run=True)
+
+        get_context_mock.assert_not_called()
+        assert len(ctx.manager) == 2
+
+    @pytest.mark.parametrize(("inventory"), [{"count": 5}], indirect=True)
+    def test_shard_inventory(self, inventory: AntaInventory) -> None:
+        """Test AntaRunner._shard_inventory() distributes the device names of the filtered inventory across the shards."""
+        runner = AntaRunner(settings=AntaRunnerSettings(workers=3))
+        ctx = AntaRunContext(inventory=inventory, catalog=AntaCatalog(), manager=ResultManager(), filters=AntaRunFilters())
+
+        shards = runner._shard_inventory(ctx)
+
+        assert [sorted(shard) for shard in shards] == [["device-0", "device-3"], ["device-1", "device-4"], ["device-2"]]
+        assert all(shard[name] is inventory[name] for shard in shards for name in shard)
 
     async def test_run_disconnect_called_when_enabled(self, caplog: pytest.LogCaptureFixture) -> None:
         """Test that disconnect_inventory is called after the run when disconnect=True."""
@@ -585,6 +1083,7 @@ class TestAntaRunContext:
         assert len(ctx.devices_unreachable_at_setup) == 0
         assert isinstance(ctx.warnings_at_setup, list)
         assert len(ctx.warnings_at_setup) == 0
+        assert ctx.concurrency_windows == {}
         assert ctx.start_time is None
         assert ctx.end_time is None
 
@@ -10,7 +10,7 @@ from typing import TYPE_CHECKING, ClassVar
 
 import pytest
 
-from anta.decorators import deprecated_test_class, skip_on_platforms
+from anta.decorators import deprecated_test_class, get_skipped_platforms, skip_on_platforms
 from anta.models import AntaCommand, AntaTemplate, AntaTest
 
 if TYPE_CHECKING:
@@ -75,3 +75,22 @@ async def test_skip_on_platforms(device: AntaDevice, platforms: list[str], devic
     await test_instance.test()
 
     assert test_instance.result.result == expected_result
+
+
+def test_get_skipped_platforms() -> None:
+    """Test get_skipped_platforms returns the platforms of the skip_on_platforms decorator of a test class."""
+
+    class SkippedTest(AntaTest):
+        """ANTA test skipped on virtual platforms."""
+
+        categories: ClassVar[list[str]] = []
+        commands: ClassVar[list[AntaCommand | AntaTemplate]] = []
+
+        @skip_on_platforms(["cEOSLab", "vEOS-lab"])
+        @AntaTest.anta_test
+        def test(self) -> None:
+            """Test function."""
+            self.result.is_success()
+
+    assert get_skipped_platforms(SkippedTest) == {"cEOSLab", "vEOS-lab"}
+    assert get_skipped_platforms(AntaTest) == frozenset()
@@ -7,6 +7,7 @@ from __future__ import annotations
 
 import asyncio
 import logging
+import pickle
 from contextlib import AbstractContextManager
 from contextlib import nullcontext as does_not_raise
 from pathlib import Path
@@ -15,10 +16,12 @@ from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 from asyncssh import SSHClientConnection, SSHClientConnectionOptions
-from httpx import ConnectError, ConnectTimeout, HTTPError, TimeoutException
+from httpx import ConnectError, ConnectTimeout, HTTPError, HTTPStatusError, PoolTimeout, ReadTimeout, Request, Response, TimeoutException
 from rich import print as rprint
 
-from anta.device import AntaDevice, AsyncEOSDevice
+from anta._cache import SQLiteCacheStore
+from anta._readonly import ReadOnlyDict
+from anta.device import AntaCache, AntaDevice, AsyncEOSDevice
 from anta.models import AntaCommand
 from asynceapi import EapiCommandError
 from asynceapi._models import EAPIClientConnectionOptions
@@ -415,118 +418,109 @@ ASYNCEAPI_COPY_PARAMS: list[ParameterSet] = [
 REFRESH_PARAMS: list[ParameterSet] = [
     pytest.param(
         {},
-        (
-            {"return_value": True},
-            {
-                "return_value": [
-                    {
-                        "mfgName": "Arista",
-                        "modelName": "DCS-7280CR3-32P4-F",
-                        "hardwareRevision": "11.00",
-                        "serialNumber": "JPE19500066",
-                        "systemMacAddress": "fc:bd:67:3d:13:c5",
-                        "hwMacAddress": "fc:bd:67:3d:13:c5",
-                        "configMacAddress": "00:00:00:00:00:00",
-                        "version": "4.31.1F-34361447.fraserrel (engineering build)",
-                        "architecture": "x86_64",
-                        "internalVersion": "4.31.1F-34361447.fraserrel",
-                        "internalBuildId": "4940d112-a2fc-4970-8b5a-a16cd03fd08c",
-                        "imageFormatVersion": "3.0",
-                        "imageOptimization": "Default",
-                        "bootupTimestamp": 1700729434.5892005,
-                        "uptime": 20666.78,
-                        "memTotal": 8099732,
-                        "memFree": 4989568,
-                        "isIntlVersion": False,
-                    }
-                ]
-            },
-        ),
+        {
+            "return_value": [
+                {
+                    "mfgName": "Arista",
+                    "modelName": "DCS-7280CR3-32P4-F",
+                    "hardwareRevision": "11.00",
+                    "serialNumber": "JPE19500066",
+                    "systemMacAddress": "fc:bd:67:3d:13:c5",
+                    "hwMacAddress": "fc:bd:67:3d:13:c5",
+                    "configMacAddress": "00:00:00:00:00:00",
+                    "version": "4.31.1F-34361447.fraserrel (engineering build)",
+                    "architecture": "x86_64",
+                    "internalVersion": "4.31.1F-34361447.fraserrel",
+                    "internalBuildId": "4940d112-a2fc-4970-8b5a-a16cd03fd08c",
+                    "imageFormatVersion": "3.0",
+                    "imageOptimization": "Default",
+                    "bootupTimestamp": 1700729434.5892005,
+                    "uptime": 20666.78,
+                    "memTotal": 8099732,
+                    "memFree": 4989568,
+                    "isIntlVersion": False,
+                }
+            ]
+        },
         {"is_online": True, "established": True, "hw_model": "DCS-7280CR3-32P4-F"},
         id="established",
     ),
     pytest.param(
         {},
-        (
-            {"side_effect": HTTPError(message="Unauthorized")},
-            {},
-        ),
+        {"side_effect": HTTPError(message="Unauthorized")},
         {"is_online": False, "established": False, "hw_model": None},
         id="is not online",
     ),
     pytest.param(
         {},
-        (
-            {"return_value": True},
-            {
-                "return_value": [
-                    {
-                        "mfgName": "Arista",
-                        "hardwareRevision": "11.00",
-                        "serialNumber": "JPE19500066",
-                        "systemMacAddress": "fc:bd:67:3d:13:c5",
-                        "hwMacAddress": "fc:bd:67:3d:13:c5",
-                        "configMacAddress": "00:00:00:00:00:00",
-                        "version": "4.31.1F-34361447.fraserrel (engineering build)",
-                        "architecture": "x86_64",
-                        "internalVersion": "4.31.1F-34361447.fraserrel",
-                        "internalBuildId": "4940d112-a2fc-4970-8b5a-a16cd03fd08c",
-                        "imageFormatVersion": "3.0",
-                        "imageOptimization": "Default",
-                        "bootupTimestamp": 1700729434.5892005,
-                        "uptime": 20666.78,
-                        "memTotal": 8099732,
-                        "memFree": 4989568,
-                        "isIntlVersion": False,
-                    }
-                ]
-            },
-        ),
+        {
+            "return_value": [
+                {
+                    "mfgName": "Arista",
+                    "hardwareRevision": "11.00",
+                    "serialNumber": "JPE19500066",
+                    "systemMacAddress": "fc:bd:67:3d:13:c5",
+                    "hwMacAddress": "fc:bd:67:3d:13:c5",
+                    "configMacAddress": "00:00:00:00:00:00",
+                    "version": "4.31.1F-34361447.fraserrel (engineering build)",
+                    "architecture": "x86_64",
+                    "internalVersion": "4.31.1F-34361447.fraserrel",
+                    "internalBuildId": "4940d112-a2fc-4970-8b5a-a16cd03fd08c",
+                    "imageFormatVersion": "3.0",
+                    "imageOptimization": "Default",
+                    "bootupTimestamp": 1700729434.5892005,
+                    "uptime": 20666.78,
+                    "memTotal": 8099732,
+                    "memFree": 4989568,
+                    "isIntlVersion": False,
+                }
+            ]
+        },
         {"is_online": True, "established": False, "hw_model": None},
         id="cannot parse command",
     ),
     pytest.param(
         {},
-        (
-            {"return_value": True},
-            {
-                "side_effect": EapiCommandError(
-                    passed=[],
-                    failed="show version",
-                    errors=["Authorization denied for command 'show version'"],
-                    errmsg="Invalid command",
-                    not_exec=[],
-                )
-            },
-        ),
+        {
+            "side_effect": EapiCommandError(
+                passed=[],
+                failed="show version",
+                errors=["Authorization denied for command 'show version'"],
+                errmsg="Invalid command",
+                not_exec=[],
+            )
+        },
         {"is_online": True, "established": False, "hw_model": None},
         id="asynceapi.EapiCommandError",
     ),
     pytest.param(
         {},
-        ({"return_value": True}, {"side_effect": HTTPError("404")}),
-        {"is_online": True, "established": False, "hw_model": None},
+        {"side_effect": HTTPError("404")},
+        {"is_online": False, "established": False, "hw_model": None},
         id="httpx.HTTPError",
     ),
     pytest.param(
         {},
-        ({"return_value": True}, {"side_effect": ConnectError("Cannot open port")}),
-        {"is_online": True, "established": False, "hw_model": None},
+        {"side_effect": ConnectError("Cannot open port")},
+        {"is_online": False, "established": False, "hw_model": None},
         id="httpx.ConnectError",
     ),
     pytest.param(
         {},
-        (
-            {"return_value": True},
-            {
-                "return_value": [
-                    {
-                        "mfgName": "Arista",
-                        "modelName": "",
-                    }
-                ]
-            },
-        ),
+        {"side_effect": OSError("Too many open files")},
+        {"is_online": False, "established": False, "hw_model": None},
+        id="OSError",
+    ),
+    pytest.param(
+        {},
+        {
+            "return_value": [
+                {
+                    "mfgName": "Arista",
+                    "modelName": "",
+                }
+            ]
+        },
         {"is_online": True, "established": False, "hw_model": ""},
         id="modelName empty string",
     ),
@@ -565,6 +559,100 @@ CACHE_STATS_PARAMS: list[ParameterSet] = [
 ]
 
 
+class TestAntaCache:
+    """Test AntaCache class."""
+
+    async def test_lru(self) -> None:
+        """Test AntaCache LRU eviction."""
+        cache = AntaCache("device", max_size=1)
+        await cache.set("key1", "value1")
+        await cache.set("key2", "value2")
+        await cache.set("key3", "value3")
+
+        assert await cache.get("key1") is None
+        assert await cache.get("key3") == "value3"
+
+    async def test_lru_retained(self) -> None:
+        """Test AntaCache LRU eviction skips retained entries."""
+        cache = AntaCache("device", max_size=1)
+        cache.retain("key1")
+        await cache.set("key1", "value1")
+        await cache.set("key2", "value2")
+        await cache.set("key3", "value3")
+
+        assert await cache.get("key1") == "value1"
+        assert await cache.get("key2") is None
+
+    async def test_ttl_retained(self) -> None:
+        """Test AntaCache TTL expiration skips retained entries."""
+        cache = AntaCache("device", ttl=0)
+        cache.retain("key1")
+        await cache.set("key1", "value1")
+        await cache.set("key2", "value2")
+
+        assert await cache.get("key1") == "value1"
+        assert await cache.get("key2") is None
+
+    async def test_release(self) -> None:
+        """Test AntaCache.release() drops the entry once its last consumer released it."""
+        cache = AntaCache("device")
+        cache.retain("key1", count=2)
+        await cache.set("key1", "value1")
+
+        cache.release("key1")
+        assert "key1" in cache.cache
+        assert cache.refcounts == {"key1": 1}
+
+        cache.release("key1")
+        assert "key1" not in cache.cache
+        assert not cache.refcounts
+
+    async def test_release_not_retained(self) -> None:
+        """Test AntaCache.release() on a key that is not retained."""
+        cache = AntaCache("device")
+        await cache.set("key1", "value1")
+
+        cache.release("key1")
+
+        assert await cache.get("key1") == "value1"
+
+    async def test_store(self, tmp_path: Path) -> None:
+        """Test AntaCache with a persistent store shared by subsequent runs."""
+        store = SQLiteCacheStore(tmp_path / "cache.db")
+        cache = AntaCache("device", store=store)
+        await cache.set("key1", "value1", ttl=3600)
+        await cache.set("key2", None)
+
+        # New cache for a subsequent run
+        cache = AntaCache("device", store=store)
+        assert await cache.get("key1") == "value1"
+        assert await cache.get("key2") is None
+        assert cache.stats == {"hits": 1, "total": 2, "persistent_hits": 1}
+        # The persistent hit has been loaded in memory
+        assert "key1" in cache.cache
+
+    async def test_store_error(self, tmp_path: Path, caplog: pytest.LogCaptureFixture) -> None:
+        """Test AntaCache with a persistent store raising an error."""
+        store = SQLiteCacheStore(tmp_path / "cache.db")
+        store._connection.close()
+        cache = AntaCache("device", store=store)
+
+        await cache.set("key1", "value1")
+        assert await cache.get("key1") == "value1"
+        assert await cache.get("key2") is None
+        assert "Failed to write the persistent cache of device: ProgrammingError: Cannot operate on a closed database." in caplog.messages
+        assert "Failed to read the persistent cache of device: ProgrammingError: Cannot operate on a closed database." in caplog.messages
+
+    def test_clear(self) -> None:
+        """Test AntaCache.clear() resets the reference counts."""
+        cache = AntaCache("device")
+        cache.retain("key1")
+
+        cache.clear()
+
+        assert not cache.refcounts
+
+
 class TestAntaDevice:
     """Test for anta.device.AntaDevice Abstract class."""
 
@@ -611,6 +699,12 @@ class TestAntaDevice:
         """
         assert device.cache_statistics == expected
 
+    def test_cache_statistics_persistent(self, device: AntaDevice, tmp_path: Path) -> None:
+        """Verify that AntaDevice.cache_statistics reports the persistent cache hits."""
+        assert device.cache is not None
+        device.cache.store = SQLiteCacheStore(tmp_path / "cache.db")
+        assert device.cache_statistics == {"total_commands_sent": 0, "cache_hits": 0, "cache_hit_ratio": "0.00%", "persistent_cache_hits": 0}
+
     def test_max_connections(self, device: AntaDevice) -> None:
         """Test max_connections property."""
         assert device.max_connections is None
@@ -652,6 +746,23 @@ class TestAsyncEOSDevice:
             timeout=12.0,
         )
 
+    async def test__init__lazy_client(self) -> None:
+        """Test the AsyncEOSDevice eAPI client and SSH options are created on first use, the eAPI clients sharing the SSL context."""
+        dev = AsyncEOSDevice(host="42.42.42.42", username="anta", password="anta")
+        other = AsyncEOSDevice(host="42.42.42.43", username="anta", password="anta", port=8443)
+
+        assert hash(dev) != hash(other)
+        assert repr(dev).endswith("host='42.42.42.42', eapi_port=443, username='anta', enable=False, insecure=False)")
+        assert dev._eapi_client is None
+        assert dev._ssh_client_opts is None
+        await dev.disconnect()
+        assert dev._eapi_client is None
+
+        assert dev._client is dev._client
+        assert dev._client.port == 443
+        assert other._client.port == 8443
+        assert dev._client._transport._pool._ssl_context is other._client._transport._pool._ssl_context  # type: ignore[attr-defined]
+
     def test__rich_repr_debug_sanitizes_client_details(self, async_device: AsyncEOSDevice) -> None:
         """Test the debug Rich repr does not expose internal client state."""
         with patch("anta.device.__DEBUG__", new=True):
@@ -676,6 +787,38 @@ class TestAsyncEOSDevice:
         else:
             assert dev1 != dev2
 
+    def test_pickle(self) -> None:
+        """Test pickling an AsyncEOSDevice rebuilds it from its parameters."""
+        device = AsyncEOSDevice(
+            host="42.42.42.42",
+            username="anta",
+            password="anta",
+            name="test.anta.ninja",
+            enable_password="enable",
+            port=8443,
+            ssh_port=2222,
+            tags={"leaf"},
+            timeout=10,
+            enable=True,
+            insecure=True,
+            disable_cache=True,
+        )
+        device.established = True
+
+        copy = pickle.loads(pickle.dumps(device))  # noqa: S301
+
+        assert copy == device
+        assert copy.name == "test.anta.ninja"
+        assert copy.tags == {"leaf", "test.anta.ninja"}
+        assert copy.enable
+        assert not copy.established
+        assert copy.cache is None
+        assert copy._ssh_opts.known_hosts is None
+        assert copy._enable_password == "enable"
+        assert copy._eapi_opts == device._eapi_opts
+        assert copy._ssh_opts.port == 2222
+        assert copy._client is not device._client
+
     def test_max_connections(self, async_device: AsyncEOSDevice) -> None:
         """Test max_connections property."""
         # HTTPX uses a max_connections of 100 by default
@@ -683,7 +826,7 @@ class TestAsyncEOSDevice:
 
     def test_max_connections_none(self, async_device: AsyncEOSDevice) -> None:
         """Test max_connections property when not available in the session object."""
-        with patch.object(async_device, "_client", None):
+        with patch.object(async_device, "_eapi_client", object()):
             assert async_device.max_connections is None
 
     @pytest.mark.parametrize(
@@ -691,23 +834,35 @@ class TestAsyncEOSDevice:
         REFRESH_PARAMS,
         indirect=["async_device"],
     )
-    async def test_refresh(self, async_device: AsyncEOSDevice, patch_kwargs: list[dict[str, Any]], expected: dict[str, Any]) -> None:
+    async def test_refresh(self, async_device: AsyncEOSDevice, patch_kwargs: dict[str, Any], expected: dict[str, Any]) -> None:
         """Test AsyncEOSDevice.refresh()."""
-        with patch.object(async_device._client, "check_api_endpoint", **patch_kwargs[0]), patch.object(async_device._client, "cli", **patch_kwargs[1]):
+        with patch.object(async_device._client, "check_api_endpoint") as check_api_endpoint, patch.object(async_device._client, "cli", **patch_kwargs):
             await async_device.refresh()
-            async_device._client.check_api_endpoint.assert_called_once()  # type: ignore[attr-defined] # asynceapi.Device.check_api_endpoint is patched
-            if expected["is_online"]:
-                async_device._client.cli.assert_called_once()  # type: ignore[attr-defined] # asynceapi.Device.cli is patched
+            # The device is refreshed in a single eAPI request
+            check_api_endpoint.assert_not_called()
+            async_device._client.cli.assert_called_once()  # type: ignore[attr-defined] # asynceapi.Device.cli is patched
             assert async_device.is_online == expected["is_online"]
             assert async_device.established == expected["established"]
             assert async_device.hw_model == expected["hw_model"]
+            assert async_device.eos_version == patch_kwargs.get("return_value", [{}])[0].get("version")
+            assert async_device.cache is not None
+            cached_output = await async_device.cache.get(AntaCommand(command="show version", revision=1).uid)
+            assert cached_output == (patch_kwargs["return_value"][0] if expected["established"] else None)
+
+    @pytest.mark.parametrize(("async_device"), [{"disable_cache": True}], indirect=True)
+    async def test_refresh_cache_disabled(self, async_device: AsyncEOSDevice) -> None:
+        """Test AsyncEOSDevice.refresh() when the device cache is disabled."""
+        with patch.object(async_device._client, "cli", return_value=[{"modelName": "DCS-7280CR3-32P4-F"}]):
+            await async_device.refresh()
+        assert async_device.established
+        assert async_device.cache is None
 
     async def test_refresh_timeout_without_message_in_exception(self, async_device: AsyncEOSDevice, caplog: pytest.LogCaptureFixture) -> None:
         """Test when a timeout occurs in AsyncEOSDevice.refresh() without a message in the HTTPX exception."""
         caplog.set_level(logging.WARNING)
 
         # Simulating a low-level asyncio timeout created without additional context
-        with patch.object(async_device._client, "check_api_endpoint", side_effect=ConnectTimeout(message=str(asyncio.TimeoutError()))):
+        with patch.object(async_device._client, "cli", side_effect=ConnectTimeout(message=str(asyncio.TimeoutError()))):
             await async_device.refresh()
 
             assert not async_device.is_online
@@ -718,7 +873,7 @@ class TestAsyncEOSDevice:
         """Test when a timeout occurs in AsyncEOSDevice.refresh() with a message in the HTTPX exception."""
         caplog.set_level(logging.WARNING)
 
-        with patch.object(async_device._client, "check_api_endpoint", side_effect=ConnectTimeout(message="Timeout!")):
+        with patch.object(async_device._client, "cli", side_effect=ConnectTimeout(message="Timeout!")):
             await async_device.refresh()
 
             assert not async_device.is_online
@@ -755,6 +910,33 @@ class TestAsyncEOSDevice:
             assert cmd.output == expected["output"]
             assert cmd.errors == expected["errors"]
 
+    @pytest.mark.parametrize(
+        ("exception", "is_online"),
+        [
+            pytest.param(ConnectError("Cannot open port"), False, id="httpx.ConnectError"),
+            pytest.param(ConnectTimeout("Test"), False, id="httpx.ConnectTimeout"),
+            pytest.param(TimeoutException("Test"), True, id="httpx.TimeoutException"),
+        ],
+    )
+    async def test__collect_unreachable(self, async_device: AsyncEOSDevice, exception: Exception, *, is_online: bool) -> None:
+        """Test AsyncEOSDevice._collect() marks the device as offline when the device cannot be reached anymore."""
+        async_device.is_online = True
+        with patch.object(async_device._client, "cli", side_effect=exception):
+            await async_device.collect(AntaCommand(command="show version"))
+        assert async_device.is_online is is_online
+
+        # The device is marked online again once it responds
+        with patch.object(async_device._client, "cli", return_value=[{"version": "4.31.1F"}]):
+            await async_device.collect(AntaCommand(command="show version"))
+        assert async_device.is_online is True
+
+    @pytest.mark.parametrize(("is_online"), [True, False])
+    async def test__probe(self, async_device: AsyncEOSDevice, *, is_online: bool) -> None:
+        """Test AsyncEOSDevice._probe() marks the device as online when the eAPI HTTP endpoint responds again."""
+        with patch.object(async_device._client, "check_api_endpoint", return_value=is_online):
+            assert await async_device._probe() is is_online
+        assert async_device.is_online is is_online
+
     @pytest.mark.parametrize(
         ("async_device", "copy"),
         ASYNCEAPI_COPY_PARAMS,
@@ -790,12 +972,12 @@ class TestAsyncEOSDevice:
 
     async def test_refresh_recreate(self, async_device: AsyncEOSDevice) -> None:
         """Test that refresh() recreates the httpx client when it has been closed."""
+        assert not async_device._client.is_closed
         await async_device.disconnect()
         assert async_device._client.is_closed
 
         mock_client = MagicMock()
         mock_client.is_closed = False
-        mock_client.check_api_endpoint = AsyncMock(return_value=True)
         mock_client.cli = AsyncMock(return_value=[{"modelName": "DCS-72"}])
 
         with patch.object(async_device, "_create_client", return_value=mock_client) as mock_create:
@@ -808,8 +990,258 @@ class TestAsyncEOSDevice:
 
     async def test__collect_raises_when_client_closed(self, async_device: AsyncEOSDevice) -> None:
         """Test that _collect() raises RuntimeError when the httpx client is closed."""
+        assert not async_device._client.is_closed
         await async_device.disconnect()
         assert async_device._client.is_closed
         cmd = AntaCommand(command="show version")
         with pytest.raises(RuntimeError, match="httpx client is closed"):
             await async_device._collect(cmd)
+
+    @pytest.mark.parametrize("async_device", [{"enable": True}], indirect=True)
+    async def test__collect_batched(self, async_device: AsyncEOSDevice) -> None:
+        """Test that AsyncEOSDevice._collect() coalesces commands into a single eAPI request per output format and version."""
+        async_device._batch_size = 10
+        async_device._batch_window = 0.01
+        json_cmds = [AntaCommand(command="show version"), AntaCommand(command="show ip bgp summary", revision=3)]
+        text_cmd = AntaCommand(command="show running-config", ofmt="text")
+
+        async def cli(commands: list[dict[str, Any]], ofmt: str, **_kwargs: Any) -> list[Any]:  # noqa: ANN401
+            if ofmt == "text":
+                return ["" for _ in commands]
+            return [{"cmd": cmd["cmd"]} for cmd in commands]
+
+        with patch.object(async_device._client, "cli", side_effect=cli) as cli_mock:
+            await asyncio.gather(*(async_device.collect(cmd) for cmd in [*json_cmds, text_cmd]))
+
+        assert cli_mock.call_count == 2
+        json_call = next(call for call in cli_mock.call_args_list if call.kwargs["ofmt"] == "json")
+        assert json_call.kwargs["commands"] == [{"cmd": "enable"}, {"cmd": "show version"}, {"cmd": "show ip bgp summary", "revision": 3}]
+        assert json_cmds[0].output == {"cmd": "show version"}
+        assert json_cmds[1].output == {"cmd": "show ip bgp summary"}
+        assert text_cmd.output == ""
+
+    async def test__collect_batched_max_size(self, async_device: AsyncEOSDevice) -> None:
+        """Test that AsyncEOSDevice._collect() sends a batch as soon as it reaches the maximum batch size."""
+        async_device._batch_size = 2
+        async_device._batch_window = 60
+        cmds = [AntaCommand(command=f"show command {i}") for i in range(4)]
+
+        with patch.object(async_device._client, "cli", side_effect=lambda commands, **_kwargs: [{} for _ in commands]) as cli_mock:
+            await asyncio.wait_for(asyncio.gather(*(async_device.collect(cmd) for cmd in cmds)), timeout=5)
+
+        assert cli_mock.call_count == 2
+        assert all(cmd.collected for cmd in cmds)
+
+    async def test__collect_batched_partial_failure(self, async_device: AsyncEOSDevice) -> None:
+        """Test that the commands following a failed command in a batch are resubmitted."""
+        async_device._batch_size = 10
+        cmds = [AntaCommand(command="show version"), AntaCommand(command="show unknown"), AntaCommand(command="show clock")]
+        side_effect = [
+            EapiCommandError(
+                passed=[{"version": "4.31.1F"}],
+                failed="show unknown",
+                errors=["Invalid input (at token 1: 'unknown')"],
+                errmsg="CLI command 2 of 3 'show unknown' failed: invalid command",
+                not_exec=[{"cmd": "show clock"}],
+            ),
+            [{"utcTime": 1700000000}],
+        ]
+
+        with patch.object(async_device._client, "cli", side_effect=side_effect) as cli_mock:
+            await asyncio.gather(*(async_device.collect(cmd) for cmd in cmds))
+
+        assert cli_mock.call_count == 2
+        assert cli_mock.call_args_list[1].kwargs["commands"] == [{"cmd": "show clock"}]
+        assert cmds[0].output == {"version": "4.31.1F"}
+        assert cmds[1].output is None
+        assert cmds[1].errors == ["Invalid input (at token 1: 'unknown')"]
+        assert cmds[2].output == {"utcTime": 1700000000}
+
+    async def test__collect_batched_transport_error(self, async_device: AsyncEOSDevice) -> None:
+        """Test that a transport error sets the errors of all the commands of a batch."""
+        async_device._batch_size = 10
+        cmds = [AntaCommand(command="show version"), AntaCommand(command="show clock")]
+
+        with patch.object(async_device._client, "cli", side_effect=TimeoutException("Test")) as cli_mock:
+            await asyncio.gather(*(async_device.collect(cmd) for cmd in cmds))
+
+        cli_mock.assert_called_once()
+        assert all(cmd.errors == ["TimeoutException: Test"] for cmd in cmds)
+
+    async def test__send_batch_exception(self, async_device: AsyncEOSDevice) -> None:
+        """Test that an exception raised while sending a batch is raised by the waiting coroutines and not by the task of the batch."""
+        future: asyncio.Future[None] = asyncio.get_running_loop().create_future()
+
+        with patch.object(async_device._client, "cli", side_effect=RuntimeError("Boom")):
+            await async_device._send_batch([(AntaCommand(command="show version"), future)])
+
+        with pytest.raises(RuntimeError, match="Boom"):
+            await future
+
+    @pytest.mark.parametrize("async_device", [{"disable_cache": True}], indirect=True)
+    async def test__collect_circuit_breaker(self, async_device: AsyncEOSDevice) -> None:
+        """Test that the circuit breaker short-circuits the collections after repeated transport failures."""
+        assert async_device.circuit_breaker is not None
+        async_device.circuit_breaker.threshold = 2
+        cmds = [AntaCommand(command="show version") for _ in range(3)]
+
+        with patch.object(async_device._client, "cli", side_effect=ConnectTimeout("Test")) as cli_mock:
+            for cmd in cmds:
+                await async_device.collect(cmd)
+
+        assert cli_mock.call_count == 2
+        assert cmds[1].errors == ["ConnectTimeout: Test"]
+        assert cmds[2].errors == [f"Circuit breaker open for device {async_device.name} after 2 consecutive transport failures"]
+
+        # The device is probed once the cooldown elapsed
+        async_device.circuit_breaker.cooldown = 0
+        cmd = AntaCommand(command="show version")
+        with (
+            patch.object(async_device._client, "check_api_endpoint", return_value=True) as probe_mock,
+            patch.object(async_device._client, "cli", return_value=[{"version": "4.31.1F"}]),
+        ):
+            await async_device.collect(cmd)
+
+        probe_mock.assert_awaited_once()
+        assert cmd.output == {"version": "4.31.1F"}
+        assert async_device.circuit_breaker.state == "closed"
+
+    async def test_collect_coalesced(self, async_device: AsyncEOSDevice) -> None:
+        """Test that concurrent collections of the same command are coalesced."""
+        cmds = [AntaCommand(command="show version") for _ in range(3)]
+
+        async def cli(**_kwargs: object) -> list[dict[str, Any]]:
+            await asyncio.sleep(0.01)
+            return [{"version": "4.31.1F"}]
+
+        with patch.object(async_device._client, "cli", side_effect=cli) as cli_mock:
+            await asyncio.gather(*(async_device.collect(cmd) for cmd in cmds))
+
+        cli_mock.assert_called_once()
+        assert all(cmd.output == {"version": "4.31.1F"} for cmd in cmds)
+        assert not async_device._flights
+
+    @pytest.mark.parametrize("async_device", [{"disable_cache": True}], indirect=True)
+    async def test_collect_coalesced_without_cache(self, async_device: AsyncEOSDevice) -> None:
+        """Test that concurrent collections of the same command are coalesced when caching is disabled on the device."""
+        assert async_device.cache is None
+        cmds = [AntaCommand(command="show version") for _ in range(2)]
+
+        async def cli(**_kwargs: object) -> list[dict[str, Any]]:
+            await asyncio.sleep(0.01)
+            return [{"version": "4.31.1F"}]
+
+        with patch.object(async_device._client, "cli", side_effect=cli) as cli_mock:
+            await asyncio.gather(*(async_device.collect(cmd) for cmd in cmds))
+
+        cli_mock.assert_called_once()
+        assert all(cmd.output == {"version": "4.31.1F"} for cmd in cmds)
+        assert not async_device._flights
+
+    async def test_collect_not_coalesced(self, async_device: AsyncEOSDevice) -> None:
+        """Test that concurrent collections of a command bypassing the cache are not coalesced."""
+        cmds = [AntaCommand(command="show version", use_cache=False) for _ in range(3)]
+
+        async def cli(**_kwargs: object) -> list[dict[str, Any]]:
+            await asyncio.sleep(0.01)
+            return [{"version": "4.31.1F"}]
+
+        with patch.object(async_device._client, "cli", side_effect=cli) as cli_mock:
+            await asyncio.gather(*(async_device.collect(cmd) for cmd in cmds))
+
+        assert cli_mock.call_count == 3
+        assert all(cmd.output == {"version": "4.31.1F"} for cmd in cmds)
+        assert not async_device._flights
+
+    async def test_collect_coalesced_errors(self, async_device: AsyncEOSDevice) -> None:
+        """Test that the errors of a coalesced collection are shared with all the callers."""
+        cmds = [AntaCommand(command="show version") for _ in range(2)]
+
+        async def cli(**_kwargs: object) -> list[dict[str, Any]]:
+            await asyncio.sleep(0.01)
+            msg = "Test"
+            raise ConnectTimeout(msg)
+
+        with patch.object(async_device._client, "cli", side_effect=cli) as cli_mock:
+            await asyncio.gather(*(async_device.collect(cmd) for cmd in cmds))
+
+        cli_mock.assert_called_once()
+        assert cmds[0].errors == cmds[1].errors == ["ConnectTimeout: Test"]
+        assert cmds[0].errors is not cmds[1].errors
+
+    async def test_collect_coalesced_cancelled(self, async_device: AsyncEOSDevice) -> None:
+        """Test that cancelling a caller of a coalesced collection does not cancel the other callers."""
+        leader, follower = AntaCommand(command="show version"), AntaCommand(command="show version")
+
+        async def cli(**_kwargs: object) -> list[dict[str, Any]]:
+            await asyncio.sleep(0.01)
+            return [{"version": "4.31.1F"}]
+
+        with patch.object(async_device._client, "cli", side_effect=cli) as cli_mock:
+            # The follower retries the collection when the leader is cancelled
+            leader_task = asyncio.create_task(async_device.collect(leader))
+            follower_task = asyncio.create_task(async_device.collect(follower))
+            await asyncio.sleep(0)
+            leader_task.cancel()
+            await follower_task
+            assert leader_task.cancelled()
+            assert cli_mock.call_count == 2
+            assert follower.output == {"version": "4.31.1F"}
+
+            # The leader completes the collection when the follower is cancelled
+            assert async_device.cache is not None
+            async_device.cache.clear()
+            leader, follower = AntaCommand(command="show version"), AntaCommand(command="show version")
+            leader_task = asyncio.create_task(async_device.collect(leader))
+            follower_task = asyncio.create_task(async_device.collect(follower))
+            await asyncio.sleep(0)
+            follower_task.cancel()
+            await leader_task
+            assert follower_task.cancelled()
+            assert cli_mock.call_count == 3
+            assert leader.output == {"version": "4.31.1F"}
+
+        assert not async_device._flights
+
+    async def test__collect_readonly_outputs(self, async_device: AsyncEOSDevice) -> None:
+        """Test that the collected and cached outputs are read-only when readonly_outputs is enabled."""
+        async_device.readonly_outputs = True
+        cmds = [AntaCommand(command="show version") for _ in range(2)]
+
+        with patch.object(async_device._client, "cli", return_value=[{"version": "4.31.1F", "details": {"modules": []}}]) as cli_mock:
+            for cmd in cmds:
+                await async_device.collect(cmd)
+
+        cli_mock.assert_called_once()
+        assert isinstance(cmds[0].output, ReadOnlyDict)
+        # The cached output is shared with the cache hit without copy
+        assert cmds[1].output is cmds[0].output
+        with pytest.raises(TypeError, match=r"Command outputs are read-only, 'ReadOnlyList.append' is not supported"):
+            cmds[1].output["details"]["modules"].append("Supervisor")
+
+    @pytest.mark.parametrize(
+        ("side_effect", "expected_window"),
+        [
+            pytest.param(None, 100, id="success"),
+            pytest.param(ReadTimeout("Test"), 50, id="read-timeout"),
+            pytest.param(PoolTimeout("Test"), 100, id="pool-timeout"),
+            pytest.param(
+                HTTPStatusError("Test", request=Request("POST", "https://42.42.42.42"), response=Response(503)),
+                50,
+                id="http-5xx",
+            ),
+            pytest.param(
+                HTTPStatusError("Test", request=Request("POST", "https://42.42.42.42"), response=Response(401)),
+                100,
+                id="http-4xx",
+            ),
+        ],
+    )
+    async def test__collect_concurrency_window(self, async_device: AsyncEOSDevice, side_effect: Exception | None, expected_window: int) -> None:
+        """Test that timeouts and HTTP 5xx errors decrease the concurrency window of the device."""
+        cmd = AntaCommand(command="show version")
+
+        with patch.object(async_device._client, "cli", side_effect=side_effect, return_value=[{}]):
+            await async_device.collect(cmd)
+
+        assert async_device.concurrency_window == expected_window
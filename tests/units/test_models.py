@@ -8,14 +8,19 @@
 from __future__ import annotations
 
 import asyncio
+import json
 import sys
 from typing import TYPE_CHECKING, Any, ClassVar
+from unittest.mock import patch
 
 import pytest
+from pydantic import BaseModel
 
+from anta._readonly import ReadOnlyDict, freeze
 from anta.decorators import deprecated_test, skip_on_platforms
-from anta.models import AntaCommand, AntaTemplate, AntaTest
+from anta.models import AntaCommand, AntaTemplate, AntaTest, RuntimeCommand
 from anta.result_manager.models import AntaTestStatus
+from anta.settings import AntaDeviceSettings, AntaTestsSettings
 from tests.units.conftest import DEVICE_HW_MODEL
 
 if TYPE_CHECKING:
@@ -118,6 +123,59 @@ class FakeTestWithTemplate(AntaTest):
         self.result.is_success(self.instance_commands[0].command)
 
 
+class FakeTestWithTemplateFallback(AntaTest):
+    """ANTA test with template that has a full-table fallback."""
+
+    categories: ClassVar[list[str]] = []
+    commands: ClassVar[list[AntaCommand | AntaTemplate]] = [
+        AntaTemplate(template="show interfaces {interface}", fallback=AntaCommand(command="show interfaces")),
+    ]
+
+    class Input(AntaTest.Input):
+        """Inputs for FakeTestWithTemplateFallback test."""
+
+        interfaces: list[str]
+
+    def render(self, template: AntaTemplate) -> list[AntaCommand]:
+        """Render function."""
+        return [template.render(interface=interface) for interface in self.inputs.interfaces]
+
+    @AntaTest.anta_test
+    def test(self) -> None:
+        """Test function."""
+        self.result.is_success(", ".join(command.command for command in self.instance_commands))
+
+
+class FakeTestWithTemplateAggregate(AntaTest):
+    """ANTA test with template that has an aggregate command."""
+
+    categories: ClassVar[list[str]] = []
+    commands: ClassVar[list[AntaCommand | AntaTemplate]] = [
+        AntaTemplate(template="show interfaces {interface}", aggregate=AntaCommand(command="show interfaces")),
+    ]
+
+    class Input(AntaTest.Input):
+        """Inputs for FakeTestWithTemplateAggregate test."""
+
+        interfaces: list[str]
+
+    def render(self, template: AntaTemplate) -> list[AntaCommand]:
+        """Render function."""
+        return [template.render(interface=interface) for interface in self.inputs.interfaces]
+
+    def map_aggregate(self, command: RuntimeCommand, output: dict[str, Any] | str) -> dict[str, Any] | str:
+        """Map function."""
+        assert isinstance(output, dict)
+        return {"interfaces": {command.params.interface: output["interfaces"][command.params.interface]}}
+
+    @AntaTest.anta_test
+    def test(self) -> None:
+        """Test function."""
+        self.result.is_success()
+        for command in self.instance_commands:
+            self.result.messages.append(f"{command.command}: {command.json_output}")
+
+
 class FakeTestWithTemplateNoRender(AntaTest):
     """ANTA test with template that miss the render() method."""
 
@@ -335,7 +393,10 @@ ANTATEST_DATA: dict[tuple[type[AntaTest], str], Any] = {
         "expected": {
             "__init__": {
                 "result": "error",
-                "messages": ["Cannot render template {template='show interface {interface}' version='latest' revision=None ofmt='json' use_cache=True}"],
+                "messages": [
+                    "Cannot render template {template='show interface {interface}' version='latest' revision=None ofmt='json' use_cache=True cache_ttl=None "
+                    "fallback=None aggregate=None}"
+                ],
             },
             "test": {"result": "error"},
         },
@@ -456,6 +517,31 @@ class TestAntaTest:
         assert _TestOverwriteNameAndDescription.name == "CustomName"
         assert _TestOverwriteNameAndDescription.description == "Custom description"
 
+    def test__init_subclass__render_per_device(self) -> None:
+        """Test __init_subclass__ sets render_per_device when render() reads the device."""
+
+        class _RenderPerDevice(FakeTestWithTemplate):
+            """ANTA test whose render() reads the device in a comprehension."""
+
+            def render(self, template: AntaTemplate) -> list[AntaCommand]:
+                return [template.render(interface=f"{interface}-{self.device.name}") for interface in (self.inputs.interface,)]
+
+        class _InheritedRenderPerDevice(_RenderPerDevice):
+            """ANTA test inheriting a render() reading the device."""
+
+        class _RenderOnce(_RenderPerDevice):
+            """ANTA test overriding a render() reading the device with a render() only reading the inputs."""
+
+            def render(self, template: AntaTemplate) -> list[AntaCommand]:
+                return [template.render(interface=self.inputs.interface)]
+
+        assert not AntaTest.render_per_device
+        assert not FakeTestWithTemplate.render_per_device
+        assert not FakeTest.render_per_device
+        assert _RenderPerDevice.render_per_device
+        assert _InheritedRenderPerDevice.render_per_device
+        assert not _RenderOnce.render_per_device
+
     def test_abc(self) -> None:
         """Test that an error is raised if AntaTest is not implemented."""
         with pytest.raises(TypeError) as exec_info:
@@ -540,10 +626,103 @@ class TestAntaTest:
         if custom_field:
             assert test.result.custom_field == "a custom field"
 
+    def test__init__commands(self, device: AntaDevice) -> None:
+        """Test AntaTest instantiation with already rendered commands."""
+        prototype = FakeTestWithTemplate(device, inputs={"interface": "Ethernet1"})
+
+        with patch.object(FakeTestWithTemplate, "render") as render_mock:
+            test = FakeTestWithTemplate(device, inputs={"interface": "Ethernet1"}, commands=[command.definition for command in prototype.instance_commands])
+
+        render_mock.assert_not_called()
+        assert [command.definition for command in test.instance_commands] == [command.definition for command in prototype.instance_commands]
+        assert test.instance_commands[0] is not prototype.instance_commands[0]
+        asyncio.run(test.test())
+        assert test.result.result == AntaTestStatus.SUCCESS
+        assert test.result.messages == ["show interface Ethernet1"]
+
+    @pytest.mark.parametrize(
+        ("threshold", "expected_commands"),
+        [
+            pytest.param(0, ["show interfaces"], id="disabled"),
+            pytest.param(1, ["show interfaces"], id="above-threshold"),
+            pytest.param(2, ["show interfaces Ethernet1", "show interfaces Ethernet2"], id="at-threshold"),
+        ],
+    )
+    def test__init__fallback(self, device: AntaDevice, threshold: int, expected_commands: list[str]) -> None:
+        """Test AntaTest instantiation with a template fallback and the narrowing threshold."""
+        with patch("anta.models.get_tests_settings", return_value=AntaTestsSettings(narrowing_threshold=threshold)):
+            test = FakeTestWithTemplateFallback(device, inputs={"interfaces": ["Ethernet1", "Ethernet2"]})
+
+        assert [command.command for command in test.instance_commands] == expected_commands
+
+    @pytest.mark.parametrize(
+        ("threshold", "expected_collected"),
+        [
+            pytest.param(0, ["show interfaces Ethernet1", "show interfaces Ethernet2"], id="disabled"),
+            pytest.param(1, ["show interfaces"], id="above-threshold"),
+            pytest.param(2, ["show interfaces Ethernet1", "show interfaces Ethernet2"], id="at-threshold"),
+        ],
+    )
+    def test_collect_aggregate(self, device: AntaDevice, threshold: int, expected_collected: list[str]) -> None:
+        """Test AntaTest collection of the aggregate command of a template and the mapping of its output."""
+        interfaces = {"Ethernet1": {"mtu": 1500}, "Ethernet2": {"mtu": 9214}}
+        collected: list[str] = []
+
+        async def _collect(command: AntaCommand, *, collection_id: str | None = None) -> None:  # noqa: ARG001
+            collected.append(command.command)
+            command.output = {"interfaces": interfaces if command.command == "show interfaces" else {command.command.split()[-1]: {}}}
+
+        with patch("anta.models.get_tests_settings", return_value=AntaTestsSettings(aggregation_threshold=threshold)):
+            test = FakeTestWithTemplateAggregate(device, inputs={"interfaces": ["Ethernet1", "Ethernet2"]})
+        with patch.object(device, "_collect", side_effect=_collect):
+            asyncio.run(test.test())
+
+        assert sorted(collected) == expected_collected
+        assert [command.command for command in test.instance_commands] == ["show interfaces Ethernet1", "show interfaces Ethernet2"]
+        assert test.result.result == AntaTestStatus.SUCCESS
+        if threshold == 1:
+            assert test.result.messages == [
+                "show interfaces Ethernet1: {'interfaces': {'Ethernet1': {'mtu': 1500}}}",
+                "show interfaces Ethernet2: {'interfaces': {'Ethernet2': {'mtu': 9214}}}",
+            ]
+
+    def test_collect_aggregate_error(self, device: AntaDevice) -> None:
+        """Test AntaTest reports the error of an aggregate command once."""
+
+        async def _collect(command: AntaCommand, *, collection_id: str | None = None) -> None:  # noqa: ARG001
+            command.errors = ["Invalid input (at token 1: 'interfaces')"]
+
+        with patch("anta.models.get_tests_settings", return_value=AntaTestsSettings(aggregation_threshold=1)):
+            test = FakeTestWithTemplateAggregate(device, inputs={"interfaces": ["Ethernet1", "Ethernet2"]})
+        with patch.object(device, "_collect", side_effect=_collect):
+            asyncio.run(test.test())
+
+        assert test.result.result == AntaTestStatus.ERROR
+        assert test.result.messages == ["show interfaces has failed: Invalid input (at token 1: 'interfaces')"]
+
+    def test_save_commands_data_readonly(self, device: AntaDevice) -> None:
+        """Test AntaTest instantiation with eos_data when the readonly_outputs device setting is enabled."""
+        with patch("anta.models.get_device_settings", return_value=AntaDeviceSettings(readonly_outputs=True)):
+            test = FakeTestWithTemplate(device, inputs={"interface": "Ethernet1"}, eos_data=[{"interfaces": {"Ethernet1": {}}}])
+
+        assert isinstance(test.instance_commands[0].json_output, ReadOnlyDict)
+        with pytest.raises(TypeError, match=r"Command outputs are read-only, 'ReadOnlyDict.pop' is not supported"):
+            test.instance_commands[0].json_output["interfaces"].pop("Ethernet1")
+
 
 class TestAntaCommand:
     """Test for anta.models.AntaCommand."""
 
+    def test_uid(self) -> None:
+        """Test the AntaCommand unique identifier."""
+        command = AntaCommand(command="show version")
+        uid = command.uid
+
+        assert command.model_copy().uid == uid
+        assert AntaCommand(command="show version", ofmt="text").uid != uid
+        command.command = "show clock"
+        assert command.uid == AntaCommand(command="show clock").uid
+
     # ruff: noqa: B018
 
     def test_empty_output_access(self) -> None:
@@ -629,3 +808,86 @@ class TestAntaCommand:
             RuntimeError, match=r"Command 'show ip interface Ethernet1' has not been collected and has not returned an error. Call AntaDevice.collect()."
         ):
             command.returned_known_eos_error
+
+
+class TestRuntimeCommand:
+    """Test for anta.models.RuntimeCommand."""
+
+    def test_antacommand_interface(self) -> None:
+        """Test RuntimeCommand exposes the AntaCommand interface."""
+        definition = AntaTemplate(template="show interfaces {interface}", revision=1).render(interface="Ethernet1")
+        command = RuntimeCommand(definition)
+        command.output = {"interfaces": {}}
+
+        for attribute in ("command", "version", "revision", "ofmt", "template", "params", "use_cache", "cache_ttl", "uid"):
+            assert getattr(command, attribute) == getattr(definition, attribute)
+        assert command.json_output == {"interfaces": {}}
+        assert command.collected
+
+        dump = command.model_dump(exclude={"template"})
+        assert dump == definition.model_copy(update={"output": {"interfaces": {}}}).model_dump(exclude={"template"})
+        assert json.loads(command.model_dump_json(include={"command", "output"})) == {"command": "show interfaces Ethernet1", "output": {"interfaces": {}}}
+        assert isinstance(command.to_command(), AntaCommand)
+        assert command.to_command().output == {"interfaces": {}}
+        assert definition.output is None
+
+    def test_pydantic_validation(self) -> None:
+        """Test a RuntimeCommand is validated as an AntaCommand by the pydantic models with AntaCommand fields."""
+
+        class _Model(BaseModel):
+            command: AntaCommand
+            commands: list[AntaCommand]
+
+        definition = AntaTemplate(template="show interfaces {interface}", revision=1).render(interface="Ethernet1")
+        command = RuntimeCommand(definition)
+        command.output = {"interfaces": {}}
+        command.errors = ["error"]
+
+        model = _Model(command=command, commands=[command])
+
+        assert isinstance(model.command, AntaCommand)
+        assert model.command.command == "show interfaces Ethernet1"
+        assert model.command.params == definition.params
+        assert model.command.output == {"interfaces": {}}
+        assert model.command.errors == ["error"]
+        assert model.commands == [model.command]
+        assert AntaCommand.model_validate(command) == model.command
+        assert definition.output is None
+
+    def test_model_copy(self) -> None:
+        """Test RuntimeCommand.model_copy()."""
+        definition = AntaCommand(command="show version")
+        command = RuntimeCommand(definition)
+        command.output = {"version": {"major": 4}}
+        command.errors = ["error"]
+
+        copy = command.model_copy()
+        assert copy.definition is definition
+        assert copy.output is command.output
+        assert copy.errors == command.errors
+        assert copy.errors is not command.errors
+
+        copy = command.model_copy(update={"output": None, "errors": [], "revision": 2}, deep=True)
+        assert copy.output is None
+        assert copy.errors == []
+        assert copy.revision == 2
+        assert copy.uid == AntaCommand(command="show version", revision=2).uid
+        assert definition.revision is None
+
+        copy = command.model_copy(deep=True)
+        assert copy.output == command.output
+        assert copy.output is not command.output
+
+    def test_json_output(self) -> None:
+        """Test RuntimeCommand.json_output returns a shallow copy of the shared outputs which are not read-only."""
+        definition = AntaCommand(command="show version")
+        output = {"version": {"major": 4}}
+        command, other = RuntimeCommand(definition), RuntimeCommand(definition)
+        command.output = other.output = output
+
+        command.json_output.pop("version")
+        assert other.json_output == {"version": {"major": 4}}
+        assert command.json_output["version"] is output["version"]
+
+        command.output = frozen = freeze(output)
+        assert command.json_output is frozen
@@ -8,13 +8,48 @@ from __future__ import annotations
 import logging
 import os
 import sys
+from typing import TYPE_CHECKING
 from unittest.mock import patch
 
 import pytest
 from pydantic import ValidationError
 
 from anta.device import AsyncEOSDevice
-from anta.settings import DEFAULT_HTTPX_TRUST_ENV, DEFAULT_MAX_CONCURRENCY, DEFAULT_NOFILE, AntaHttpxSettings, AntaRunnerSettings, get_httpx_settings
+from anta.settings import (
+    DEFAULT_CACHE_TTL,
+    DEFAULT_DEVICE_BATCH_SIZE,
+    DEFAULT_DEVICE_BATCH_WINDOW,
+    DEFAULT_DEVICE_CIRCUIT_BREAKER_COOLDOWN,
+    DEFAULT_DEVICE_CIRCUIT_BREAKER_THRESHOLD,
+    DEFAULT_DEVICE_MAX_CONCURRENCY,
+    DEFAULT_DEVICE_MIN_CONCURRENCY,
+    DEFAULT_DISCOVERY_CACHE_NEGATIVE_TTL,
+    DEFAULT_DISCOVERY_CACHE_TTL,
+    DEFAULT_DISCOVERY_MAX_CONCURRENCY,
+    DEFAULT_DISCOVERY_TIMEOUT,
+    DEFAULT_FACTS_TTL,
+    DEFAULT_HTTPX_TRUST_ENV,
+    DEFAULT_MAX_CONCURRENCY,
+    DEFAULT_NOFILE,
+    DEFAULT_TESTS_AGGREGATION_THRESHOLD,
+    DEFAULT_TESTS_NARROWING_THRESHOLD,
+    AntaCacheSettings,
+    AntaDeviceSettings,
+    AntaDiscoverySettings,
+    AntaFactsSettings,
+    AntaHttpxSettings,
+    AntaRunnerSettings,
+    AntaTestsSettings,
+    get_cache_settings,
+    get_device_settings,
+    get_discovery_settings,
+    get_facts_settings,
+    get_httpx_settings,
+    get_tests_settings,
+)
+
+if TYPE_CHECKING:
+    from pathlib import Path
 
 if os.name == "posix":
     # The function is not defined on non-POSIX system
@@ -158,3 +193,192 @@ class TestAntaHttpxSettings:
         with pytest.raises(ValueError, match=r"Failed to load ANTA HTTPX settings\. Check ANTA_HTTPX_\* environment variables:"):
             get_httpx_settings()
         get_httpx_settings.cache_clear()
+
+
+class TestAntaDeviceSettings:
+    """Tests for the AntaDeviceSettings class."""
+
+    def test_defaults(self, setenvvar: pytest.MonkeyPatch) -> None:
+        """Test that AntaDeviceSettings uses default values when no environment variables are set."""
+        device_settings = AntaDeviceSettings()
+        assert device_settings.batch_size == DEFAULT_DEVICE_BATCH_SIZE
+        assert device_settings.batch_window == DEFAULT_DEVICE_BATCH_WINDOW
+        assert device_settings.max_concurrency == DEFAULT_DEVICE_MAX_CONCURRENCY
+        assert device_settings.min_concurrency == DEFAULT_DEVICE_MIN_CONCURRENCY
+        assert device_settings.latency_threshold is None
+        assert device_settings.circuit_breaker_threshold == DEFAULT_DEVICE_CIRCUIT_BREAKER_THRESHOLD
+        assert device_settings.circuit_breaker_cooldown == DEFAULT_DEVICE_CIRCUIT_BREAKER_COOLDOWN
+        assert device_settings.readonly_outputs is False
+
+    def test_env_var(self, setenvvar: pytest.MonkeyPatch) -> None:
+        """Test that the ANTA_DEVICE_* environment variables override the default values."""
+        setenvvar.setenv("ANTA_DEVICE_BATCH_SIZE", "50")
+        setenvvar.setenv("ANTA_DEVICE_BATCH_WINDOW", "0.5")
+        setenvvar.setenv("ANTA_DEVICE_MAX_CONCURRENCY", "20")
+        setenvvar.setenv("ANTA_DEVICE_MIN_CONCURRENCY", "2")
+        setenvvar.setenv("ANTA_DEVICE_LATENCY_THRESHOLD", "1.5")
+        setenvvar.setenv("ANTA_DEVICE_READONLY_OUTPUTS", "true")
+        device_settings = AntaDeviceSettings()
+        assert device_settings.batch_size == 50
+        assert device_settings.batch_window == 0.5
+        assert device_settings.max_concurrency == 20
+        assert device_settings.min_concurrency == 2
+        assert device_settings.latency_threshold == 1.5
+        assert device_settings.readonly_outputs is True
+
+    def test_env_var_attached_to_device(self, setenvvar: pytest.MonkeyPatch) -> None:
+        """Test that the batching settings are used by AsyncEOSDevice."""
+        get_device_settings.cache_clear()
+        setenvvar.setenv("ANTA_DEVICE_BATCH_SIZE", "50")
+        setenvvar.setenv("ANTA_DEVICE_MAX_CONCURRENCY", "20")
+        setenvvar.setenv("ANTA_DEVICE_CIRCUIT_BREAKER_THRESHOLD", "0")
+        setenvvar.setenv("ANTA_DEVICE_READONLY_OUTPUTS", "true")
+        device = AsyncEOSDevice(host="test", username="test", password="test", port=80)
+        assert device._batch_size == 50
+        assert device.concurrency_window == 20
+        assert device.circuit_breaker is None
+        assert device.readonly_outputs is True
+        get_device_settings.cache_clear()
+
+    def test_concurrency_validation_error(self, setenvvar: pytest.MonkeyPatch) -> None:
+        """Test that AntaDeviceSettings raises ValidationError when the minimum concurrency exceeds the maximum."""
+        setenvvar.setenv("ANTA_DEVICE_MAX_CONCURRENCY", "10")
+        setenvvar.setenv("ANTA_DEVICE_MIN_CONCURRENCY", "20")
+        with pytest.raises(ValidationError, match=r"min_concurrency \(20\) must be lower than or equal to max_concurrency \(10\)"):
+            AntaDeviceSettings()
+
+    def test_validation_error(self, setenvvar: pytest.MonkeyPatch) -> None:
+        """Test that get_device_settings raises ValueError when an env var is invalid."""
+        get_device_settings.cache_clear()
+        setenvvar.setenv("ANTA_DEVICE_BATCH_SIZE", "0")
+        with pytest.raises(ValueError, match=r"Failed to load ANTA device settings\. Check ANTA_DEVICE_\* environment variables:"):
+            get_device_settings()
+        get_device_settings.cache_clear()
+
+
+class TestAntaCacheSettings:
+    """Tests for the AntaCacheSettings class."""
+
+    def test_defaults(self, setenvvar: pytest.MonkeyPatch) -> None:
+        """Test that AntaCacheSettings uses default values when no environment variables are set."""
+        cache_settings = AntaCacheSettings()
+        assert cache_settings.path is None
+        assert cache_settings.ttl == DEFAULT_CACHE_TTL
+
+    def test_env_var(self, setenvvar: pytest.MonkeyPatch, tmp_path: Path) -> None:
+        """Test that the ANTA_CACHE_* environment variables override the default values."""
+        setenvvar.setenv("ANTA_CACHE_PATH", str(tmp_path / "cache.db"))
+        setenvvar.setenv("ANTA_CACHE_TTL", "3600")
+        cache_settings = AntaCacheSettings()
+        assert cache_settings.path == tmp_path / "cache.db"
+        assert cache_settings.ttl == 3600
+
+    def test_env_var_attached_to_device(self, setenvvar: pytest.MonkeyPatch, tmp_path: Path) -> None:
+        """Test that the cache settings are used by AntaDevice."""
+        get_cache_settings.cache_clear()
+        setenvvar.setenv("ANTA_CACHE_PATH", str(tmp_path / "cache.db"))
+        setenvvar.setenv("ANTA_CACHE_TTL", "3600")
+        device = AsyncEOSDevice(host="test", username="test", password="test", port=80)
+        assert device.cache is not None
+        assert device.cache.store is not None
+        assert device.cache.store.path == tmp_path / "cache.db"
+        assert device.cache.ttl == 3600
+        get_cache_settings.cache_clear()
+
+    def test_validation_error(self, setenvvar: pytest.MonkeyPatch) -> None:
+        """Test that get_cache_settings raises ValueError when an env var is invalid."""
+        get_cache_settings.cache_clear()
+        setenvvar.setenv("ANTA_CACHE_TTL", "0")
+        with pytest.raises(ValueError, match=r"Failed to load ANTA cache settings\. Check ANTA_CACHE_\* environment variables:"):
+            get_cache_settings()
+        get_cache_settings.cache_clear()
+
+
+class TestAntaDiscoverySettings:
+    """Tests for the AntaDiscoverySettings class."""
+
+    def test_defaults(self, setenvvar: pytest.MonkeyPatch) -> None:
+        """Test that AntaDiscoverySettings uses default values when no environment variables are set."""
+        discovery_settings = AntaDiscoverySettings()
+        assert discovery_settings.enabled is True
+        assert discovery_settings.timeout == DEFAULT_DISCOVERY_TIMEOUT
+        assert discovery_settings.max_concurrency == DEFAULT_DISCOVERY_MAX_CONCURRENCY
+        assert discovery_settings.cache_path is None
+        assert discovery_settings.cache_ttl == DEFAULT_DISCOVERY_CACHE_TTL
+        assert discovery_settings.cache_negative_ttl == DEFAULT_DISCOVERY_CACHE_NEGATIVE_TTL
+
+    def test_env_var(self, setenvvar: pytest.MonkeyPatch, tmp_path: Path) -> None:
+        """Test that the ANTA_DISCOVERY_* environment variables override the default values."""
+        setenvvar.setenv("ANTA_DISCOVERY_ENABLED", "false")
+        setenvvar.setenv("ANTA_DISCOVERY_TIMEOUT", "0.5")
+        setenvvar.setenv("ANTA_DISCOVERY_MAX_CONCURRENCY", "2000")
+        setenvvar.setenv("ANTA_DISCOVERY_CACHE_PATH", str(tmp_path / "discovery.json"))
+        setenvvar.setenv("ANTA_DISCOVERY_CACHE_TTL", "60")
+        setenvvar.setenv("ANTA_DISCOVERY_CACHE_NEGATIVE_TTL", "10")
+        discovery_settings = AntaDiscoverySettings()
+        assert discovery_settings.enabled is False
+        assert discovery_settings.timeout == 0.5
+        assert discovery_settings.max_concurrency == 2000
+        assert discovery_settings.cache_path == tmp_path / "discovery.json"
+        assert discovery_settings.cache_ttl == 60
+        assert discovery_settings.cache_negative_ttl == 10
+
+    def test_validation_error(self, setenvvar: pytest.MonkeyPatch) -> None:
+        """Test that get_discovery_settings raises ValueError when an env var is invalid."""
+        get_discovery_settings.cache_clear()
+        setenvvar.setenv("ANTA_DISCOVERY_TIMEOUT", "0")
+        with pytest.raises(ValueError, match=r"Failed to load ANTA discovery settings\. Check ANTA_DISCOVERY_\* environment variables:"):
+            get_discovery_settings()
+        get_discovery_settings.cache_clear()
+
+
+class TestAntaFactsSettings:
+    """Tests for the AntaFactsSettings class."""
+
+    def test_defaults(self, setenvvar: pytest.MonkeyPatch) -> None:
+        """Test that AntaFactsSettings uses default values when no environment variables are set."""
+        facts_settings = AntaFactsSettings()
+        assert facts_settings.path is None
+        assert facts_settings.ttl == DEFAULT_FACTS_TTL
+
+    def test_env_var(self, setenvvar: pytest.MonkeyPatch, tmp_path: Path) -> None:
+        """Test that the ANTA_FACTS_* environment variables override the default values."""
+        setenvvar.setenv("ANTA_FACTS_PATH", str(tmp_path / "facts.json"))
+        setenvvar.setenv("ANTA_FACTS_TTL", "86400")
+        facts_settings = AntaFactsSettings()
+        assert facts_settings.path == tmp_path / "facts.json"
+        assert facts_settings.ttl == 86400
+
+    def test_validation_error(self, setenvvar: pytest.MonkeyPatch) -> None:
+        """Test that get_facts_settings raises ValueError when an env var is invalid."""
+        get_facts_settings.cache_clear()
+        setenvvar.setenv("ANTA_FACTS_TTL", "0")
+        with pytest.raises(ValueError, match=r"Failed to load ANTA device facts settings\. Check ANTA_FACTS_\* environment variables:"):
+            get_facts_settings()
+        get_facts_settings.cache_clear()
+
+
+class TestAntaTestsSettings:
+    """Tests for the AntaTestsSettings class."""
+
+    def test_defaults(self, setenvvar: pytest.MonkeyPatch) -> None:
+        """Test that AntaTestsSettings uses default values when no environment variables are set."""
+        tests_settings = AntaTestsSettings()
+        assert tests_settings.narrowing_threshold == DEFAULT_TESTS_NARROWING_THRESHOLD
+        assert tests_settings.aggregation_threshold == DEFAULT_TESTS_AGGREGATION_THRESHOLD
+
+    def test_env_var(self, setenvvar: pytest.MonkeyPatch) -> None:
+        """Test that the ANTA_TESTS_* environment variables override the default values."""
+        setenvvar.setenv("ANTA_TESTS_NARROWING_THRESHOLD", "10")
+        setenvvar.setenv("ANTA_TESTS_AGGREGATION_THRESHOLD", "50")
+        tests_settings = AntaTestsSettings()
+        assert tests_settings.narrowing_threshold == 10
+        assert tests_settings.aggregation_threshold == 50
+
+    def test_validation_error(self, setenvvar: pytest.MonkeyPatch) -> None:
+        """Test that get_tests_settings raises ValueError when an env var is invalid."""
+        get_tests_settings.cache_clear()
+        setenvvar.setenv("ANTA_TESTS_NARROWING_THRESHOLD", "-1")
+        with pytest.raises(ValueError, match=r"Failed to load ANTA tests settings\. Check ANTA_TESTS_\* environment variables:"):
+            get_tests_settings()
+        get_tests_settings.cache_clear()
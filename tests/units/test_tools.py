@@ -5,15 +5,22 @@
 
 from __future__ import annotations
 
+import gc
+import weakref
 from contextlib import AbstractContextManager
 from contextlib import nullcontext as does_not_raise
 from datetime import datetime, timedelta, timezone
+from ipaddress import IPv4Address, IPv4Network, IPv6Address
 from typing import TYPE_CHECKING, Any
 from unittest.mock import AsyncMock, patch
 
 import pytest
 
+from anta.models import AntaCommand, RuntimeCommand
 from anta.tools import (
+    OutputIndex,
+    OutputIndexes,
+    RouteIndex,
     convert_categories,
     cprofile,
     custom_division,
@@ -319,7 +326,9 @@ def test_get_failed_logs(
         ),
     ],
 )
+@pytest.mark.parametrize("indexed", [pytest.param(False, id="function"), pytest.param(True, id="OutputIndex")])
 def test_get_dict_superset(
+    indexed: bool,
     list_of_dicts: list[dict[Any, Any]],
     input_dict: dict[Any, Any],
     default: str | None,
@@ -329,9 +338,12 @@ def test_get_dict_superset(
     expected_result: str,
     expected_raise: AbstractContextManager[Exception],
 ) -> None:
-    """Test get_dict_superset."""
+    """Test get_dict_superset and OutputIndex.get_dict_superset."""
     with expected_raise:
-        assert get_dict_superset(list_of_dicts, input_dict, default, var_name, custom_error_msg, required=required) == expected_result
+        if indexed:
+            assert OutputIndex(list_of_dicts).get_dict_superset(input_dict, default, var_name, custom_error_msg, required=required) == expected_result
+        else:
+            assert get_dict_superset(list_of_dicts, input_dict, default, var_name, custom_error_msg, required=required) == expected_result
 
 
 @pytest.mark.parametrize(
@@ -499,9 +511,81 @@ def test_get_item(
     expected_result: str,
     expected_raise: AbstractContextManager[Exception],
 ) -> None:
-    """Test get_item."""
+    """Test get_item and OutputIndex.get_item."""
     with expected_raise:
         assert get_item(list_of_dicts, key, value, default, var_name, custom_error_msg, required=required, case_sensitive=case_sensitive) == expected_result
+    with expected_raise:
+        index = OutputIndex(list_of_dicts)
+        assert index.get_item(key, value, default, var_name, custom_error_msg, required=required, case_sensitive=case_sensitive) == expected_result
+
+
+def test_output_index_of() -> None:
+    """Test OutputIndex.of shares the index of a list between the commands holding the same output."""
+    peers = [{"peerAddress": "10.0.0.1", "state": "Established"}, {"peerAddress": "10.0.0.2", "state": "Idle"}]
+    output = {"peers": peers}
+    command = RuntimeCommand(AntaCommand(command="show bgp summary"))
+    other = RuntimeCommand(AntaCommand(command="show bgp summary"))
+    command.output = other.output = output
+
+    index = OutputIndex.of(command, peers)
+    assert OutputIndex.of(other, peers) is index
+    assert index.get_item("peerAddress", "10.0.0.2") is peers[1]
+    # A new list with the same content gets its own index
+    assert OutputIndex.of(command, list(peers)) is not index
+    # Empty lists are not stored
+    assert OutputIndex.of(command, []) is not OutputIndex.of(command, [])
+    # A new output gets new indexes
+    command.output = {"peers": peers}
+    assert OutputIndex.of(command, peers) is not index
+
+
+def test_output_indexes_lifetime() -> None:
+    """Test the OutputIndexes of an output are released with the last command holding the output."""
+    output = {"peers": [{"peerAddress": "10.0.0.1"}]}
+    command = RuntimeCommand(AntaCommand(command="show bgp summary"))
+    command.output = output
+    indexes = weakref.ref(command.indexes)
+    assert OutputIndexes.of(output) is indexes()
+
+    del command
+    gc.collect()
+    assert indexes() is None
+
+
+TEST_ROUTE_INDEX_ROUTES = {
+    "0.0.0.0/0": {"routeType": "eBGP"},
+    "10.0.0.0/8": {"routeType": "static"},
+    "10.1.0.0/16": {"routeType": "iBGP"},
+    "10.1.2.0/24": {"routeType": "connected"},
+    "10.1.2.1/32": {"routeType": "connected"},
+    "invalid": {"routeType": "static"},
+    "2001:db8::/32": {"routeType": "static"},
+}
+
+
+def test_route_index() -> None:
+    """Test RouteIndex exact lookups and sharing."""
+    index = RouteIndex(TEST_ROUTE_INDEX_ROUTES)
+    assert index.get(IPv4Network("10.1.0.0/16")) == {"routeType": "iBGP"}
+    assert index.get("10.1.0.0/24") is None
+    assert index.get("10.1.0.0/24", {}) == {}
+    assert index.is_network_address(IPv4Address("10.1.0.0"))
+    assert not index.is_network_address(IPv4Address("10.1.0.1"))
+    assert index.is_network_address(IPv4Address("10.1.2.1"))
+    # Invalid and IPv6 prefixes are not indexed
+    assert len(index.network_addresses) == 5
+    assert not RouteIndex({}).is_network_address(IPv4Address("10.1.0.0"))
+
+    # Only IPv4 lookups are supported
+    with pytest.raises(TypeError, match="RouteIndex only supports IPv4 lookups"):
+        index.is_network_address(IPv6Address("2001:db8::"))  # type: ignore[arg-type]
+
+    routes = {f"10.0.{i}.0/24": {"routeType": "connected"} for i in range(100)}
+    command = RuntimeCommand(AntaCommand(command="show ip route", output={"vrfs": {"default": {"routes": routes}}}))
+    assert RouteIndex.of(command, routes) is RouteIndex.of(command, routes)
+    assert RouteIndex.of(command, dict(routes)) is not RouteIndex.of(command, routes)
+    # Small routing tables are not stored
+    assert RouteIndex.of(command, TEST_ROUTE_INDEX_ROUTES) is not RouteIndex.of(command, TEST_ROUTE_INDEX_ROUTES)
 
 
 @pytest.mark.parametrize(